@@ -1,4 +1,4 @@
-from .core import create_graph, dependencies, define_graph, GraphError, resolver
+from .core import create_graph, dependencies, define_graph, GraphError, provider, resolver
 from .representations import Object
 from .resolvers import constant_object_resolver, create_object_builder, root_object_resolver
 from .schema import (
@@ -24,6 +24,7 @@ __all__ = [
     "dependencies",
     "define_graph",
     "GraphError",
+    "provider",
     "resolver",
 
     "constant_object_resolver",
@@ -0,0 +1,59 @@
+from . import schema
+
+
+PUBLIC = "PUBLIC"
+PRIVATE = "PRIVATE"
+
+
+class CachePolicy(object):
+    def __init__(self, *, max_age, scope):
+        self.max_age = max_age
+        self.scope = scope
+
+    def __repr__(self):
+        return "CachePolicy(max_age={!r}, scope={!r})".format(self.max_age, self.scope)
+
+
+def compute_policy(query, *, default_max_age=0):
+    max_ages = []
+    scopes = set()
+    visited = set()
+
+    def visit(query, is_root):
+        # Shared subqueries contribute the same hints wherever they appear.
+        if (id(query), is_root) in visited:
+            return
+        visited.add((id(query), is_root))
+
+        if isinstance(query, schema.ObjectQuery):
+            for field_query in query.field_queries:
+                field = field_query.field
+
+                # Leaf fields without hints inherit the max age of their
+                # parent, so only root and composite fields use the default.
+                if field.cache_max_age is not None:
+                    max_ages.append(field.cache_max_age)
+                elif is_root or _is_composite_type(field.type):
+                    max_ages.append(default_max_age)
+
+                if field.cache_scope is not None:
+                    scopes.add(field.cache_scope)
+
+                visit(field_query.type_query, is_root=False)
+
+        elif isinstance(query, (schema.ListQuery, schema.NullableQuery)):
+            visit(query.element_query, is_root=is_root)
+
+    visit(query, is_root=True)
+
+    return CachePolicy(
+        max_age=min(max_ages, default=default_max_age),
+        scope=PRIVATE if PRIVATE in scopes else PUBLIC,
+    )
+
+
+def _is_composite_type(graph_type):
+    while isinstance(graph_type, (schema.ListType, schema.NullableType)):
+        graph_type = graph_type.element_type
+
+    return isinstance(graph_type, (schema.InterfaceType, schema.ObjectType))
@@ -0,0 +1,102 @@
+import collections
+import threading
+
+
+def create_cache(*, max_size, eviction="lru"):
+    cache_type = _cache_types.get(eviction)
+    if cache_type is None:
+        raise ValueError("unknown eviction policy: {!r}".format(eviction))
+    else:
+        return cache_type(max_size=max_size)
+
+
+class CacheStats(object):
+    def __init__(self, *, hits, misses, evictions, size, max_size):
+        self.hits = hits
+        self.misses = misses
+        self.evictions = evictions
+        self.size = size
+        self.max_size = max_size
+
+    def __repr__(self):
+        return "CacheStats(hits={!r}, misses={!r}, evictions={!r}, size={!r}, max_size={!r})".format(
+            self.hits,
+            self.misses,
+            self.evictions,
+            self.size,
+            self.max_size,
+        )
+
+
+class _BoundedCache(object):
+    def __init__(self, *, max_size):
+        if max_size < 0:
+            raise ValueError("max_size must be non-negative, was {}".format(max_size))
+
+        self._max_size = max_size
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            value = self._entries.get(key, _missing)
+            if value is _missing:
+                self._misses += 1
+                return default
+            else:
+                self._hits += 1
+                self._on_hit(key)
+                return value
+
+    def set(self, key, value):
+        if self._max_size == 0:
+            return
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+                max_size=self._max_size,
+            )
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _on_hit(self, key):
+        pass
+
+
+class LruCache(_BoundedCache):
+    def _on_hit(self, key):
+        self._entries.move_to_end(key)
+
+
+class FifoCache(_BoundedCache):
+    pass
+
+
+_cache_types = {
+    "fifo": FifoCache,
+    "lru": LruCache,
+}
+
+
+_missing = object()
@@ -1,3 +1,6 @@
+import inspect
+import threading
+
 from . import iterables
 
 
@@ -5,25 +8,45 @@ def create_graph(resolvers):
     return define_graph(resolvers).create_graph({})
 
 
-def define_graph(resolvers):
-    return GraphDefinition(resolvers)
+def define_graph(resolvers, dependencies=None, *, memoize=False):
+    return GraphDefinition(resolvers, dependencies=dependencies, memoize=memoize)
 
 
 class GraphDefinition(object):
-    def __init__(self, resolvers):
+    def __init__(self, resolvers, dependencies=None, *, memoize=False):
         self._resolvers = iterables.to_dict(
             (resolver.type, resolver)
             for resolver in _flatten(resolvers)
         )
+        self._memoized_types = frozenset(
+            resolver_type
+            for resolver_type, resolver in self._resolvers.items()
+            if _should_memoize(resolver, default=memoize)
+        )
+        if dependencies is None:
+            self._injector = None
+        else:
+            self._injector = Injector(dependencies)
 
     def create_graph(self, dependencies):
-        return Graph(self._resolvers, dependencies)
+        return Graph(
+            self._resolvers,
+            Injector(dependencies, parent=self._injector),
+            memoized_types=self._memoized_types,
+        )
+
+    def close(self):
+        if self._injector is not None:
+            self._injector.close()
 
 
 class Graph(object):
-    def __init__(self, resolvers, dependencies):
+    def __init__(self, resolvers, injector, *, memoized_types=frozenset()):
         self._resolvers = resolvers
-        self._injector = Injector(dependencies)
+        self._injector = injector
+        self._memoized_types = memoized_types
+        self._resolutions = {}
+        self._resolutions_saved = 0
 
     def resolve(self, *args, type=None):
         if type is None:
@@ -31,26 +54,158 @@ class Graph(object):
         resolver = self._resolvers.get(type)
         if resolver is None:
             raise GraphError("could not find resolver for query of type: {}".format(type))
+        elif type in self._memoized_types:
+            return self._resolve_memoized(resolver, type, args)
         else:
             return self._injector.call_with_dependencies(resolver, self, *args)
 
+    def _resolve_memoized(self, resolver, type, args):
+        try:
+            resolution_key = (type, args)
+            result = self._resolutions.get(resolution_key, _missing)
+        except TypeError:
+            return self._injector.call_with_dependencies(resolver, self, *args)
+
+        if result is _missing:
+            result = self._injector.call_with_dependencies(resolver, self, *args)
+            # Awaitables can only be awaited once, so they can't be shared.
+            if not inspect.isawaitable(result):
+                self._resolutions[resolution_key] = result
+        else:
+            self._resolutions_saved += 1
+
+        return result
+
+    @property
+    def resolutions_saved(self):
+        return self._resolutions_saved
+
+    def resolve_sync(self, *args, type=None):
+        result = self.resolve(*args, type=type)
+        if inspect.isawaitable(result):
+            if inspect.iscoroutine(result):
+                result.close()
+            raise GraphError("resolver returned an awaitable: use asynchronous execution to resolve asynchronous resolvers")
+        return result
+
+    async def resolve_async(self, *args, type=None):
+        result = self.resolve(*args, type=type)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    def close(self):
+        self._injector.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def provider(factory, *, close=None):
+    return Provider(factory, close=close)
+
+
+class Provider(object):
+    def __init__(self, factory, *, close):
+        self.factory = factory
+        self.close = close
+
+    def __repr__(self):
+        return "provider({!r})".format(self.factory)
+
 
 class Injector(object):
-    def __init__(self, dependencies):
-        self._dependencies = dependencies.copy()
-        self._dependencies[Injector] = self
+    def __init__(self, dependencies, parent=None):
+        self._dependencies = dependencies
+        self._parent = parent
+        self._provided_values = {}
+        self._provided = []
+        self._closed = False
+        self._lock = threading.RLock()
 
     def get(self, key):
-        return self._dependencies[key]
+        if key is Injector:
+            return self
+
+        value = self._dependencies.get(key, _missing)
+        if value is _missing:
+            if self._parent is None:
+                raise KeyError(key)
+            else:
+                return self._parent.get(key)
+        elif type(value) is Provider:
+            return self._provide(key, value)
+        else:
+            return value
+
+    def _provide(self, key, provider):
+        value = self._provided_values.get(key, _missing)
+        if value is not _missing:
+            return value
+
+        with self._lock:
+            if self._closed:
+                raise GraphError("cannot provide dependency {!r}: injector is closed".format(key))
+
+            value = self._provided_values.get(key, _missing)
+            if value is _missing:
+                value = self.call_with_dependencies(provider.factory)
+                self._provided_values[key] = value
+                self._provided.append((provider, value))
+
+            return value
 
     def call_with_dependencies(self, func, *args, **kwargs):
-        dependencies = getattr(func, "dependencies", dict())
-        dependency_kwargs = iterables.to_dict(
-            (arg_name, self.get(dependency_key))
-            for arg_name, dependency_key in dependencies.items()
-        )
+        bindings = getattr(func, "dependency_bindings", None)
+        if bindings is None:
+            dependencies = getattr(func, "dependencies", None)
+            if dependencies is None:
+                return func(*args, **kwargs)
+            bindings = _compile_dependency_bindings(dependencies)
+
+        dependencies = self._dependencies
+        dependency_kwargs = {}
+        for arg_name, dependency_key in bindings:
+            value = dependencies.get(dependency_key, _missing)
+            if value is _missing or type(value) is Provider:
+                value = self.get(dependency_key)
+            dependency_kwargs[arg_name] = value
+
         return func(*args, **kwargs, **dependency_kwargs)
 
+    def close(self):
+        with self._lock:
+            self._closed = True
+            provided = self._provided
+            self._provided = []
+            self._provided_values.clear()
+
+        errors = []
+        for provider, value in reversed(provided):
+            if provider.close is not None:
+                try:
+                    provider.close(value)
+                except Exception as error:
+                    errors.append(error)
+
+        if errors:
+            raise errors[0]
+
+
+def _should_memoize(resolver, *, default):
+    memoize = getattr(resolver, "memoize", None)
+    if memoize is None:
+        return default
+    else:
+        return memoize
+
+
+def _compile_dependency_bindings(dependencies):
+    return tuple(dependencies.items())
+
 
 def _flatten(value):
     if isinstance(value, (list, tuple)):
@@ -63,9 +218,11 @@ def _flatten(value):
         return [value]
 
 
-def resolver(type):
+def resolver(type, *, memoize=None):
     def register_resolver(func):
         func.type = type
+        if memoize is not None:
+            func.memoize = memoize
         return func
 
     return register_resolver
@@ -74,6 +231,7 @@ def resolver(type):
 def dependencies(**kwargs):
     def register_dependency(func):
         func.dependencies = kwargs
+        func.dependency_bindings = _compile_dependency_bindings(kwargs)
         return func
 
     return register_dependency
@@ -81,3 +239,6 @@ def dependencies(**kwargs):
 
 class GraphError(Exception):
     pass
+
+
+_missing = object()
@@ -0,0 +1,124 @@
+from . import GraphError, schema
+
+
+class QueryCost(object):
+    def __init__(self, *, depth, alias_count, cost):
+        self.depth = depth
+        self.alias_count = alias_count
+        self.cost = cost
+
+    def __repr__(self):
+        return "QueryCost(depth={!r}, alias_count={!r}, cost={!r})".format(
+            self.depth,
+            self.alias_count,
+            self.cost,
+        )
+
+
+def analyze(query, *, default_list_multiplier=1):
+    return _Analyzer(default_list_multiplier=default_list_multiplier).analyze(query)
+
+
+class _Analyzer(object):
+    def __init__(self, default_list_multiplier):
+        self._default_list_multiplier = default_list_multiplier
+        self._costs = {}
+
+    def analyze(self, query):
+        # Queries may share subqueries, such as fragments spread more than
+        # once, so each subquery is only analyzed once.
+        query_cost = self._costs.get(id(query))
+        if query_cost is None:
+            query_cost = self._costs[id(query)] = self._analyze(query)
+        return query_cost
+
+    def _analyze(self, query):
+        if isinstance(query, schema.ObjectQuery):
+            depth = 0
+            alias_count = len(query.field_queries) - len(frozenset(
+                field_query.field
+                for field_query in query.field_queries
+            ))
+            cost = 0
+
+            for field_query in query.field_queries:
+                type_query_cost = self.analyze(field_query.type_query)
+                depth = max(depth, type_query_cost.depth)
+                alias_count += type_query_cost.alias_count
+                cost += 1 + self._multiplier(field_query) * type_query_cost.cost
+
+            return QueryCost(depth=depth + 1, alias_count=alias_count, cost=cost)
+
+        elif isinstance(query, (schema.ListQuery, schema.NullableQuery)):
+            return self.analyze(query.element_query)
+
+        else:
+            return QueryCost(depth=0, alias_count=0, cost=0)
+
+    def _multiplier(self, field_query):
+        cost_multiplier = field_query.field.cost_multiplier
+
+        if cost_multiplier is None:
+            if isinstance(_to_non_null_type(field_query.field.type), schema.ListType):
+                return self._default_list_multiplier
+            else:
+                return 1
+        elif callable(cost_multiplier):
+            return cost_multiplier(field_query.args)
+        else:
+            return cost_multiplier
+
+
+def _to_non_null_type(graph_type):
+    while isinstance(graph_type, schema.NullableType):
+        graph_type = graph_type.element_type
+
+    return graph_type
+
+
+class CostLimits(object):
+    def __init__(self, *, max_depth=None, max_alias_count=None, max_cost=None, default_list_multiplier=1):
+        self.max_depth = max_depth
+        self.max_alias_count = max_alias_count
+        self.max_cost = max_cost
+        self.default_list_multiplier = default_list_multiplier
+
+    def check_depth(self, query):
+        if self.max_depth is not None:
+            _check_limit("depth", _depth(query, {}), self.max_depth)
+
+    def check(self, query):
+        query_cost = analyze(query, default_list_multiplier=self.default_list_multiplier)
+
+        _check_limit("depth", query_cost.depth, self.max_depth)
+        _check_limit("alias count", query_cost.alias_count, self.max_alias_count)
+        _check_limit("cost", query_cost.cost, self.max_cost)
+
+        return query_cost
+
+
+def _depth(query, depths):
+    depth = depths.get(id(query))
+
+    if depth is None:
+        if isinstance(query, schema.ObjectQuery):
+            depth = 1 + max(
+                (
+                    _depth(field_query.type_query, depths)
+                    for field_query in query.field_queries
+                ),
+                default=0,
+            )
+        elif isinstance(query, (schema.ListQuery, schema.NullableQuery)):
+            depth = _depth(query.element_query, depths)
+        else:
+            depth = 0
+
+        depths[id(query)] = depth
+
+    return depth
+
+
+def _check_limit(name, value, limit):
+    if limit is not None and value > limit:
+        raise GraphError("query {} of {} exceeds limit of {}".format(name, value, limit))
@@ -1,69 +1,405 @@
+from concurrent.futures import ThreadPoolExecutor
+import json
+import threading
+
 from graphql import GraphQLError
-from graphql.execution import execute as graphql_execute, ExecutionResult
+from graphql.execution import ExecutionResult
+from graphql.language import ast as graphql_ast
 
-from .. import GraphError
-from . import parser
+from .. import cache_control, caches, GraphError
+from . import incremental, parser, persisted, streaming, validation
 from .schema import create_graphql_schema
 
 
 def execute(document_text, *, graph, query_type, mutation_type=None, types=None, variables=None):
-    return executor(
+    return _memoized_executor(
         query_type=query_type,
         mutation_type=mutation_type,
         types=types,
     )(document_text, graph=graph, variables=variables)
 
 
-def executor(*, query_type, mutation_type=None, types=None):
-    graphql_schema = create_graphql_schema(query_type=query_type, mutation_type=mutation_type, types=types)
+async def execute_async(document_text, *, graph, query_type, mutation_type=None, types=None, variables=None):
+    return await _memoized_executor(
+        query_type=query_type,
+        mutation_type=mutation_type,
+        types=types,
+    ).execute_async(document_text, graph=graph, variables=variables)
+
+
+_executors = caches.LruCache(max_size=32)
+
+
+def _memoized_executor(*, query_type, mutation_type, types):
+    if types is not None:
+        types = tuple(types)
+
+    key = (query_type, mutation_type, types)
+    execute = _executors.get(key)
+    if execute is None:
+        execute = executor(query_type=query_type, mutation_type=mutation_type, types=types)
+        _executors.set(key, execute)
+
+    return execute
+
+
+def executor(
+    *,
+    query_type,
+    mutation_type=None,
+    types=None,
+    document_cache_size=256,
+    document_cache_eviction="lru",
+    document_store=None,
+    cost_limits=None,
+    max_tokens=None,
+    validation_policy=None,
+    validation_cache_size=4096,
+    persisted_document_cache_size=1024,
+    schema_snapshot=None,
+    response_cache=None,
+    expose_cache_control=False,
+    default_max_age=0,
+    fast_parser=False,
+):
+    if validation_policy is None:
+        validation_policy = validation.ValidationPolicy()
+
+    graphql_schema = create_graphql_schema(
+        query_type=query_type,
+        mutation_type=mutation_type,
+        types=types,
+        snapshot=schema_snapshot,
+    )
+    document_cache = caches.create_cache(max_size=document_cache_size, eviction=document_cache_eviction)
+    validation_cache = caches.LruCache(max_size=validation_cache_size)
+    # Trusted documents are added by the application, so they're kept for
+    # the lifetime of the executor. Documents registered by clients are
+    # only kept while they're in use.
+    trusted_documents = {}
+    persisted_documents = caches.LruCache(max_size=persisted_document_cache_size)
+
+    def parse_document(document_text, *, trusted):
+        def validate(document_ast):
+            key = (document_text, trusted)
+            errors = validation_cache.get(key)
+            if errors is None:
+                errors = tuple(validation_policy.validate(graphql_schema.graphql_schema, document_ast, trusted=trusted))
+                validation_cache.set(key, errors)
+
+            return errors
+
+        return parser.read_document(
+            document_text,
+            graphql_schema=graphql_schema,
+            max_tokens=max_tokens,
+            validate=validate,
+            fast_parser=fast_parser,
+        )
+
+    def read_document(document_text):
+        document = document_cache.get(document_text)
+        if document is None:
+            document = parse_document(document_text, trusted=False)
+            document_cache.set(document_text, document)
+
+        return document
+
+    def prepare_persisted_document(document_text, *, trusted):
+        document = parse_document(document_text, trusted=trusted)
+        document.precompile()
+        return document
+
+    def register_document(document_text, *, trusted=False):
+        if document_store is None:
+            raise GraphQLError("PersistedQueryNotSupported")
+
+        document_hash = persisted.document_hash(document_text)
+        load_persisted_document(document_hash, document_text, trusted=trusted)
+        document_store.set(document_hash, document_text, trusted=trusted)
+
+        return document_hash
+
+    def load_persisted_document(document_hash, document_text, *, trusted):
+        document = trusted_documents.get(document_hash)
+        if document is not None:
+            return document
+
+        if trusted:
+            document = trusted_documents[document_hash] = prepare_persisted_document(document_text, trusted=True)
+            return document
+
+        document = persisted_documents.get(document_hash)
+        if document is None:
+            document = prepare_persisted_document(document_text, trusted=False)
+            persisted_documents.set(document_hash, document)
+
+        return document
+
+    def read_persisted_document(document_hash, document_text):
+        if document_store is None:
+            raise GraphQLError("PersistedQueryNotSupported")
+
+        document = trusted_documents.get(document_hash)
+        if document is None:
+            document = persisted_documents.get(document_hash)
+        if document is not None:
+            return document
+
+        if document_text is None:
+            document_text = document_store.get(document_hash)
+            if document_text is None:
+                raise GraphQLError("PersistedQueryNotFound")
+            return load_persisted_document(document_hash, document_text, trusted=False)
+        elif persisted.document_hash(document_text) != document_hash:
+            raise GraphQLError("provided sha does not match query")
+        else:
+            document = load_persisted_document(document_hash, document_text, trusted=False)
+            document_store.set(document_hash, document_text)
+            return document
+
+    if document_store is not None:
+        for document_hash, document_text in document_store.trusted_items():
+            trusted_documents[document_hash] = prepare_persisted_document(document_text, trusted=True)
+
+    def read_document_by_text_or_hash(document_text, document_hash):
+        if document_hash is None:
+            return read_document(document_text)
+        else:
+            return read_persisted_document(document_hash, document_text)
+
+    def document_fingerprint(document_text=None, *, document_hash=None):
+        return read_document_by_text_or_hash(document_text, document_hash).fingerprint()
+
+    def document_operation(document_text=None, *, document_hash=None):
+        return read_document_by_text_or_hash(document_text, document_hash).operation.operation
+
+    def read_query(document_text, document_hash, variables, incremental=False):
+        document = read_document_by_text_or_hash(document_text, document_hash)
+        query = document.to_query(
+            variables,
+            incremental=incremental,
+            check_plan=None if cost_limits is None else cost_limits.check_depth,
+        )
+
+        if cost_limits is not None:
+            if query.graph_query is not None:
+                cost_limits.check(query.graph_query)
+
+            for deferred_query in query.deferred_queries:
+                if deferred_query.graph_query is not None:
+                    cost_limits.check(deferred_query.graph_query)
+
+        return document, query
+
+    def read_cache_policy(document, query):
+        if response_cache is None and not expose_cache_control:
+            return None
+        elif document.operation.operation != graphql_ast.OperationType.QUERY:
+            return cache_control.CachePolicy(max_age=0, scope=cache_control.PRIVATE)
+        elif query.graph_query is None:
+            return cache_control.CachePolicy(max_age=default_max_age, scope=cache_control.PUBLIC)
+        else:
+            return cache_control.compute_policy(query.graph_query, default_max_age=default_max_age)
+
+    def response_cache_key(document, variables, cache_policy, cache_scope):
+        if response_cache is None or cache_policy.max_age <= 0:
+            return None
+
+        if cache_policy.scope == cache_control.PRIVATE:
+            if cache_scope is None:
+                return None
+        else:
+            cache_scope = None
 
-    def execute(document_text, *, graph, variables=None):
         try:
-            query = parser.document_text_to_query(
-                document_text=document_text,
+            canonical_variables = json.dumps(variables or {}, sort_keys=True, separators=(",", ":"))
+        except TypeError:
+            return None
+
+        return (document.fingerprint(), canonical_variables, cache_scope)
+
+    def to_execution_result(document, query, result, cache_policy):
+        execution_result = _to_execution_result(document, query, result)
+
+        if cache_policy is not None and expose_cache_control:
+            execution_result.extensions = {
+                "cacheControl": {"maxAge": cache_policy.max_age, "scope": cache_policy.scope},
+            }
+
+        return execution_result
+
+    def execute(document_text=None, *, graph, variables=None, document_hash=None, cache_scope=None):
+        try:
+            document, query = read_query(document_text, document_hash=document_hash, variables=variables)
+            cache_policy = read_cache_policy(document, query)
+            cache_key = response_cache_key(document, variables, cache_policy, cache_scope)
+
+            result = None if cache_key is None else response_cache.get(cache_key)
+            if result is None:
+                if query.graph_query is None:
+                    result = {}
+                else:
+                    result = graph.resolve_sync(query.graph_query)
+
+                if cache_key is not None:
+                    response_cache.set(cache_key, result, max_age=cache_policy.max_age)
+
+            return to_execution_result(document, query, result, cache_policy)
+        except (GraphQLError, GraphError) as error:
+            return _to_error_result(error)
+
+    async def execute_async(document_text=None, *, graph, variables=None, document_hash=None, cache_scope=None):
+        try:
+            document, query = read_query(document_text, document_hash=document_hash, variables=variables)
+            cache_policy = read_cache_policy(document, query)
+            cache_key = response_cache_key(document, variables, cache_policy, cache_scope)
+
+            result = None if cache_key is None else response_cache.get(cache_key)
+            if result is None:
+                if query.graph_query is None:
+                    result = {}
+                else:
+                    result = await graph.resolve_async(query.graph_query)
+
+                if cache_key is not None:
+                    response_cache.set(cache_key, result, max_age=cache_policy.max_age)
+
+            return to_execution_result(document, query, result, cache_policy)
+        except (GraphQLError, GraphError) as error:
+            return _to_error_result(error)
+
+    def execute_incremental(document_text=None, *, graph, variables=None, document_hash=None):
+        try:
+            document, query = read_query(
+                document_text,
+                document_hash=document_hash,
                 variables=variables,
-                graphql_schema=graphql_schema,
+                incremental=True,
             )
 
             if query.graph_query is None:
                 result = {}
             else:
-                result = graph.resolve(query.graph_query)
-
-            if query.graphql_schema_document is not None:
-                schema_result = _execute_graphql_schema(
-                    graphql_schema_document=query.graphql_schema_document,
-                    graphql_schema=graphql_schema.graphql_schema,
-                    variables=query.variables,
-                )
-                result = result.copy()
-                result.update(schema_result)
-
-            return ExecutionResult(
-                data=result,
-                errors=None,
-            )
+                result = graph.resolve_sync(query.graph_query)
+
+            execution_result = _to_execution_result(document, query, result)
         except (GraphQLError, GraphError) as error:
-            if isinstance(error, GraphError):
-                error = GraphQLError(str(error))
+            return iter((_to_error_result(error).formatted, ))
 
-            return ExecutionResult(
-                data=None,
-                errors=[error],
-            )
+        if query.deferred_queries:
+            return incremental.iter_payloads(graph, query.deferred_queries, execution_result.data)
+        else:
+            return iter((execution_result.formatted, ))
+
+    def execute_batch(operations, *, graph=None, create_graph=None, max_workers=None):
+        if (graph is None) == (create_graph is None):
+            raise ValueError("exactly one of graph and create_graph must be passed")
+
+        operations = tuple(operations)
+
+        if max_workers is None or not all(is_query_document(document_text) for document_text, _ in operations):
+            if graph is None:
+                with create_graph() as graph:
+                    return [
+                        execute(document_text, graph=graph, variables=variables)
+                        for document_text, variables in operations
+                    ]
+            else:
+                return [
+                    execute(document_text, graph=graph, variables=variables)
+                    for document_text, variables in operations
+                ]
+
+        if create_graph is None:
+            # Dependencies such as database sessions are generally not
+            # thread-safe, so a graph can't be shared between workers.
+            raise ValueError("max_workers requires create_graph so that each worker has its own graph")
+
+        worker_graphs = threading.local()
+        created_graphs = []
+        created_graphs_lock = threading.Lock()
+
+        def execute_operation(operation):
+            document_text, variables = operation
+
+            worker_graph = getattr(worker_graphs, "graph", None)
+            if worker_graph is None:
+                worker_graph = worker_graphs.graph = create_graph()
+                with created_graphs_lock:
+                    created_graphs.append(worker_graph)
+
+            return execute(document_text, graph=worker_graph, variables=variables)
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                return list(pool.map(execute_operation, operations))
+        finally:
+            for worker_graph in created_graphs:
+                worker_graph.close()
+
+    def is_query_document(document_text):
+        try:
+            document = read_document(document_text)
+        except (GraphQLError, GraphError):
+            return True
+
+        return document.operation.operation == graphql_ast.OperationType.QUERY
+
+    def stream(document_text=None, *, graph, variables=None, document_hash=None, chunk_size=8192):
+        # The graph is resolved before the first chunk is produced. Only
+        # lists that resolvers produce lazily are resolved while streaming.
+        try:
+            document, query = read_query(document_text, document_hash=document_hash, variables=variables)
+
+            if query.graph_query is None:
+                result = {}
+            else:
+                result = graph.resolve_sync(query.graph_query)
+
+            schema_result = document.read_schema_result(query.variables)
+        except (GraphQLError, GraphError) as error:
+            return streaming.iter_errors_chunks(_to_error_result(error).errors, chunk_size=chunk_size)
+
+        return streaming.iter_data_chunks(query.graph_query, result, schema_result, chunk_size=chunk_size)
+
+    def stream_to(fileobj, document_text=None, *, graph, variables=None, document_hash=None, chunk_size=8192):
+        for chunk in stream(document_text, graph=graph, variables=variables, document_hash=document_hash, chunk_size=chunk_size):
+            fileobj.write(chunk)
+
+    execute.document_cache = document_cache
+    execute.persisted_document_cache = persisted_documents
+    execute.validation_cache = validation_cache
+    execute.register_document = register_document
+    execute.document_fingerprint = document_fingerprint
+    execute.document_operation = document_operation
+    execute.execute_async = execute_async
+    execute.execute_batch = execute_batch
+    execute.execute_incremental = execute_incremental
+    execute.stream = stream
+    execute.stream_to = stream_to
 
     return execute
 
 
-def _execute_graphql_schema(graphql_schema_document, graphql_schema, variables):
-    # TODO: handle errors
-    result = graphql_execute(
-        graphql_schema,
-        graphql_schema_document,
-        # TODO: variables
-        variable_values=variables,
+def _to_execution_result(document, query, result):
+    schema_result = document.read_schema_result(query.variables)
+    if schema_result is not None:
+        result = result.copy()
+        result.update(schema_result)
+
+    return ExecutionResult(
+        data=result,
+        errors=None,
+    )
+
+
+def _to_error_result(error):
+    if isinstance(error, GraphError):
+        error = GraphQLError(str(error))
+
+    return ExecutionResult(
+        data=None,
+        errors=[error],
     )
-    if result.errors:
-        raise result.errors[0]
-    else:
-        return result.data
+
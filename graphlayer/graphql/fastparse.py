@@ -0,0 +1,401 @@
+import re
+
+from graphql.language import ast as graphql_ast, parser as graphql_parser, source as graphql_source
+
+
+def parse(document_text, max_tokens=None):
+    try:
+        return _parse(document_text, max_tokens=max_tokens)
+    except _Unsupported:
+        # graphql-core handles everything else, including reporting syntax
+        # errors with their locations.
+        return graphql_parser.parse(document_text, max_tokens=max_tokens)
+
+
+class _Unsupported(Exception):
+    pass
+
+
+_token_pattern = re.compile(r"""
+    (?P<ignored>[ \t\n\r,\ufeff]+|\#[^\n\r]*)
+    | (?P<punctuator>\.\.\.|[!$&():=@\[\]{}|])
+    | (?P<name>[_A-Za-z][_0-9A-Za-z]*)
+    | (?P<float>-?(?:0|[1-9][0-9]*)(?:\.[0-9]+(?:[eE][+-]?[0-9]+)?|[eE][+-]?[0-9]+))
+    | (?P<int>-?(?:0|[1-9][0-9]*))
+    | (?P<string>"(?:[^"\\\x00-\x08\x0a-\x1f]|\\["\\/bfnrt]|\\u[0-9A-Fa-f]{4})*")
+    | (?P<unsupported>.)
+""", re.VERBOSE | re.DOTALL)
+
+
+_number_terminator_pattern = re.compile(r"[._A-Za-z0-9]")
+
+_escape_pattern = re.compile(r"\\(?:u([0-9A-Fa-f]{4})|(.))")
+
+_escaped_characters = {
+    '"': '"',
+    "\\": "\\",
+    "/": "/",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+}
+
+
+def _tokenize(document_text):
+    if '"""' in document_text:
+        raise _Unsupported()
+
+    tokens = []
+
+    for match in _token_pattern.finditer(document_text):
+        kind = match.lastgroup
+        if kind == "ignored":
+            continue
+        elif kind == "unsupported":
+            raise _Unsupported()
+        elif kind in ("int", "float"):
+            if _number_terminator_pattern.match(document_text, match.end()):
+                raise _Unsupported()
+            tokens.append((kind, match.group(), match.start(), match.end()))
+        elif kind == "punctuator":
+            tokens.append((match.group(), None, match.start(), match.end()))
+        else:
+            tokens.append((kind, match.group(), match.start(), match.end()))
+
+    tokens.append(("<EOF>", None, len(document_text), len(document_text)))
+    return tokens
+
+
+def _unescape(match):
+    code_point = match.group(1)
+    if code_point is None:
+        return _escaped_characters[match.group(2)]
+
+    code_point = int(code_point, 16)
+    if 0xD800 <= code_point <= 0xDFFF:
+        raise _Unsupported()
+
+    return chr(code_point)
+
+
+def _parse(document_text, max_tokens):
+    tokens = _tokenize(document_text)
+
+    if max_tokens is not None and len(tokens) >= max_tokens:
+        raise _Unsupported()
+
+    return _Parser(tokens, graphql_source.Source(document_text)).parse_document()
+
+
+class _Parser(object):
+    def __init__(self, tokens, source):
+        self._tokens = tokens
+        self._source = source
+        self._position = 0
+
+    def parse_document(self):
+        definitions = [self._parse_definition()]
+        while self._peek() != "<EOF>":
+            definitions.append(self._parse_definition())
+
+        self._position += 1
+        document = self._node(graphql_ast.DocumentNode, 0, definitions=tuple(definitions))
+        # As in graphql-core, the document spans the whole source, including
+        # any leading ignored characters.
+        document.loc.start = 0
+        return document
+
+    def _parse_definition(self):
+        start = self._position
+        kind, value, _, _ = self._tokens[start]
+
+        if kind == "{":
+            return self._node(
+                graphql_ast.OperationDefinitionNode,
+                start,
+                operation=graphql_ast.OperationType.QUERY,
+                name=None,
+                variable_definitions=(),
+                directives=(),
+                selection_set=self._parse_selection_set(),
+            )
+
+        elif kind == "name" and value in _operation_types:
+            self._position += 1
+            name = self._parse_name() if self._peek() == "name" else None
+            return self._node(
+                graphql_ast.OperationDefinitionNode,
+                start,
+                operation=_operation_types[value],
+                name=name,
+                variable_definitions=self._parse_variable_definitions(),
+                directives=self._parse_directives(is_const=False),
+                selection_set=self._parse_selection_set(),
+            )
+
+        elif kind == "name" and value == "fragment":
+            self._position += 1
+            return self._node(
+                graphql_ast.FragmentDefinitionNode,
+                start,
+                name=self._parse_fragment_name(),
+                type_condition=self._parse_type_condition(),
+                directives=self._parse_directives(is_const=False),
+                selection_set=self._parse_selection_set(),
+            )
+
+        else:
+            raise _Unsupported()
+
+    def _parse_variable_definitions(self):
+        if self._peek() != "(":
+            return ()
+
+        self._position += 1
+        variable_definitions = []
+
+        while True:
+            variable_definitions.append(self._node(
+                graphql_ast.VariableDefinitionNode,
+                self._position,
+                variable=self._parse_variable(),
+                type=self._expect(":") and self._parse_type_reference(),
+                default_value=self._parse_value(is_const=True) if self._skip("=") else None,
+                directives=self._parse_directives(is_const=True),
+            ))
+
+            if self._skip(")"):
+                return tuple(variable_definitions)
+
+    def _parse_variable(self):
+        start = self._position
+        self._expect("$")
+        return self._node(graphql_ast.VariableNode, start, name=self._parse_name())
+
+    def _parse_type_reference(self):
+        start = self._position
+
+        if self._skip("["):
+            type_reference = self._parse_type_reference()
+            self._expect("]")
+            type_reference = self._node(graphql_ast.ListTypeNode, start, type=type_reference)
+        else:
+            type_reference = self._parse_named_type()
+
+        if self._skip("!"):
+            return self._node(graphql_ast.NonNullTypeNode, start, type=type_reference)
+        else:
+            return type_reference
+
+    def _parse_named_type(self):
+        return self._node(graphql_ast.NamedTypeNode, self._position, name=self._parse_name())
+
+    def _parse_selection_set(self):
+        start = self._position
+        self._expect("{")
+        selections = [self._parse_selection()]
+
+        while not self._skip("}"):
+            selections.append(self._parse_selection())
+
+        return self._node(graphql_ast.SelectionSetNode, start, selections=tuple(selections))
+
+    def _parse_selection(self):
+        if self._peek() == "...":
+            return self._parse_fragment()
+        else:
+            return self._parse_field()
+
+    def _parse_field(self):
+        start = self._position
+        name_or_alias = self._parse_name()
+
+        if self._skip(":"):
+            alias = name_or_alias
+            name = self._parse_name()
+        else:
+            alias = None
+            name = name_or_alias
+
+        return self._node(
+            graphql_ast.FieldNode,
+            start,
+            alias=alias,
+            name=name,
+            arguments=self._parse_arguments(is_const=False),
+            directives=self._parse_directives(is_const=False),
+            selection_set=self._parse_selection_set() if self._peek() == "{" else None,
+        )
+
+    def _parse_fragment(self):
+        start = self._position
+        self._position += 1
+        kind, value, _, _ = self._tokens[self._position]
+
+        if kind == "name" and value == "on":
+            return self._node(
+                graphql_ast.InlineFragmentNode,
+                start,
+                type_condition=self._parse_type_condition(),
+                directives=self._parse_directives(is_const=False),
+                selection_set=self._parse_selection_set(),
+            )
+        elif kind == "name":
+            return self._node(
+                graphql_ast.FragmentSpreadNode,
+                start,
+                name=self._parse_fragment_name(),
+                directives=self._parse_directives(is_const=False),
+            )
+        else:
+            return self._node(
+                graphql_ast.InlineFragmentNode,
+                start,
+                type_condition=None,
+                directives=self._parse_directives(is_const=False),
+                selection_set=self._parse_selection_set(),
+            )
+
+    def _parse_fragment_name(self):
+        if self._tokens[self._position][1] == "on":
+            raise _Unsupported()
+
+        return self._parse_name()
+
+    def _parse_type_condition(self):
+        if self._tokens[self._position][:2] != ("name", "on"):
+            raise _Unsupported()
+
+        self._position += 1
+        return self._parse_named_type()
+
+    def _parse_arguments(self, is_const):
+        if self._peek() != "(":
+            return ()
+
+        self._position += 1
+        arguments = []
+
+        while True:
+            arguments.append(self._node(
+                graphql_ast.ArgumentNode,
+                self._position,
+                name=self._parse_name(),
+                value=self._expect(":") and self._parse_value(is_const=is_const),
+            ))
+
+            if self._skip(")"):
+                return tuple(arguments)
+
+    def _parse_directives(self, is_const):
+        directives = []
+
+        while self._peek() == "@":
+            start = self._position
+            self._position += 1
+            directives.append(self._node(
+                graphql_ast.DirectiveNode,
+                start,
+                name=self._parse_name(),
+                arguments=self._parse_arguments(is_const=is_const),
+            ))
+
+        return tuple(directives)
+
+    def _parse_value(self, is_const):
+        start = self._position
+        kind, value, _, _ = self._tokens[start]
+
+        if kind == "$" and not is_const:
+            return self._parse_variable()
+
+        self._position += 1
+
+        if kind == "int":
+            return self._node(graphql_ast.IntValueNode, start, value=value)
+        elif kind == "float":
+            return self._node(graphql_ast.FloatValueNode, start, value=value)
+        elif kind == "string":
+            return self._node(graphql_ast.StringValueNode, start, value=_escape_pattern.sub(_unescape, value[1:-1]), block=False)
+        elif kind == "name":
+            if value == "true":
+                return self._node(graphql_ast.BooleanValueNode, start, value=True)
+            elif value == "false":
+                return self._node(graphql_ast.BooleanValueNode, start, value=False)
+            elif value == "null":
+                return self._node(graphql_ast.NullValueNode, start)
+            else:
+                return self._node(graphql_ast.EnumValueNode, start, value=value)
+        elif kind == "[":
+            values = []
+            while not self._skip("]"):
+                values.append(self._parse_value(is_const=is_const))
+            return self._node(graphql_ast.ListValueNode, start, values=tuple(values))
+        elif kind == "{":
+            fields = []
+            while not self._skip("}"):
+                fields.append(self._node(
+                    graphql_ast.ObjectFieldNode,
+                    self._position,
+                    name=self._parse_name(),
+                    value=self._expect(":") and self._parse_value(is_const=is_const),
+                ))
+            return self._node(graphql_ast.ObjectValueNode, start, fields=tuple(fields))
+        else:
+            raise _Unsupported()
+
+    def _parse_name(self):
+        start = self._position
+        kind, value, _, _ = self._tokens[start]
+        if kind != "name":
+            raise _Unsupported()
+
+        self._position += 1
+        return self._node(graphql_ast.NameNode, start, value=value)
+
+    def _peek(self):
+        return self._tokens[self._position][0]
+
+    def _skip(self, kind):
+        if self._tokens[self._position][0] == kind:
+            self._position += 1
+            return True
+        else:
+            return False
+
+    def _expect(self, kind):
+        if not self._skip(kind):
+            raise _Unsupported()
+
+        return True
+
+    def _node(self, node_class, start, **values):
+        # Nodes are built without going through Node.__init__ and
+        # Node.__setattr__, which dominate parse time otherwise.
+        node = node_class.__new__(node_class)
+        for key in node_class.keys:
+            _set_attribute(node, key, values.get(key))
+
+        loc = _Location.__new__(_Location)
+        loc.start = self._tokens[start][2]
+        loc.end = self._tokens[self._position - 1][3]
+        loc.start_token = None
+        loc.end_token = None
+        loc.source = self._source
+        _set_attribute(node, "loc", loc)
+
+        return node
+
+
+_Location = graphql_ast.Location
+
+_set_attribute = object.__setattr__
+
+
+_operation_types = {
+    "query": graphql_ast.OperationType.QUERY,
+    "mutation": graphql_ast.OperationType.MUTATION,
+    "subscription": graphql_ast.OperationType.SUBSCRIPTION,
+}
@@ -0,0 +1,120 @@
+import graphql
+from graphql import GraphQLError
+
+from .. import GraphError
+
+
+defer_directive = graphql.GraphQLDirective(
+    name="defer",
+    locations=(
+        graphql.DirectiveLocation.FRAGMENT_SPREAD,
+        graphql.DirectiveLocation.INLINE_FRAGMENT,
+    ),
+    args={
+        "if": graphql.GraphQLArgument(graphql.GraphQLNonNull(graphql.GraphQLBoolean), default_value=True),
+        "label": graphql.GraphQLArgument(graphql.GraphQLString),
+    },
+)
+
+
+stream_directive = graphql.GraphQLDirective(
+    name="stream",
+    locations=(
+        graphql.DirectiveLocation.FIELD,
+    ),
+    args={
+        "if": graphql.GraphQLArgument(graphql.GraphQLNonNull(graphql.GraphQLBoolean), default_value=True),
+        "label": graphql.GraphQLArgument(graphql.GraphQLString),
+        "initialCount": graphql.GraphQLArgument(graphql.GraphQLNonNull(graphql.GraphQLInt), default_value=0),
+    },
+)
+
+
+directives = tuple(graphql.specified_directives) + (defer_directive, stream_directive)
+
+
+class DeferredQuery(object):
+    def __init__(self, *, kind, label, path, graph_query, initial_count):
+        self.kind = kind
+        self.label = label
+        self.path = path
+        self.graph_query = graph_query
+        self.initial_count = initial_count
+
+
+def iter_payloads(graph, deferred_queries, data):
+    deferred_items = []
+
+    for deferred_query in deferred_queries:
+        if deferred_query.kind == "stream":
+            parent = _find_value(data, deferred_query.path[:-1])
+            key = deferred_query.path[-1]
+
+            if deferred_query.graph_query is None:
+                if parent is None or parent.get(key) is None:
+                    items = None
+                else:
+                    items = parent[key][deferred_query.initial_count:]
+                    parent[key] = parent[key][:deferred_query.initial_count]
+
+                deferred_items.append(items)
+            else:
+                if parent is not None:
+                    parent[key] = []
+
+                deferred_items.append(None)
+        else:
+            deferred_items.append(None)
+
+    yield {"data": data, "hasNext": True}
+
+    for index, (deferred_query, items) in enumerate(zip(deferred_queries, deferred_items)):
+        has_next = index + 1 < len(deferred_queries)
+
+        try:
+            incremental_result = _resolve_deferred_query(graph, deferred_query, items)
+        except (GraphQLError, GraphError) as error:
+            if isinstance(error, GraphError):
+                error = GraphQLError(str(error))
+
+            incremental_result = {"errors": [error.formatted], "path": list(deferred_query.path)}
+
+        if incremental_result is None:
+            yield {"hasNext": has_next}
+        else:
+            if deferred_query.label is not None:
+                incremental_result["label"] = deferred_query.label
+
+            yield {"incremental": [incremental_result], "hasNext": has_next}
+
+
+def _resolve_deferred_query(graph, deferred_query, items):
+    if deferred_query.kind == "stream":
+        if deferred_query.graph_query is None:
+            start = deferred_query.initial_count
+        else:
+            start = 0
+            items = _find_value(graph.resolve_sync(deferred_query.graph_query), deferred_query.path)
+
+        if items:
+            return {"items": list(items), "path": list(deferred_query.path) + [start]}
+        else:
+            return None
+
+    else:
+        data = _find_value(graph.resolve_sync(deferred_query.graph_query), deferred_query.path)
+
+        if data is None:
+            return None
+        else:
+            return {"data": data, "path": list(deferred_query.path)}
+
+
+def _find_value(data, path):
+    for key in path:
+        if data is None:
+            return None
+
+        data = data.get(key)
+
+    return data
@@ -0,0 +1,168 @@
+import math
+
+from graphql.language import ast as graphql_ast
+from graphql.type.scalars import GRAPHQL_MAX_INT, GRAPHQL_MIN_INT
+
+from .. import GraphError, schema
+from ..iterables import to_dict
+from ..memo import memoize
+from .naming import snake_case_to_camel_case
+
+
+def compile_input_converter(value_type, input_converter):
+    if isinstance(value_type, schema.EnumType):
+        enum_members = to_dict(
+            (member.value, member)
+            for member in value_type.enum
+        )
+        return enum_members.__getitem__
+
+    elif isinstance(value_type, schema.NullableType):
+        convert_element = input_converter(value_type.element_type)
+
+        def convert_nullable(graphql_value):
+            if graphql_value is None:
+                return None
+            else:
+                return convert_element(graphql_value)
+
+        return convert_nullable
+
+    elif value_type in (schema.Boolean, schema.Float, schema.Int, schema.String):
+        return _convert_scalar
+
+    elif isinstance(value_type, schema.ListType):
+        convert_element = input_converter(value_type.element_type)
+
+        if convert_element is _convert_scalar:
+            return list
+        else:
+            return lambda graphql_value: [
+                convert_element(element)
+                for element in graphql_value
+            ]
+
+    elif isinstance(value_type, schema.InputObjectType):
+        return _compile_input_object_converter(value_type, input_converter)
+
+    else:
+        raise ValueError("unhandled type: {}".format(type(value_type)))
+
+
+def _convert_scalar(graphql_value):
+    return graphql_value
+
+
+def _compile_input_object_converter(value_type, input_converter):
+    # Field converters are compiled on first use so that input types can
+    # refer to themselves.
+    @memoize
+    def fields():
+        return tuple(
+            (
+                snake_case_to_camel_case(field.name),
+                field.name,
+                field.has_default,
+                field.default,
+                input_converter(field.type),
+            )
+            for field in value_type.fields
+        )
+
+    instance_type = value_type.instance_type()
+
+    def convert_input_object(graphql_value):
+        field_values = {}
+        field_count = 0
+
+        for key, name, has_default, default, convert_field in fields():
+            graphql_field_value = graphql_value.get(key, _missing)
+            if graphql_field_value is not _missing:
+                field_values[name] = convert_field(graphql_field_value)
+                field_count += 1
+            elif has_default:
+                field_values[name] = default
+            else:
+                raise GraphError("{} is missing required field {}".format(value_type.name, name))
+
+        if field_count != len(graphql_value):
+            field_keys = frozenset(field[0] for field in fields())
+            key = next(key for key in graphql_value if key not in field_keys)
+            raise GraphError("{} has no field {}".format(value_type.name, key))
+
+        return instance_type(field_values)
+
+    return convert_input_object
+
+
+def compile_bulk_variable_coercer(type_node):
+    if isinstance(type_node, graphql_ast.NonNullTypeNode):
+        type_node = type_node.type
+
+    if not isinstance(type_node, graphql_ast.ListTypeNode):
+        return None
+
+    element_type_node = type_node.type
+    if isinstance(element_type_node, graphql_ast.NonNullTypeNode):
+        element_type_node = element_type_node.type
+
+    if isinstance(element_type_node, graphql_ast.NamedTypeNode):
+        return _bulk_variable_coercers.get(element_type_node.name.value)
+    else:
+        return None
+
+
+# Bulk coercers return None when a list needs graphql-core's element-wise
+# coercion, either to convert elements or to report errors.
+
+def _coerce_boolean_list(value):
+    if set(map(type, value)) <= _boolean_types:
+        return list(value)
+    else:
+        return None
+
+
+def _coerce_float_list(value):
+    element_types = set(map(type, value))
+    if not element_types <= _float_types:
+        return None
+
+    try:
+        floats = list(map(float, value))
+    except OverflowError:
+        return None
+
+    if all(map(math.isfinite, floats)):
+        return floats
+    else:
+        return None
+
+
+def _coerce_int_list(value):
+    if set(map(type, value)) <= _int_types and (not value or (GRAPHQL_MIN_INT <= min(value) and max(value) <= GRAPHQL_MAX_INT)):
+        return list(value)
+    else:
+        return None
+
+
+def _coerce_string_list(value):
+    if set(map(type, value)) <= _string_types:
+        return list(value)
+    else:
+        return None
+
+
+_boolean_types = frozenset((bool, ))
+_float_types = frozenset((float, int))
+_int_types = frozenset((int, ))
+_string_types = frozenset((str, ))
+
+_bulk_variable_coercers = {
+    "Boolean": _coerce_boolean_list,
+    "Float": _coerce_float_list,
+    "Int": _coerce_int_list,
+    "String": _coerce_string_list,
+}
+
+
+_missing = object()
@@ -0,0 +1,171 @@
+import graphql
+from graphql.execution import execute as graphql_execute
+from graphql.execution.values import get_argument_values
+from graphql.language import ast as graphql_ast
+from graphql.type.directives import GraphQLIncludeDirective, GraphQLSkipDirective
+
+
+_introspection_document = graphql.parse(graphql.get_introspection_query(
+    descriptions=True,
+    specified_by_url=True,
+    directive_is_repeatable=True,
+    schema_description=True,
+    input_value_deprecation=True,
+))
+
+
+def introspect(graphql_schema):
+    result = graphql_execute(graphql_schema, _introspection_document)
+    if result.errors:
+        raise result.errors[0]
+    else:
+        return result.data["__schema"]
+
+
+def execute_schema_document(graphql_schema_document, graphql_schema, variables):
+    try:
+        return _project_schema_document(
+            graphql_schema_document,
+            introspection=graphql_schema.introspection(),
+            variables=variables,
+        )
+    except _CannotProject:
+        return _execute_schema_document(
+            graphql_schema_document,
+            graphql_schema=graphql_schema.graphql_schema,
+            variables=variables,
+        )
+
+
+def _execute_schema_document(graphql_schema_document, graphql_schema, variables):
+    # TODO: handle errors
+    result = graphql_execute(
+        graphql_schema,
+        graphql_schema_document,
+        # TODO: variables
+        variable_values=variables,
+    )
+    if result.errors:
+        raise result.errors[0]
+    else:
+        return result.data
+
+
+class _CannotProject(Exception):
+    pass
+
+
+# Arguments that cannot change the introspection result since graphlayer
+# never marks fields, arguments or enum values as deprecated.
+_ignored_argument_names = frozenset(["includeDeprecated"])
+
+
+def _project_schema_document(graphql_schema_document, introspection, variables):
+    operation = next(
+        definition
+        for definition in graphql_schema_document.definitions
+        if isinstance(definition, graphql_ast.OperationDefinitionNode)
+    )
+    fragments = dict(
+        (definition.name.value, definition)
+        for definition in graphql_schema_document.definitions
+        if isinstance(definition, graphql_ast.FragmentDefinitionNode)
+    )
+    projector = _Projector(fragments=fragments, variables=variables)
+
+    return projector.project_selection_set({"__schema": introspection}, operation.selection_set)
+
+
+class _Projector(object):
+    def __init__(self, fragments, variables):
+        self._fragments = fragments
+        self._variables = variables
+
+    def project_selection_set(self, value, selection_set):
+        if value is None:
+            return None
+        elif isinstance(value, list):
+            return [
+                self.project_selection_set(element, selection_set)
+                for element in value
+            ]
+        else:
+            result = {}
+
+            for field_node in self._collect_fields(selection_set):
+                name = field_node.name.value
+
+                if name not in value:
+                    raise _CannotProject()
+
+                for argument in field_node.arguments:
+                    if argument.name.value not in _ignored_argument_names:
+                        raise _CannotProject()
+
+                if field_node.selection_set is None:
+                    field_value = value[name]
+                else:
+                    field_value = self.project_selection_set(value[name], field_node.selection_set)
+
+                key = name if field_node.alias is None else field_node.alias.value
+                if key in result:
+                    result[key] = _merge_values(result[key], field_value)
+                else:
+                    result[key] = field_value
+
+            return result
+
+    def _collect_fields(self, selection_set):
+        for selection in selection_set.selections:
+            if not self._should_include_selection(selection):
+                pass
+
+            elif isinstance(selection, graphql_ast.FieldNode):
+                yield selection
+
+            elif isinstance(selection, graphql_ast.InlineFragmentNode):
+                yield from self._collect_fields(selection.selection_set)
+
+            elif isinstance(selection, graphql_ast.FragmentSpreadNode):
+                yield from self._collect_fields(self._fragments[selection.name.value].selection_set)
+
+            else:
+                raise _CannotProject()
+
+    def _should_include_selection(self, selection):
+        for directive in selection.directives:
+            name = directive.name.value
+            if name == "include":
+                args = get_argument_values(GraphQLIncludeDirective, directive, self._variables)
+                if args.get("if") is False:
+                    return False
+
+            elif name == "skip":
+                args = get_argument_values(GraphQLSkipDirective, directive, self._variables)
+                if args.get("if") is True:
+                    return False
+
+            else:
+                raise _CannotProject()
+
+        return True
+
+
+def _merge_values(left, right):
+    if isinstance(left, dict) and isinstance(right, dict):
+        result = left.copy()
+        for key, value in right.items():
+            if key in result:
+                result[key] = _merge_values(result[key], value)
+            else:
+                result[key] = value
+        return result
+
+    elif isinstance(left, list) and isinstance(right, list):
+        return [
+            _merge_values(left_element, right_element)
+            for left_element, right_element in zip(left, right)
+        ]
+
+    else:
+        return left
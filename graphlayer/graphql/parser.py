@@ -1,14 +1,16 @@
 from copy import copy
-from functools import reduce
 
 from graphql import GraphQLError
 from graphql.execution.values import get_argument_values, get_variable_values
-from graphql.language import ast as graphql_ast, parser as graphql_parser
+from graphql.language import ast as graphql_ast, parser as graphql_parser, print_ast
 from graphql.type.directives import GraphQLIncludeDirective, GraphQLSkipDirective
 from graphql.validation import validate as graphql_validate
 
 from .. import schema
+from ..representations import Object
 from ..iterables import find, partition, to_dict
+from ..memo import memoize
+from . import fastparse, incremental, inputs, introspection, persisted
 from .naming import snake_case_to_camel_case
 
 
@@ -16,120 +18,480 @@ from .naming import snake_case_to_camel_case
 
 
 class GraphQLQuery(object):
-    def __init__(self, graph_query, graphql_schema_document, variables):
+    def __init__(self, graph_query, graphql_schema_document, variables, deferred_queries=()):
         self.graph_query = graph_query
         self.graphql_schema_document = graphql_schema_document
         self.variables = variables
+        self.deferred_queries = deferred_queries
 
 
 def document_text_to_query(document_text, graphql_schema, variables=None):
-    if variables is None:
-        variables = {}
+    document = read_document(document_text, graphql_schema=graphql_schema)
+    return document.to_query(variables)
 
-    document_ast = graphql_parser.parse(document_text)
 
-    graphql_validation_errors = graphql_validate(graphql_schema.graphql_schema, document_ast)
+def read_document(document_text, graphql_schema, max_tokens=None, validate=None, fast_parser=False):
+    if fast_parser:
+        document_ast = fastparse.parse(document_text, max_tokens=max_tokens)
+    else:
+        document_ast = graphql_parser.parse(document_text, max_tokens=max_tokens)
+
+    if validate is None:
+        graphql_validation_errors = graphql_validate(graphql_schema.graphql_schema, document_ast)
+    else:
+        graphql_validation_errors = validate(document_ast)
+
     if graphql_validation_errors:
         raise(graphql_validation_errors[0])
 
-    operation_index, operation = find(
-        lambda definition: isinstance(definition[1], graphql_ast.OperationDefinitionNode),
-        enumerate(document_ast.definitions),
-    )
+    return Document(document_ast, graphql_schema=graphql_schema)
 
-    if operation.operation == graphql_ast.OperationType.QUERY:
-        root_type = graphql_schema.query_type
-    elif operation.operation == graphql_ast.OperationType.MUTATION and graphql_schema.mutation_type is not None:
-        root_type = graphql_schema.mutation_type
-    else:
-        raise GraphQLError(
-            "unsupported operation: {}".format(operation.operation.value),
-            nodes=[operation],
+
+class Document(object):
+    def __init__(self, document_ast, graphql_schema):
+        self._graphql_schema = graphql_schema
+
+        operation_index, operation = find(
+            lambda definition: isinstance(definition[1], graphql_ast.OperationDefinitionNode),
+            enumerate(document_ast.definitions),
         )
 
-    variable_definitions = [
-        variable_definition
-        for variable_definition in (operation.variable_definitions or [])
-    ]
-    variable_values = get_variable_values(graphql_schema.graphql_schema, variable_definitions, variables)
-    if isinstance(variable_values, list) and len(variable_values) > 0 and isinstance(variable_values[0], GraphQLError):
-        raise variable_values[0]
-
-    fragments = to_dict(
-        (fragment.name.value, fragment)
-        for fragment in filter(
-            lambda definition: isinstance(definition, graphql_ast.FragmentDefinitionNode),
-            document_ast.definitions,
+        if operation.operation == graphql_ast.OperationType.QUERY:
+            self._root_type = graphql_schema.query_type
+        elif operation.operation == graphql_ast.OperationType.MUTATION and graphql_schema.mutation_type is not None:
+            self._root_type = graphql_schema.mutation_type
+        else:
+            raise GraphQLError(
+                "unsupported operation: {}".format(operation.operation.value),
+                nodes=[operation],
+            )
+
+        self.operation = operation
+        self.fingerprint = memoize(lambda: persisted.document_hash(print_ast(document_ast)))
+        self._variable_definitions = [
+            variable_definition
+            for variable_definition in (operation.variable_definitions or [])
+        ]
+        self._bulk_variable_coercers = _compile_bulk_variable_coercers(self._variable_definitions)
+
+        self._fragments = to_dict(
+            (fragment.name.value, fragment)
+            for fragment in filter(
+                lambda definition: isinstance(definition, graphql_ast.FragmentDefinitionNode),
+                document_ast.definitions,
+            )
         )
-    )
 
-    # TODO: handle fragments with __schema
-    schema_selections, non_schema_selections = partition(
-        lambda selection: isinstance(selection, graphql_ast.FieldNode) and selection.name.value == "__schema",
-        operation.selection_set.selections,
-    )
+        # TODO: handle fragments with __schema
+        schema_selections, non_schema_selections = partition(
+            lambda selection: isinstance(selection, graphql_ast.FieldNode) and selection.name.value == "__schema",
+            operation.selection_set.selections,
+        )
 
-    if len(schema_selections) == 0:
-        schema_document = None
-    else:
-        schema_operation = _copy_with(
-            operation,
-            selection_set=_copy_with(
-                operation.selection_set,
-                selections=schema_selections,
-            ),
+        if len(schema_selections) == 0:
+            self._schema_document = None
+        else:
+            schema_operation = _copy_with(
+                operation,
+                selection_set=_copy_with(
+                    operation.selection_set,
+                    selections=schema_selections,
+                ),
+            )
+
+            schema_definitions = list(copy(document_ast.definitions))
+            schema_definitions[operation_index] = schema_operation
+            schema_definitions = tuple(schema_definitions)
+
+            self._schema_document = _copy_with(
+                document_ast,
+                definitions=schema_definitions,
+            )
+
+        if non_schema_selections:
+            self._selection_set = _copy_with(operation.selection_set, selections=non_schema_selections)
+        else:
+            self._selection_set = None
+
+        self._directive_variable_names = _read_directive_variable_names(document_ast.definitions)
+        # Deferred parts of a mutation would be resolved by re-running the
+        # mutation, so mutations are always resolved in a single pass.
+        self._is_incremental = (
+            operation.operation == graphql_ast.OperationType.QUERY and
+            _has_incremental_directives(document_ast.definitions)
         )
+        self._plans = {}
+        self._schema_result = None
 
-        schema_definitions = list(copy(document_ast.definitions))
-        schema_definitions[operation_index] = schema_operation
-        schema_definitions = tuple(schema_definitions)
+    def read_schema_result(self, variables):
+        if self._schema_document is None:
+            return None
+
+        if self._schema_result is not None:
+            return self._schema_result
 
-        schema_document = _copy_with(
-            document_ast,
-            definitions=schema_definitions,
+        schema_result = introspection.execute_schema_document(
+            self._schema_document,
+            graphql_schema=self._graphql_schema,
+            variables=variables,
         )
 
-    if non_schema_selections:
-        all_types = schema.collect_types((graphql_schema.query_type, graphql_schema.mutation_type) + tuple(graphql_schema.types))
-        all_types_by_name = to_dict(
-            (graph_type.name, graph_type)
-            for graph_type in all_types
-            if hasattr(graph_type, "name")
+        if not self._variable_definitions:
+            self._schema_result = schema_result
+
+        return schema_result
+
+    def to_query(self, variables=None, *, incremental=False, check_plan=None):
+        if variables is None:
+            variables = {}
+
+        bulk_variable_values = self._coerce_bulk_variables(variables)
+        if bulk_variable_values:
+            variable_definitions = [
+                variable_definition
+                for variable_definition in self._variable_definitions
+                if variable_definition.variable.name.value not in bulk_variable_values
+            ]
+        else:
+            variable_definitions = self._variable_definitions
+
+        variable_values = get_variable_values(self._graphql_schema.graphql_schema, variable_definitions, variables)
+        if isinstance(variable_values, list) and len(variable_values) > 0 and isinstance(variable_values[0], GraphQLError):
+            raise variable_values[0]
+
+        variable_values.update(bulk_variable_values)
+
+        plan = self._plan(variable_values, incremental=incremental and self._is_incremental, check_plan=check_plan)
+
+        return GraphQLQuery(
+            plan.bind(variable_values),
+            graphql_schema_document=self._schema_document,
+            variables=variable_values,
+            deferred_queries=plan.bind_deferred(variable_values),
         )
-        parser = Parser(fragments=fragments, types=all_types_by_name, variables=variable_values)
-        graph_query = parser.read_selection_set(
-            _copy_with(operation.selection_set, selections=non_schema_selections),
-            graph_type=root_type,
+
+    def _coerce_bulk_variables(self, variables):
+        bulk_variable_values = {}
+
+        for name, coerce in self._bulk_variable_coercers:
+            value = variables.get(name)
+            if isinstance(value, list):
+                coerced_value = coerce(value)
+                if coerced_value is not None:
+                    bulk_variable_values[name] = coerced_value
+
+        return bulk_variable_values
+
+    def precompile(self):
+        if not self._directive_variable_names:
+            self._plan({}, incremental=False)
+
+    def _plan(self, variable_values, *, incremental, check_plan=None):
+        directive_variables = to_dict(
+            (name, variable_values[name])
+            for name in self._directive_variable_names
+            if name in variable_values
+        )
+        plan_key = (incremental, tuple(sorted(directive_variables.items())))
+
+        plan = self._plans.get(plan_key)
+        if plan is None:
+            plan = self._compile(directive_variables, incremental=incremental, check_plan=check_plan)
+            self._plans[plan_key] = plan
+
+        return plan
+
+    def _compile(self, directive_variables, *, incremental, check_plan=None):
+        if self._selection_set is None:
+            return _Plan(graph_query=None, bind_query=None, parser_for_variables=None)
+
+        all_types_by_name = self._graphql_schema.all_types_by_name()
+
+        def parser_for_variables(variables):
+            return Parser(
+                fragments=self._fragments,
+                types=all_types_by_name,
+                variables=variables,
+                input_converter=self._graphql_schema.input_converter,
+            )
+
+        def compile_selection_set(selection_set):
+            graph_query = schema.intern_query(parser_for_variables(directive_variables).read_selection_set(
+                selection_set,
+                graph_type=self._root_type,
+            ))
+            # Plans are checked before compiling their binders so that
+            # documents rejected by the check never pay for binding.
+            if check_plan is not None:
+                check_plan(graph_query)
+            return graph_query, _compile_query_binder(graph_query, {})
+
+        if incremental:
+            selection_set, deferred_selections = parser_for_variables(directive_variables).split_incremental_selection_set(
+                self._selection_set,
+                graph_type=self._root_type,
+            )
+        else:
+            selection_set, deferred_selections = self._selection_set, ()
+
+        graph_query, bind_query = compile_selection_set(selection_set)
+
+        deferred = tuple(
+            (deferred_selection, ) + (
+                (None, None)
+                if deferred_selection.selection_set is None
+                else compile_selection_set(deferred_selection.selection_set)
+            )
+            for deferred_selection in deferred_selections
+        )
+
+        return _Plan(
+            graph_query=graph_query,
+            bind_query=bind_query,
+            parser_for_variables=parser_for_variables,
+            deferred=deferred,
+        )
+
+
+class _Plan(object):
+    def __init__(self, graph_query, bind_query, parser_for_variables, deferred=()):
+        self._graph_query = graph_query
+        self._bind_query = bind_query
+        self._parser_for_variables = parser_for_variables
+        self._deferred = deferred
+
+    def bind(self, variables):
+        return self._bind(self._graph_query, self._bind_query, variables)
+
+    def bind_deferred(self, variables):
+        return tuple(
+            incremental.DeferredQuery(
+                kind=deferred_selection.kind,
+                label=deferred_selection.label,
+                path=deferred_selection.path,
+                graph_query=self._bind(graph_query, bind_query, variables),
+                initial_count=deferred_selection.initial_count,
+            )
+            for deferred_selection, graph_query, bind_query in self._deferred
         )
+
+    def _bind(self, graph_query, bind_query, variables):
+        if bind_query is None:
+            return graph_query
+        else:
+            return bind_query(self._parser_for_variables(variables), {})
+
+
+class _DeferredSelection(object):
+    def __init__(self, *, kind, label, path, selection_set, initial_count):
+        self.kind = kind
+        self.label = label
+        self.path = path
+        self.selection_set = selection_set
+        self.initial_count = initial_count
+
+
+def _compile_query_binder(query, binders):
+    # Queries may share subqueries, such as fragments spread more than once,
+    # so binders are compiled and bound once per subquery.
+    key = id(query)
+    if key not in binders:
+        binders[key] = _memoize_binder(_compile_unique_query_binder(query, binders))
+    return binders[key]
+
+
+def _memoize_binder(bind):
+    if bind is None:
+        return None
+
+    key = id(bind)
+
+    def bind_memoized(parser, bound):
+        result = bound.get(key)
+        if result is None:
+            result = bound[key] = bind(parser, bound)
+        return result
+
+    return bind_memoized
+
+
+def _compile_unique_query_binder(query, binders):
+    if isinstance(query, schema.ObjectQuery):
+        field_binders = [
+            _compile_query_binder(field_query, binders)
+            for field_query in query.field_queries
+        ]
+
+        if all(field_binder is None for field_binder in field_binders):
+            return None
+
+        field_queries_and_binders = tuple(zip(query.field_queries, field_binders))
+
+        def bind(parser, bound):
+            return schema.ObjectQuery(
+                query.type,
+                field_queries=tuple(
+                    field_query if field_binder is None else field_binder(parser, bound)
+                    for field_query, field_binder in field_queries_and_binders
+                ),
+                create_object=query.create_object,
+            )
+
+        return bind
+
+    elif isinstance(query, schema.FieldQuery):
+        return _compile_field_query_binder(query, binders)
+
+    elif isinstance(query, (schema.ListQuery, schema.NullableQuery)):
+        element_binder = _compile_query_binder(query.element_query, binders)
+
+        if element_binder is None:
+            return None
+
+        query_class = type(query)
+
+        def bind(parser, bound):
+            return query_class(type=query.type, element_query=element_binder(parser, bound))
+
+        return bind
+
     else:
-        graph_query=None
+        return None
+
 
-    return GraphQLQuery(
-        graph_query,
-        graphql_schema_document=schema_document,
-        variables=variable_values,
+def _compile_field_query_binder(field_query, binders):
+    type_query_binder = _compile_query_binder(field_query.type_query, binders)
+    unbound_args = tuple(
+        (name, value)
+        for name, value in field_query.args._values.items()
+        if isinstance(value, _UnboundArgumentValue)
     )
 
+    if type_query_binder is None and not unbound_args:
+        return None
+
+    def bind(parser, bound):
+        if type_query_binder is None:
+            type_query = field_query.type_query
+        else:
+            type_query = type_query_binder(parser, bound)
+
+        if unbound_args:
+            arg_values = field_query.args._values.copy()
+            for name, value in unbound_args:
+                arg_values[name] = value.bind(parser)
+            args = Object(arg_values)
+        else:
+            args = field_query.args
+
+        return schema.FieldQuery(
+            key=field_query.key,
+            field=field_query.field,
+            type_query=type_query,
+            args=args,
+        )
+
+    return bind
+
+
+class _UnboundArgumentValue(object):
+    def __init__(self, param, value_node):
+        self._param = param
+        self._value_node = value_node
+        self._value_text = print_ast(value_node)
+
+    def bind(self, parser):
+        return self._param(parser._read_value_node(self._value_node, value_type=self._param.type)).value
+
+    def __eq__(self, other):
+        if isinstance(other, _UnboundArgumentValue):
+            return self._param == other._param and self._value_text == other._value_text
+        else:
+            return NotImplemented
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __hash__(self):
+        return hash(self._value_text)
+
+    def __repr__(self):
+        return "_UnboundArgumentValue({})".format(self._value_text)
+
+
+def _compile_bulk_variable_coercers(variable_definitions):
+    bulk_variable_coercers = []
+
+    for variable_definition in variable_definitions:
+        coerce = inputs.compile_bulk_variable_coercer(variable_definition.type)
+        if coerce is not None:
+            bulk_variable_coercers.append((variable_definition.variable.name.value, coerce))
+
+    return tuple(bulk_variable_coercers)
+
+
+def _read_directive_variable_names(definitions):
+    return tuple(sorted(set(
+        argument.value.name.value
+        for directive in _iter_directives(definitions)
+        for argument in directive.arguments
+        if isinstance(argument.value, graphql_ast.VariableNode)
+    )))
+
+
+def _has_incremental_directives(definitions):
+    return any(
+        directive.name.value in (incremental.defer_directive.name, incremental.stream_directive.name)
+        for directive in _iter_directives(definitions)
+    )
+
+
+def _iter_directives(definitions):
+    def iter_selection_set(selection_set):
+        if selection_set is not None:
+            for selection in selection_set.selections:
+                yield from selection.directives
+                yield from iter_selection_set(getattr(selection, "selection_set", None))
+
+    for definition in definitions:
+        if isinstance(definition, (graphql_ast.OperationDefinitionNode, graphql_ast.FragmentDefinitionNode)):
+            yield from iter_selection_set(definition.selection_set)
+
+
+def _has_variables(value_node):
+    if isinstance(value_node, graphql_ast.VariableNode):
+        return True
+    elif isinstance(value_node, graphql_ast.ListValueNode):
+        return any(map(_has_variables, value_node.values))
+    elif isinstance(value_node, graphql_ast.ObjectValueNode):
+        return any(
+            _has_variables(field_input.value)
+            for field_input in value_node.fields
+        )
+    else:
+        return False
+
 
 class Parser(object):
-    def __init__(self, fragments, types, variables):
+    def __init__(self, fragments, types, variables, input_converter):
         self._fragments = fragments
         self._types = types
         self._variables = variables
+        self._input_converter = input_converter
+        self._fragment_queries = {}
 
     def read_selection_set(self, selection_set, graph_type):
         if selection_set is None:
             return graph_type()
+        elif not selection_set.selections:
+            return graph_type.query(field_queries=(), create_object=_create_object)
         else:
-            return reduce(
-                lambda left, right: left + right,
-                (
-                    self._read_graphql_selection(
-                        graphql_selection,
-                        graph_type=graph_type,
-                    )
-                    for graphql_selection in selection_set.selections
+            return schema.merge_queries(
+                self._read_graphql_selection(
+                    graphql_selection,
+                    graph_type=graph_type,
                 )
+                for graphql_selection in selection_set.selections
             )
 
     def _read_graphql_selection(self, selection, graph_type):
@@ -144,7 +506,7 @@ class Parser(object):
             return self._read_graphql_fragment(selection, graph_type=graph_type)
 
         elif isinstance(selection, graphql_ast.FragmentSpreadNode):
-            return self._read_graphql_fragment(self._fragments[selection.name.value], graph_type=graph_type)
+            return self._read_named_fragment(selection.name.value, graph_type=graph_type)
 
         else:
             raise Exception("Unhandled selection type: {}".format(type(selection)))
@@ -162,14 +524,148 @@ class Parser(object):
                 if args.get("if") is True:
                     return False
 
+            elif name in (incremental.defer_directive.name, incremental.stream_directive.name):
+                pass
+
             else:
                 raise GraphQLError("unknown directive: {}".format(name))
 
         return True
 
+    def _read_named_fragment(self, name, graph_type):
+        key = (name, graph_type)
+        query = self._fragment_queries.get(key)
+        if query is None:
+            query = self._fragment_queries[key] = self._read_graphql_fragment(self._fragments[name], graph_type=graph_type)
+
+        return query
+
+    def split_incremental_selection_set(self, selection_set, graph_type):
+        deferred_selections = []
+        initial_selection_set = self._split_selection_set(
+            selection_set,
+            graph_type=graph_type,
+            path=(),
+            to_root_selection_set=lambda selection_set: selection_set,
+            deferred_selections=deferred_selections,
+        )
+        return initial_selection_set, deferred_selections
+
+    def _split_selection_set(self, selection_set, graph_type, path, to_root_selection_set, deferred_selections):
+        selections = []
+
+        for selection in selection_set.selections:
+            if not self._should_include_selection(selection):
+                pass
+
+            elif isinstance(selection, graphql_ast.FieldNode):
+                field = self._get_field(graph_type, selection.name.value)
+                field_path = path + (_field_key(selection), )
+
+                if _is_list_type(field.type):
+                    # Deferring within list elements is not supported, so
+                    # any @defer or @stream below a list is resolved eagerly.
+                    stream = self._read_incremental_directive(selection, incremental.stream_directive)
+                    if stream is None:
+                        selections.append(selection)
+                    elif stream["initialCount"] == 0:
+                        deferred_selections.append(_DeferredSelection(
+                            kind="stream",
+                            label=stream.get("label"),
+                            path=field_path,
+                            selection_set=to_root_selection_set(_selection_set_node((selection, ))),
+                            initial_count=0,
+                        ))
+                    else:
+                        selections.append(selection)
+                        deferred_selections.append(_DeferredSelection(
+                            kind="stream",
+                            label=stream.get("label"),
+                            path=field_path,
+                            selection_set=None,
+                            initial_count=stream["initialCount"],
+                        ))
+
+                elif selection.selection_set is None:
+                    selections.append(selection)
+
+                else:
+                    def to_field_root_selection_set(field_selection_set, selection=selection):
+                        return to_root_selection_set(_selection_set_node((
+                            _copy_with(selection, selection_set=field_selection_set),
+                        )))
+
+                    selections.append(_copy_with(selection, selection_set=self._split_selection_set(
+                        selection.selection_set,
+                        graph_type=field.type,
+                        path=field_path,
+                        to_root_selection_set=to_field_root_selection_set,
+                        deferred_selections=deferred_selections,
+                    )))
+
+            else:
+                if isinstance(selection, graphql_ast.FragmentSpreadNode):
+                    fragment = self._fragments[selection.name.value]
+                else:
+                    fragment = selection
+
+                if fragment.type_condition is None:
+                    fragment_type = graph_type
+                else:
+                    fragment_type = self._find_type(fragment.type_condition.name.value)
+
+                def to_fragment_root_selection_set(fragment_selection_set, type_condition=fragment.type_condition):
+                    return to_root_selection_set(_selection_set_node((
+                        graphql_ast.InlineFragmentNode(
+                            type_condition=type_condition,
+                            directives=(),
+                            selection_set=fragment_selection_set,
+                        ),
+                    )))
+
+                nested_deferred_selections = []
+                fragment_selection_set = self._split_selection_set(
+                    fragment.selection_set,
+                    graph_type=fragment_type,
+                    path=path,
+                    to_root_selection_set=to_fragment_root_selection_set,
+                    deferred_selections=nested_deferred_selections,
+                )
+
+                defer = self._read_incremental_directive(selection, incremental.defer_directive)
+                if defer is None:
+                    selections.append(graphql_ast.InlineFragmentNode(
+                        type_condition=fragment.type_condition,
+                        directives=(),
+                        selection_set=fragment_selection_set,
+                    ))
+                else:
+                    deferred_selections.append(_DeferredSelection(
+                        kind="defer",
+                        label=defer.get("label"),
+                        path=path,
+                        selection_set=to_fragment_root_selection_set(fragment_selection_set),
+                        initial_count=None,
+                    ))
+
+                deferred_selections.extend(nested_deferred_selections)
+
+        return _selection_set_node(selections)
+
+    def _read_incremental_directive(self, selection, directive_definition):
+        for directive in selection.directives:
+            if directive.name.value == directive_definition.name:
+                args = get_argument_values(directive_definition, directive, self._variables)
+                if args["if"]:
+                    return args
+
+        return None
+
     def _read_graphql_fragment(self, fragment, graph_type):
-        type_condition_type_name = fragment.type_condition.name.value
-        type_condition_type = self._find_type(type_condition_type_name)
+        if fragment.type_condition is None:
+            type_condition_type = schema.to_element_type(graph_type)
+        else:
+            type_condition_type = self._find_type(fragment.type_condition.name.value)
 
         query = self.read_selection_set(
             fragment.selection_set,
@@ -187,8 +683,11 @@ class Parser(object):
 
         def get_arg_value(arg):
             param = self._lookup_camel_case_name(field.params, arg.name.value)
-            value = self._read_value_node(arg.value, value_type=param.type)
-            return param(value)
+            if _has_variables(arg.value):
+                return schema.Argument(parameter=param, value=_UnboundArgumentValue(param, arg.value))
+            else:
+                value = self._read_value_node(arg.value, value_type=param.type)
+                return param(value)
 
         args = [
             get_arg_value(arg)
@@ -211,43 +710,7 @@ class Parser(object):
 
     def _read_value_node(self, value, value_type):
         graphql_value = self._read_graphql_value(value)
-        return self._convert_graphql_value(graphql_value, value_type=value_type)
-
-    def _convert_graphql_value(self, graphql_value, value_type):
-        if isinstance(value_type, schema.EnumType):
-            enum_values = list(filter(
-                lambda enum_value: enum_value.value == graphql_value,
-                value_type.enum,
-            ))
-            return enum_values[0]
-
-        elif isinstance(value_type, schema.NullableType):
-            if graphql_value is None:
-                return None
-            else:
-                return self._convert_graphql_value(graphql_value, value_type=value_type.element_type)
-
-        elif value_type in (schema.Boolean, schema.Float, schema.Int, schema.String):
-            return graphql_value
-
-        elif isinstance(value_type, schema.ListType):
-            return [
-                self._convert_graphql_value(element, value_type=value_type.element_type)
-                for element in graphql_value
-            ]
-
-        elif isinstance(value_type, schema.InputObjectType):
-            def get_field(key, value):
-                field = self._lookup_camel_case_name(value_type.fields, key)
-                return field.name, self._convert_graphql_value(value, value_type=field.type)
-
-            return value_type(**to_dict(
-                get_field(key, value)
-                for key, value in graphql_value.items()
-            ))
-
-        else:
-            raise ValueError("unhandled type: {}".format(type(value_type)))
+        return self._input_converter(value_type)(graphql_value)
 
     def _read_graphql_value(self, value):
         if isinstance(value, graphql_ast.BooleanValueNode):
@@ -282,11 +745,7 @@ class Parser(object):
         return self._types[name]
 
     def _lookup_camel_case_name(self, collection, camel_case_name):
-        lookup = to_dict(
-            (snake_case_to_camel_case(element.name), element)
-            for element in collection
-        )
-        return lookup[camel_case_name]
+        return collection.index(snake_case_to_camel_case)[camel_case_name]
 
 
 def _field_key(selection):
@@ -296,6 +755,17 @@ def _field_key(selection):
         return selection.alias.value
 
 
+def _is_list_type(graph_type):
+    if isinstance(graph_type, schema.NullableType):
+        graph_type = graph_type.element_type
+
+    return isinstance(graph_type, schema.ListType)
+
+
+def _selection_set_node(selections):
+    return graphql_ast.SelectionSetNode(selections=tuple(selections))
+
+
 def _copy_with(obj, **kwargs):
     result = copy(obj)
     for key, value in kwargs.items():
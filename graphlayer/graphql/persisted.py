@@ -0,0 +1,176 @@
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+
+
+def document_hash(document_text):
+    return hashlib.sha256(document_text.encode("utf-8")).hexdigest()
+
+
+# Document stores record whether each document is trusted. Only documents
+# added by the application should be trusted: documents registered by
+# clients through automatic persisted queries never are.
+
+class InMemoryDocumentStore(object):
+    def __init__(self, documents=None, *, trusted=False):
+        if documents is None:
+            documents = {}
+
+        self._lock = threading.Lock()
+        self._documents = dict(
+            (document_hash, (document_text, trusted))
+            for document_hash, document_text in documents.items()
+        )
+
+    def get(self, document_hash):
+        document = self._documents.get(document_hash)
+        if document is None:
+            return None
+        else:
+            return document[0]
+
+    def set(self, document_hash, document_text, *, trusted=False):
+        with self._lock:
+            existing_document = self._documents.get(document_hash)
+            is_trusted = trusted or (existing_document is not None and existing_document[1])
+            self._documents[document_hash] = (document_text, is_trusted)
+
+    def items(self):
+        return tuple(
+            (document_hash, document_text)
+            for document_hash, (document_text, trusted) in self._documents.items()
+        )
+
+    def trusted_items(self):
+        return tuple(
+            (document_hash, document_text)
+            for document_hash, (document_text, trusted) in self._documents.items()
+            if trusted
+        )
+
+
+class FileDocumentStore(object):
+    # Each document is written to its own file so that several processes
+    # can register documents in the same directory without losing any.
+    # The name of the file records whether the document is trusted.
+
+    def __init__(self, path, *, max_untrusted_documents=None):
+        self._path = path
+        self._max_untrusted_documents = max_untrusted_documents
+        os.makedirs(path, exist_ok=True)
+
+    def get(self, document_hash):
+        if not _is_document_hash(document_hash):
+            return None
+
+        for trusted in (True, False):
+            try:
+                with open(self._document_path(document_hash, trusted=trusted), encoding="utf-8") as fileobj:
+                    return json.load(fileobj)["text"]
+            except (OSError, ValueError, KeyError):
+                pass
+
+        return None
+
+    def set(self, document_hash, document_text, *, trusted=False):
+        if not _is_document_hash(document_hash):
+            raise ValueError("invalid document hash: {!r}".format(document_hash))
+
+        if os.path.exists(self._document_path(document_hash, trusted=True)):
+            return
+
+        if not trusted and os.path.exists(self._document_path(document_hash, trusted=False)):
+            return
+
+        self._write(self._document_path(document_hash, trusted=trusted), document_text)
+
+        if trusted:
+            _remove(self._document_path(document_hash, trusted=False))
+        elif self._max_untrusted_documents is not None:
+            self._evict_untrusted_documents()
+
+    def items(self):
+        return self._read_items(lambda trusted: True)
+
+    def trusted_items(self):
+        return self._read_items(lambda trusted: trusted)
+
+    def _read_items(self, predicate):
+        items = []
+
+        for document_hash, trusted in self._list_documents():
+            if predicate(trusted):
+                document_text = self.get(document_hash)
+                if document_text is not None:
+                    items.append((document_hash, document_text))
+
+        return tuple(items)
+
+    def _list_documents(self):
+        documents = {}
+
+        for filename in os.listdir(self._path):
+            match = _filename_pattern.match(filename)
+            if match is not None:
+                document_hash = match.group(1)
+                trusted = match.group(2) is not None
+                documents[document_hash] = documents.get(document_hash, False) or trusted
+
+        return sorted(documents.items())
+
+    def _evict_untrusted_documents(self):
+        untrusted_paths = [
+            self._document_path(document_hash, trusted=False)
+            for document_hash, trusted in self._list_documents()
+            if not trusted
+        ]
+
+        excess = len(untrusted_paths) - self._max_untrusted_documents
+        if excess > 0:
+            untrusted_paths.sort(key=_modified_time)
+            for path in untrusted_paths[:excess]:
+                _remove(path)
+
+    def _write(self, path, document_text):
+        fd, temporary_path = tempfile.mkstemp(dir=self._path, prefix=".graphlayer-document-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fileobj:
+                json.dump({"text": document_text}, fileobj)
+            os.replace(temporary_path, path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+    def _document_path(self, document_hash, *, trusted):
+        if trusted:
+            filename = "{}.trusted.json".format(document_hash)
+        else:
+            filename = "{}.json".format(document_hash)
+
+        return os.path.join(self._path, filename)
+
+
+_document_hash_pattern = re.compile(r"^[0-9a-f]{64}$")
+
+_filename_pattern = re.compile(r"^([0-9a-f]{64})(\.trusted)?\.json$")
+
+
+def _is_document_hash(value):
+    return isinstance(value, str) and _document_hash_pattern.match(value) is not None
+
+
+def _modified_time(path):
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return 0
+
+
+def _remove(path):
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,107 @@
+import copy
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+from .. import caches
+from ..representations import canonical_repr
+
+
+class InMemoryResponseCache(object):
+    def __init__(self, *, max_size=1024, clock=time.monotonic):
+        self._entries = caches.LruCache(max_size=max_size)
+        self._clock = clock
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            return None
+        else:
+            # Callers own the results they're given, so they mustn't be able
+            # to change the cached value.
+            return copy.deepcopy(value)
+
+    def set(self, key, value, *, max_age):
+        self._entries.set(key, (self._clock() + max_age, copy.deepcopy(value)))
+
+    def stats(self):
+        return self._entries.stats()
+
+
+class FileResponseCache(object):
+    def __init__(self, path, *, max_size=1024, clock=time.time):
+        self._path = path
+        self._max_size = max_size
+        self._clock = clock
+        os.makedirs(path, exist_ok=True)
+
+    def get(self, key):
+        entry_key = canonical_repr(key)
+
+        try:
+            with open(self._entry_path(entry_key), "r", encoding="utf-8") as fileobj:
+                entry = json.load(fileobj)
+        except (OSError, ValueError):
+            return None
+
+        if entry.get("key") != entry_key or entry.get("expires_at", 0) <= self._clock():
+            return None
+        else:
+            return entry.get("value")
+
+    def set(self, key, value, *, max_age):
+        entry_key = canonical_repr(key)
+        now = self._clock()
+
+        # Values are stored as JSON rather than pickled so that reading the
+        # cache directory can never execute code.
+        try:
+            encoded_entry = json.dumps({"key": entry_key, "expires_at": now + max_age, "value": value})
+        except (TypeError, ValueError):
+            return
+
+        fd, temporary_path = tempfile.mkstemp(dir=self._path, prefix=".graphlayer-response-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fileobj:
+                fileobj.write(encoded_entry)
+            # The modification time records when the entry expires so that
+            # eviction doesn't need to read every entry.
+            os.utime(temporary_path, (now + max_age, now + max_age))
+            os.replace(temporary_path, self._entry_path(entry_key))
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+        self._evict(now)
+
+    def _evict(self, now):
+        entries = []
+        for name in os.listdir(self._path):
+            if not name.startswith("."):
+                entry_path = os.path.join(self._path, name)
+                try:
+                    entries.append((os.path.getmtime(entry_path), entry_path))
+                except OSError:
+                    pass
+
+        entries.sort(reverse=True)
+        for index, (expires_at, entry_path) in enumerate(entries):
+            if index >= self._max_size or expires_at <= now:
+                _remove(entry_path)
+
+    def _entry_path(self, entry_key):
+        key_hash = hashlib.sha256(entry_key.encode("utf-8")).hexdigest()
+        return os.path.join(self._path, key_hash)
+
+
+def _remove(path):
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
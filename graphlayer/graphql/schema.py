@@ -1,21 +1,144 @@
+import hashlib
+import json
+import os
+import tempfile
+
 import graphql
 
 from .. import iterables, schema
+from ..memo import memoize
+from . import incremental, inputs, introspection
 from .naming import snake_case_to_camel_case
 
 
 class Schema(object):
-    def __init__(self, query_type, mutation_type, types, graphql_schema):
+    def __init__(self, query_type, mutation_type, types, graphql_schema, introspection_result=None):
         self.query_type = query_type
         self.mutation_type = mutation_type
         self.types = types
-        self.graphql_schema = graphql_schema
+        self._graphql_schema = memoize(graphql_schema)
+        if introspection_result is None:
+            self.introspection = memoize(lambda: introspection.introspect(self.graphql_schema))
+        else:
+            self.introspection = memoize(introspection_result)
+        self.all_types_by_name = memoize(self._collect_types_by_name)
+        self._input_converters = {}
+
+    @property
+    def graphql_schema(self):
+        return self._graphql_schema()
+
+    def to_snapshot(self):
+        return {
+            "fingerprint": schema_fingerprint(self.query_type, self.mutation_type, self.types),
+            "introspection": self.introspection(),
+        }
+
+    def input_converter(self, graph_type):
+        converter = self._input_converters.get(graph_type)
+        if converter is None:
+            converter = self._input_converters[graph_type] = inputs.compile_input_converter(
+                graph_type,
+                self.input_converter,
+            )
+
+        return converter
+
+    def _collect_types_by_name(self):
+        all_types = schema.collect_types((self.query_type, self.mutation_type) + tuple(self.types))
+        return iterables.to_dict(
+            (graph_type.name, graph_type)
+            for graph_type in all_types
+            if hasattr(graph_type, "name")
+        )
 
 
-def create_graphql_schema(query_type, mutation_type, types=None):
+def create_graphql_schema(query_type, mutation_type, types=None, *, snapshot=None):
     if types is None:
         types = ()
 
+    # Snapshots of a different schema would silently describe the wrong
+    # types, so the schema is built from scratch instead.
+    if snapshot is not None and snapshot.get("fingerprint") != schema_fingerprint(query_type, mutation_type, types):
+        snapshot = None
+
+    if snapshot is None:
+        introspection_result = None
+        graphql_schema = lambda: _build_graphql_schema(query_type=query_type, mutation_type=mutation_type, types=types)
+    else:
+        introspection_result = snapshot["introspection"]
+        graphql_schema = lambda: graphql.build_client_schema({"__schema": introspection_result})
+
+    return Schema(
+        query_type=query_type,
+        mutation_type=mutation_type,
+        types=types,
+        graphql_schema=graphql_schema,
+        introspection_result=introspection_result,
+    )
+
+
+def write_schema_snapshot(graphql_schema, path):
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temporary_path = tempfile.mkstemp(dir=directory, prefix=".graphlayer-schema-")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fileobj:
+            json.dump(graphql_schema.to_snapshot(), fileobj)
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.unlink(temporary_path)
+        raise
+
+
+def read_schema_snapshot(path):
+    with open(path, encoding="utf-8") as fileobj:
+        return json.load(fileobj)
+
+
+def schema_fingerprint(query_type, mutation_type, types):
+    all_types = schema.collect_types((query_type, mutation_type) + tuple(types))
+    description = [
+        _type_name(query_type),
+        _type_name(mutation_type),
+        sorted(
+            _describe_type(graph_type)
+            for graph_type in all_types
+            if hasattr(graph_type, "name")
+        ),
+    ]
+    return hashlib.sha256(json.dumps(description).encode("utf-8")).hexdigest()
+
+
+def _describe_type(graph_type):
+    if isinstance(graph_type, schema.EnumType):
+        return ["enum", graph_type.name, [str(member.value) for member in graph_type.enum]]
+    elif isinstance(graph_type, schema.InputObjectType):
+        return ["input", graph_type.name, [
+            [field.name, str(field.type), repr(field.default) if field.has_default else None]
+            for field in graph_type.fields
+        ]]
+    elif isinstance(graph_type, (schema.InterfaceType, schema.ObjectType)):
+        return [
+            type(graph_type).__name__,
+            graph_type.name,
+            sorted(interface.name for interface in getattr(graph_type, "interfaces", ())),
+            [
+                [field.name, str(field.type), [
+                    [param.name, str(param.type), repr(param.default) if param.has_default else None]
+                    for param in field.params
+                ]]
+                for field in graph_type.fields
+            ],
+        ]
+    else:
+        return [type(graph_type).__name__, graph_type.name]
+
+
+def _type_name(graph_type):
+    return None if graph_type is None else graph_type.name
+
+
+def _build_graphql_schema(query_type, mutation_type, types):
     graphql_types = {}
 
     def to_graphql_type(graph_type):
@@ -118,15 +241,11 @@ def create_graphql_schema(query_type, mutation_type, types=None):
     for extra_type in types:
         to_graphql_type(extra_type)
 
-    return Schema(
-        query_type=query_type,
-        mutation_type=mutation_type,
-        types=types,
-        graphql_schema=graphql.GraphQLSchema(
-            query=graphql_query_type,
-            mutation=graphql_mutation_type,
-            types=tuple(map(_to_base_type, graphql_types.values())),
-        ),
+    return graphql.GraphQLSchema(
+        query=graphql_query_type,
+        mutation=graphql_mutation_type,
+        types=tuple(map(_to_base_type, graphql_types.values())),
+        directives=incremental.directives,
     )
 
 
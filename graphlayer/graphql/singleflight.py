@@ -0,0 +1,84 @@
+from concurrent.futures import Future
+import json
+import threading
+
+from graphql import GraphQLError
+from graphql.language import ast as graphql_ast
+
+from .. import GraphError
+
+
+class SingleFlightStats(object):
+    def __init__(self, *, executions, shared):
+        self.executions = executions
+        self.shared = shared
+
+    def __repr__(self):
+        return "SingleFlightStats(executions={!r}, shared={!r})".format(self.executions, self.shared)
+
+
+def single_flight(execute):
+    in_flight = {}
+    lock = threading.Lock()
+    counts = {"executions": 0, "shared": 0}
+
+    def execute_single_flight(document_text=None, *, graph, scope, variables=None, document_hash=None):
+        def execute_document():
+            return execute(document_text, graph=graph, variables=variables, document_hash=document_hash)
+
+        key = _request_key(execute, document_text, document_hash=document_hash, variables=variables, scope=scope)
+        if key is None:
+            return execute_document()
+
+        with lock:
+            future = in_flight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = in_flight[key] = Future()
+                counts["executions"] += 1
+            else:
+                counts["shared"] += 1
+
+        if not is_leader:
+            return future.result()
+
+        try:
+            result = execute_document()
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with lock:
+                del in_flight[key]
+
+    def stats():
+        with lock:
+            return SingleFlightStats(**counts)
+
+    execute_single_flight.stats = stats
+
+    return execute_single_flight
+
+
+def _request_key(execute, document_text, *, document_hash, variables, scope):
+    try:
+        operation = execute.document_operation(document_text, document_hash=document_hash)
+        fingerprint = execute.document_fingerprint(document_text, document_hash=document_hash)
+    except (GraphQLError, GraphError):
+        # Let the executor report the error for each request.
+        return None
+
+    # Each mutation must be executed, even if an identical mutation is
+    # already in flight.
+    if operation != graphql_ast.OperationType.QUERY:
+        return None
+
+    try:
+        canonical_variables = json.dumps(variables or {}, sort_keys=True, separators=(",", ":"))
+    except TypeError:
+        return None
+
+    return (fingerprint, canonical_variables, scope)
@@ -0,0 +1,196 @@
+import enum
+import json
+
+from graphql import GraphQLError
+
+from .. import GraphError, schema
+
+
+def iter_data_chunks(graph_query, data, schema_data, *, chunk_size):
+    return _iter_chunks(_iter_data_text(graph_query, data, schema_data), chunk_size=chunk_size)
+
+
+def iter_errors_chunks(errors, *, chunk_size):
+    return _iter_chunks(iter((json.dumps({"errors": [error.formatted for error in errors]}), )), chunk_size=chunk_size)
+
+
+def _iter_data_text(graph_query, data, schema_data):
+    yield '{"data":{'
+
+    separator = ""
+
+    if graph_query is not None:
+        try:
+            for field_query in graph_query.field_queries:
+                yield separator + json.dumps(field_query.key) + ":"
+                separator = ","
+                yield from _iter_value_text(_compile_writer(field_query.type_query), data[field_query.key])
+        except (GraphQLError, GraphError) as error:
+            # Lists may be produced lazily, so errors can happen after part
+            # of the data has been sent. The data can't be taken back, so
+            # it's truncated at the error and followed by the error.
+            if isinstance(error, GraphError):
+                error = GraphQLError(str(error))
+            yield '},"errors":' + json.dumps([error.formatted]) + "}"
+            return
+
+    if schema_data is not None:
+        for key, value in schema_data.items():
+            yield separator + json.dumps(key) + ":" + json.dumps(value)
+            separator = ","
+
+    yield "}}"
+
+
+def _iter_value_text(writer, value):
+    if writer.is_streaming:
+        return writer.iter_text(value)
+    else:
+        return iter((writer.to_text(value), ))
+
+
+def _iter_chunks(texts, *, chunk_size):
+    parts = []
+    size = 0
+
+    for text in texts:
+        parts.append(text)
+        size += len(text)
+
+        if size >= chunk_size:
+            yield "".join(parts).encode("utf-8")
+            parts = []
+            size = 0
+
+    if parts:
+        yield "".join(parts).encode("utf-8")
+
+
+class _TextWriter(object):
+    is_streaming = False
+
+    def __init__(self, to_text):
+        self.to_text = to_text
+
+
+class _StreamingWriter(object):
+    is_streaming = True
+
+    def __init__(self, iter_text):
+        self.iter_text = iter_text
+
+
+def _compile_writer(query):
+    if isinstance(query, schema.ObjectQuery):
+        return _compile_object_writer(query)
+
+    elif isinstance(query, schema.ListQuery):
+        return _compile_list_writer(query)
+
+    elif isinstance(query, schema.NullableQuery):
+        return _compile_nullable_writer(query)
+
+    elif isinstance(query, schema.EnumQuery):
+        return _TextWriter(_enum_to_text)
+
+    else:
+        return _TextWriter(json.dumps)
+
+
+def _compile_object_writer(query):
+    field_writers = tuple(
+        (json.dumps(field_query.key) + ":", field_query.key, _compile_writer(field_query.type_query))
+        for field_query in query.field_queries
+    )
+
+    if any(writer.is_streaming for _, _, writer in field_writers):
+        def iter_text(value):
+            separator = "{"
+            try:
+                for prefix, key, writer in field_writers:
+                    yield separator + prefix
+                    separator = ","
+                    yield from _iter_value_text(writer, value[key])
+            except (GraphQLError, GraphError):
+                # Close the object so that the response is still valid JSON.
+                yield "{}" if separator == "{" else "}"
+                raise
+
+            yield "{}" if separator == "{" else "}"
+
+        return _StreamingWriter(iter_text)
+
+    else:
+        def to_text(value):
+            return "{" + ",".join(
+                prefix + writer.to_text(value[key])
+                for prefix, key, writer in field_writers
+            ) + "}"
+
+        return _TextWriter(to_text)
+
+
+def _compile_list_writer(query):
+    element_writer = _compile_writer(query.element_query)
+
+    if element_writer.is_streaming:
+        def iter_text(value):
+            separator = "["
+            try:
+                for element in value:
+                    yield separator
+                    separator = ","
+                    yield from element_writer.iter_text(element)
+            except (GraphQLError, GraphError):
+                yield "[]" if separator == "[" else "]"
+                raise
+
+            yield "[]" if separator == "[" else "]"
+
+    else:
+        element_to_text = element_writer.to_text
+
+        def iter_text(value):
+            separator = "["
+            try:
+                for element in value:
+                    yield separator + element_to_text(element)
+                    separator = ","
+            except (GraphQLError, GraphError):
+                yield "[]" if separator == "[" else "]"
+                raise
+
+            yield "[]" if separator == "[" else "]"
+
+    return _StreamingWriter(iter_text)
+
+
+def _compile_nullable_writer(query):
+    element_writer = _compile_writer(query.element_query)
+
+    if element_writer.is_streaming:
+        def iter_text(value):
+            if value is None:
+                yield "null"
+            else:
+                yield from element_writer.iter_text(value)
+
+        return _StreamingWriter(iter_text)
+
+    else:
+        element_to_text = element_writer.to_text
+
+        def to_text(value):
+            if value is None:
+                return "null"
+            else:
+                return element_to_text(value)
+
+        return _TextWriter(to_text)
+
+
+def _enum_to_text(value):
+    if isinstance(value, enum.Enum):
+        value = value.value
+
+    return json.dumps(value)
@@ -0,0 +1,64 @@
+from graphql.validation import (
+    ExecutableDefinitionsRule,
+    FieldsOnCorrectTypeRule,
+    FragmentsOnCompositeTypesRule,
+    KnownArgumentNamesRule,
+    KnownDirectivesRule,
+    KnownFragmentNamesRule,
+    KnownTypeNamesRule,
+    NoFragmentCyclesRule,
+    NoUndefinedVariablesRule,
+    OverlappingFieldsCanBeMergedRule,
+    PossibleFragmentSpreadsRule,
+    ProvidedRequiredArgumentsRule,
+    ScalarLeafsRule,
+    specified_rules,
+    validate as graphql_validate,
+    ValuesOfCorrectTypeRule,
+    VariablesAreInputTypesRule,
+    VariablesInAllowedPositionRule,
+)
+
+
+# Rules that documents must satisfy for graphlayer to read them correctly.
+# Rules that only reject redundant documents, such as NoUnusedFragmentsRule,
+# are left out. OverlappingFieldsCanBeMergedRule is kept since conflicting
+# fields with the same response key can't be merged into a single query.
+essential_rules = (
+    ExecutableDefinitionsRule,
+    KnownTypeNamesRule,
+    FragmentsOnCompositeTypesRule,
+    VariablesAreInputTypesRule,
+    ScalarLeafsRule,
+    FieldsOnCorrectTypeRule,
+    KnownFragmentNamesRule,
+    PossibleFragmentSpreadsRule,
+    NoFragmentCyclesRule,
+    NoUndefinedVariablesRule,
+    KnownDirectivesRule,
+    KnownArgumentNamesRule,
+    ValuesOfCorrectTypeRule,
+    ProvidedRequiredArgumentsRule,
+    VariablesInAllowedPositionRule,
+    OverlappingFieldsCanBeMergedRule,
+)
+
+
+class ValidationPolicy(object):
+    def __init__(self, *, rules=None, trusted_rules=None):
+        if rules is None:
+            rules = specified_rules
+
+        if trusted_rules is None:
+            trusted_rules = rules
+
+        self.rules = tuple(rules)
+        self.trusted_rules = tuple(trusted_rules)
+
+    def validate(self, graphql_schema, document_ast, *, trusted):
+        rules = self.trusted_rules if trusted else self.rules
+
+        if rules:
+            return graphql_validate(graphql_schema, document_ast, rules=rules)
+        else:
+            return []
@@ -11,7 +11,7 @@ class Object(object):
         return bool(self._values)
 
     def __hash__(self):
-        return hash(self._values)
+        return hash(freeze(self._values))
 
     def __eq__(self, other):
         if isinstance(other, Object):
@@ -24,3 +24,36 @@ class Object(object):
 
     def __repr__(self):
         return "Object({!r})".format(self._values)
+
+
+def freeze(value):
+    if isinstance(value, dict):
+        return frozenset(
+            (key, freeze(element))
+            for key, element in value.items()
+        )
+    elif isinstance(value, (list, tuple)):
+        return tuple(map(freeze, value))
+    elif isinstance(value, (set, frozenset)):
+        return frozenset(map(freeze, value))
+    elif isinstance(value, Object):
+        return (type(value), freeze(value._values))
+    else:
+        return value
+
+
+def canonical_repr(value):
+    if isinstance(value, dict):
+        return "{" + ", ".join(sorted(
+            "{!r}: {}".format(key, canonical_repr(element))
+            for key, element in value.items()
+        )) + "}"
+    elif isinstance(value, (list, tuple)):
+        return "[" + ", ".join(map(canonical_repr, value)) + "]"
+    elif isinstance(value, (set, frozenset)):
+        return "{" + ", ".join(sorted(map(canonical_repr, value))) + "}"
+    elif isinstance(value, Object):
+        return type(value).__name__ + canonical_repr(value._values)
+    else:
+        return repr(value)
+
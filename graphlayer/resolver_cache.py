@@ -0,0 +1,330 @@
+import contextvars
+import hashlib
+import inspect
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from . import caches, core
+from .representations import canonical_repr, Object
+
+
+def cached(cache, *, max_age, scope=None, name=None):
+    def decorate(resolver):
+        resolver_name = _qualified_name(resolver) if name is None else name
+
+        @core.dependencies(injector=core.Injector)
+        def resolve(graph, query, *args, injector):
+            key = None if args else _cache_key(resolver_name, query, scope, injector)
+
+            if key is None:
+                return injector.call_with_dependencies(resolver, graph, query, *args)
+
+            entry = cache.get(key)
+            if entry is not None:
+                tables, value = entry
+                record_tables(tables)
+                return value
+
+            epoch = cache.epoch()
+            tables = set()
+            collectors = _table_collectors.set(_table_collectors.get() + (tables, ))
+            try:
+                value = injector.call_with_dependencies(resolver, graph, query)
+            finally:
+                _table_collectors.reset(collectors)
+
+            record_tables(tables)
+
+            if not inspect.isawaitable(value):
+                cache.set(key, value, tables=frozenset(tables), max_age=max_age, epoch=epoch)
+
+            return value
+
+        resolve.type = resolver.type
+        memoize = getattr(resolver, "memoize", None)
+        if memoize is not None:
+            resolve.memoize = memoize
+
+        return resolve
+
+    return decorate
+
+
+def _cache_key(resolver_name, query, scope, injector):
+    fingerprint = getattr(query, "fingerprint", None)
+    if fingerprint is None:
+        return None
+
+    query_fingerprint = fingerprint()
+    if query_fingerprint is None:
+        return None
+
+    scope_value = None if scope is None else injector.call_with_dependencies(scope)
+
+    return hashlib.sha256("\0".join((
+        resolver_name,
+        query_fingerprint,
+        canonical_repr(scope_value),
+    )).encode("utf-8")).hexdigest()
+
+
+_table_collectors = contextvars.ContextVar("graphlayer.resolver_cache.table_collectors", default=())
+
+
+def is_recording_tables():
+    return bool(_table_collectors.get())
+
+
+def record_tables(tables):
+    for collector in _table_collectors.get():
+        collector.update(tables)
+
+
+class InMemoryResolverCache(object):
+    def __init__(self, *, max_size=1024, clock=time.monotonic):
+        self._entries = caches.LruCache(max_size=max_size)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._generations = {}
+        self._epoch = 0
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key):
+        entry = self._entries.get(key)
+
+        if entry is not None:
+            expires_at, generations, value = entry
+            if expires_at <= self._clock() or not self._is_current(generations):
+                entry = None
+
+        with self._lock:
+            if entry is None:
+                self._misses += 1
+                return None
+            else:
+                self._hits += 1
+
+        return frozenset(generations), value
+
+    def set(self, key, value, *, tables, max_age, epoch):
+        with self._lock:
+            # Tables may have changed while the value was being resolved.
+            if epoch != self._epoch:
+                return
+
+            generations = tuple(
+                (table, self._generations.get(table, 0))
+                for table in tables
+            )
+
+        self._entries.set(key, (self._clock() + max_age, dict(generations), value))
+
+    def epoch(self):
+        return self._epoch
+
+    def invalidate(self, tables):
+        with self._lock:
+            self._epoch += 1
+            for table in tables:
+                self._generations[table] = self._generations.get(table, 0) + 1
+
+    def stats(self):
+        entries_stats = self._entries.stats()
+        with self._lock:
+            return caches.CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=entries_stats.evictions,
+                size=entries_stats.size,
+                max_size=entries_stats.max_size,
+            )
+
+    def _is_current(self, generations):
+        current_generations = self._generations
+        return all(
+            current_generations.get(table, 0) == generation
+            for table, generation in generations.items()
+        )
+
+
+class SqliteResolverCache(object):
+    def __init__(self, path, *, max_size=1024, clock=time.time):
+        self._path = path
+        self._max_size = max_size
+        self._clock = clock
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connection() as connection:
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS entries (
+                    key TEXT PRIMARY KEY,
+                    expires_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    generations TEXT NOT NULL,
+                    value TEXT NOT NULL
+                )
+            """)
+            connection.execute("CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at)")
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS generations (
+                    table_name TEXT PRIMARY KEY,
+                    generation INTEGER NOT NULL
+                )
+            """)
+
+    def get(self, key):
+        with self._connection() as connection:
+            row = connection.execute(
+                "SELECT expires_at, generations, value FROM entries WHERE key = ?",
+                (key, ),
+            ).fetchone()
+
+            if row is not None:
+                expires_at, generations, value = row
+                generations = json.loads(generations)
+
+                if expires_at <= self._clock() or generations != self._generations(connection, generations):
+                    row = None
+                else:
+                    connection.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (self._clock(), key))
+
+        with self._stats_lock:
+            if row is None:
+                self._misses += 1
+                return None
+            else:
+                self._hits += 1
+
+        return frozenset(generations), _decode(json.loads(value))
+
+    def set(self, key, value, *, tables, max_age, epoch):
+        try:
+            encoded_value = json.dumps(_encode(value))
+        except _Unencodable:
+            return
+
+        with self._connection() as connection:
+            if epoch != self._epoch(connection):
+                return
+
+            now = self._clock()
+            connection.execute(
+                "INSERT OR REPLACE INTO entries (key, expires_at, accessed_at, generations, value) VALUES (?, ?, ?, ?, ?)",
+                (key, now + max_age, now, json.dumps(self._generations(connection, tables)), encoded_value),
+            )
+            self._evict(connection, now)
+
+    def epoch(self):
+        with self._connection() as connection:
+            return self._epoch(connection)
+
+    def invalidate(self, tables):
+        with self._connection() as connection:
+            for table in (_epoch_table, ) + tuple(tables):
+                connection.execute(
+                    "INSERT INTO generations (table_name, generation) VALUES (?, 1) "
+                    "ON CONFLICT (table_name) DO UPDATE SET generation = generation + 1",
+                    (table, ),
+                )
+
+    def stats(self):
+        with self._connection() as connection:
+            size, = connection.execute("SELECT COUNT(*) FROM entries").fetchone()
+
+        with self._stats_lock:
+            return caches.CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=size,
+                max_size=self._max_size,
+            )
+
+    def _evict(self, connection, now):
+        evictions = connection.execute("DELETE FROM entries WHERE expires_at <= ?", (now, )).rowcount
+        evictions += connection.execute(
+            "DELETE FROM entries WHERE key IN ("
+            "SELECT key FROM entries ORDER BY accessed_at DESC LIMIT -1 OFFSET ?"
+            ")",
+            (self._max_size, ),
+        ).rowcount
+
+        with self._stats_lock:
+            self._evictions += evictions
+
+    def _epoch(self, connection):
+        return self._generations(connection, (_epoch_table, ))[_epoch_table]
+
+    def _generations(self, connection, tables):
+        tables = sorted(tables)
+        generations = dict.fromkeys(tables, 0)
+        if tables:
+            generations.update(connection.execute(
+                "SELECT table_name, generation FROM generations WHERE table_name IN ({})".format(
+                    ", ".join("?" for _ in tables),
+                ),
+                tables,
+            ).fetchall())
+        return generations
+
+    def _connection(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self._path, timeout=30)
+            self._local.connection = connection
+        return connection
+
+
+_epoch_table = ""
+
+
+class _Unencodable(Exception):
+    pass
+
+
+# Values are stored as JSON rather than pickled so that reading the cache
+# file can never execute code.
+def _encode(value):
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    elif isinstance(value, list):
+        return [_encode(element) for element in value]
+    elif isinstance(value, tuple):
+        return {"tuple": [_encode(element) for element in value]}
+    elif isinstance(value, dict):
+        return {"dict": [[_encode(key), _encode(element)] for key, element in value.items()]}
+    elif type(value) is Object:
+        return {"object": [[key, _encode(element)] for key, element in value._values.items()]}
+    else:
+        raise _Unencodable()
+
+
+def _decode(value):
+    if isinstance(value, list):
+        return [_decode(element) for element in value]
+    elif isinstance(value, dict):
+        (kind, elements), = value.items()
+        if kind == "tuple":
+            return tuple(_decode(element) for element in elements)
+        elif kind == "dict":
+            return {_decode(key): _decode(element) for key, element in elements}
+        else:
+            return Object({key: _decode(element) for key, element in elements})
+    else:
+        return value
+
+
+def _qualified_name(value):
+    return "{}.{}".format(value.__module__, value.__qualname__)
@@ -1,3 +1,6 @@
+import asyncio
+import inspect
+
 from . import core, iterables, schema
 
 
@@ -12,8 +15,12 @@ def create_object_builder(object_query):
         [field_query.key, default_field_resolver(field_query.field)]
         for field_query in object_query.field_queries
     ]
+    pending_field_resolvers = []
 
     def create_object(value):
+        if pending_field_resolvers:
+            raise core.GraphError("asynchronous field resolvers must be awaited using resolve_fields_async")
+
         return object_query.create_object(iterables.to_dict(
             (key, resolve_field(value))
             for key, resolve_field in field_resolvers
@@ -23,7 +30,11 @@ def create_object_builder(object_query):
         def add_field_resolver(build_field_resolver):
             for field_index, field_query in enumerate(object_query.field_queries):
                 if field_query.field == field or field_query.field.name == field:
-                    field_resolvers[field_index][1] = build_field_resolver(field_query)
+                    resolve_field = build_field_resolver(field_query)
+                    if inspect.isawaitable(resolve_field):
+                        pending_field_resolvers.append((field_index, resolve_field))
+                    else:
+                        field_resolvers[field_index][1] = resolve_field
 
             return build_field_resolver
 
@@ -31,6 +42,21 @@ def create_object_builder(object_query):
 
     create_object.field = field_resolver
 
+    async def resolve_fields_async():
+        pending = pending_field_resolvers[:]
+        del pending_field_resolvers[:]
+
+        resolved = await asyncio.gather(*(
+            resolve_field
+            for _, resolve_field in pending
+        ))
+        for (field_index, _), resolve_field in zip(pending, resolved):
+            field_resolvers[field_index][1] = resolve_field
+
+        return create_object
+
+    create_object.resolve_fields_async = resolve_fields_async
+
     def getter(field):
         def add_field_resolver(resolve_field):
             return field_resolver(field)(lambda field_query: resolve_field)
@@ -75,14 +101,32 @@ def root_object_resolver(type):
     @core.dependencies(injector=core.Injector)
     def resolve_root(graph, query, *, injector):
         build_object = create_object_builder(query)
+        is_async = False
+
+        async def resolve_field_async(field_resolver, field_query):
+            value = await injector.call_with_dependencies(field_resolver, graph, field_query.type_query, field_query.args)
+            return lambda _: value
 
         for field, field_handler in field_handlers.items():
             @build_object.field(field)
             def resolve_field(field_query):
-                field_resolver = field_handlers[field_query.field]
-                return lambda _: injector.call_with_dependencies(field_resolver, graph, field_query.type_query, field_query.args)
+                nonlocal is_async
 
-        return build_object(None)
+                field_resolver = field_handlers[field_query.field]
+                if inspect.iscoroutinefunction(field_resolver):
+                    is_async = True
+                    return resolve_field_async(field_resolver, field_query)
+                else:
+                    return lambda _: injector.call_with_dependencies(field_resolver, graph, field_query.type_query, field_query.args)
+
+        async def resolve_async():
+            await build_object.resolve_fields_async()
+            return build_object(None)
+
+        if is_async:
+            return resolve_async()
+        else:
+            return build_object(None)
 
     def field(field):
         def add_handler(handle):
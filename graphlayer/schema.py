@@ -1,8 +1,10 @@
-from functools import reduce
+import hashlib
+import operator
+import weakref
 
 from . import GraphError, iterables
 from .memo import lambdaize, memoize
-from .representations import Object
+from .representations import canonical_repr, freeze, Object
 
 
 _undefined = object()
@@ -70,10 +72,46 @@ def _coerce_string(value):
 String = ScalarType("String", coerce=_coerce_string)
 
 
-class ScalarQuery(object):
+class _StructuralQuery(object):
+    # Queries are immutable, so they are compared and hashed by their
+    # structure. The hash and fingerprint are computed once per query.
+    _hash = None
+    _fingerprint = None
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        elif type(other) is not type(self):
+            return NotImplemented
+        else:
+            return hash(self) == hash(other) and self._structural_key() == other._structural_key()
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash((type(self), self._structural_key()))
+        return self._hash
+
+    def fingerprint(self):
+        if self._fingerprint is None:
+            self._fingerprint = hashlib.sha256("\0".join(
+                (type(self).__name__, ) + tuple(self._fingerprint_parts())
+            ).encode("utf-8")).hexdigest()
+        return self._fingerprint
+
+
+class ScalarQuery(_StructuralQuery):
     def __init__(self, type):
         self.type = type
 
+    def _structural_key(self):
+        return (self.type, )
+
+    def _fingerprint_parts(self):
+        return (str(self.type), )
+
     def for_type(self, target_type):
         if self.type == target_type:
             return self
@@ -83,13 +121,22 @@ class ScalarQuery(object):
     def __add__(self, other):
         if not isinstance(other, ScalarQuery):
             return NotImplemented
-        elif self.type != other.type:
-            raise TypeError("cannot add queries for different scalar types: {} and {}".format(
-                self.type,
-                other.type,
-            ))
         else:
-            return self
+            return ScalarQuery.merge_all((self, other))
+
+    @staticmethod
+    def merge_all(queries):
+        queries = _to_queries(queries, ScalarQuery)
+        first, rest = queries[0], queries[1:]
+
+        for query in rest:
+            if first.type != query.type:
+                raise TypeError("cannot add queries for different scalar types: {} and {}".format(
+                    first.type,
+                    query.type,
+                ))
+
+        return first
 
     def __str__(self):
         return "ScalarQuery(type={})".format(self.type)
@@ -119,10 +166,16 @@ class EnumType(object):
             raise _coercion_error(value, self)
 
 
-class EnumQuery(object):
+class EnumQuery(_StructuralQuery):
     def __init__(self, type):
         self.type = type
 
+    def _structural_key(self):
+        return (self.type, )
+
+    def _fingerprint_parts(self):
+        return (self.type.name, )
+
     def for_type(self, target_type):
         if self.type == target_type:
             return self
@@ -132,13 +185,22 @@ class EnumQuery(object):
     def __add__(self, other):
         if not isinstance(other, EnumQuery):
             return NotImplemented
-        elif self.type != other.type:
-            raise TypeError("cannot add queries for different enum types: {} and {}".format(
-                self.type,
-                other.type,
-            ))
         else:
-            return self
+            return EnumQuery.merge_all((self, other))
+
+    @staticmethod
+    def merge_all(queries):
+        queries = _to_queries(queries, EnumQuery)
+        first, rest = queries[0], queries[1:]
+
+        for query in rest:
+            if first.type != query.type:
+                raise TypeError("cannot add queries for different enum types: {} and {}".format(
+                    first.type,
+                    query.type,
+                ))
+
+        return first
 
     def __str__(self):
         return "EnumQuery(type={})".format(self.type)
@@ -152,6 +214,7 @@ class InputObjectType(object):
 
     def _create_instance_type(self):
         name = self.name
+        field_names = tuple(field.name for field in self.fields)
 
         def __init__(self, values):
             self._values = values
@@ -167,22 +230,26 @@ class InputObjectType(object):
         def __ne__(self, other):
             return not (self == other)
 
+        def __hash__(self):
+            return hash(freeze(self._values))
+
         def __repr__(self):
             return "{}({})".format(name, ", ".join(
                 "{}={!r}".format(key, value)
                 for key, value in self._values.items()
             ))
 
-        instance_type = type(
-            self.name,
-            (object, ),
-            dict(
-                __init__=__init__,
-                __repr__=__repr__,
-                __eq__=__eq__,
-                __ne__=__ne__,
-            ),
+        attributes = dict(
+            __init__=__init__,
+            __repr__=__repr__,
+            __eq__=__eq__,
+            __ne__=__ne__,
+            __hash__=__hash__,
         )
+        if all(field_name.isidentifier() and field_name != "_values" for field_name in field_names):
+            attributes["__slots__"] = ("_values", ) + field_names
+
+        instance_type = type(self.name, (object, ), attributes)
 
         return instance_type
 
@@ -264,6 +331,7 @@ class InterfaceType(object):
 class ListType(object):
     def __init__(self, element_type):
         self.element_type = element_type
+        self._coerce = memoize(lambda: _compile_coerce(self))
 
     def __call__(self, *args, **kwargs):
         return ListQuery(self, self.element_type(*args, **kwargs))
@@ -293,17 +361,20 @@ class ListType(object):
         return (self.element_type, )
 
     def coerce(self, value):
-        return [
-            self.element_type.coerce(element)
-            for element in value
-        ]
+        return self._coerce()(value)
 
 
-class ListQuery(object):
+class ListQuery(_StructuralQuery):
     def __init__(self, type, element_query):
         self.type = type
         self.element_query = element_query
 
+    def _structural_key(self):
+        return (self.type, self.element_query)
+
+    def _fingerprint_parts(self):
+        return (str(self.type), self.element_query.fingerprint())
+
     def for_type(self, target_type):
         if isinstance(target_type, ListType):
             element_query = self.element_query.for_type(target_type.element_type)
@@ -314,13 +385,28 @@ class ListQuery(object):
     def __add__(self, other):
         if not isinstance(other, ListQuery):
             return NotImplemented
-        elif self.type.element_type != other.type.element_type:
-            raise TypeError("cannot add queries for lists with different element types: {} and {}".format(
-                self.type.element_type,
-                other.type.element_type,
-            ))
         else:
-            return ListQuery(type=self.type, element_query=self.element_query + other.element_query)
+            return ListQuery.merge_all((self, other))
+
+    @staticmethod
+    def merge_all(queries):
+        queries = _to_queries(queries, ListQuery)
+        first, rest = queries[0], queries[1:]
+
+        if not rest:
+            return first
+
+        for query in rest:
+            if first.type.element_type != query.type.element_type:
+                raise TypeError("cannot add queries for lists with different element types: {} and {}".format(
+                    first.type.element_type,
+                    query.type.element_type,
+                ))
+
+        return ListQuery(type=first.type, element_query=merge_queries(
+            query.element_query
+            for query in queries
+        ))
 
     def __str__(self):
         return _format_call_tree("ListQuery", (
@@ -368,11 +454,17 @@ class NullableType(object):
             return self.element_type.coerce(value)
 
 
-class NullableQuery(object):
+class NullableQuery(_StructuralQuery):
     def __init__(self, type, element_query):
         self.type = type
         self.element_query = element_query
 
+    def _structural_key(self):
+        return (self.type, self.element_query)
+
+    def _fingerprint_parts(self):
+        return (str(self.type), self.element_query.fingerprint())
+
     def for_type(self, target_type):
         if isinstance(target_type, NullableType):
             element_query = self.element_query.for_type(target_type.element_type)
@@ -383,13 +475,28 @@ class NullableQuery(object):
     def __add__(self, other):
         if not isinstance(other, NullableQuery):
             return NotImplemented
-        elif self.type.element_type != other.type.element_type:
-            raise TypeError("cannot add queries for nullables with different element types: {} and {}".format(
-                self.type.element_type,
-                other.type.element_type,
-            ))
         else:
-            return NullableQuery(type=self.type, element_query=self.element_query + other.element_query)
+            return NullableQuery.merge_all((self, other))
+
+    @staticmethod
+    def merge_all(queries):
+        queries = _to_queries(queries, NullableQuery)
+        first, rest = queries[0], queries[1:]
+
+        if not rest:
+            return first
+
+        for query in rest:
+            if first.type.element_type != query.type.element_type:
+                raise TypeError("cannot add queries for nullables with different element types: {} and {}".format(
+                    first.type.element_type,
+                    query.type.element_type,
+                ))
+
+        return NullableQuery(type=first.type, element_query=merge_queries(
+            query.element_query
+            for query in queries
+        ))
 
     def __str__(self):
         return _format_call_tree("NullableQuery", (
@@ -447,10 +554,14 @@ class Fields(object):
     def __init__(self, type_name, fields):
         self._type_name = type_name
         self._fields = memoize(fields)
+        self._indexes = {}
 
     def __iter__(self):
         return iter(self._fields())
 
+    def index(self, key):
+        return _index_by_name(self._indexes, self._fields(), key)
+
     def __getattr__(self, field_name):
         field = self._find_field(field_name)
 
@@ -463,10 +574,26 @@ class Fields(object):
             return field
 
     def _find_field(self, field_name):
-        return iterables.find(lambda field: field.name == field_name, self._fields(), default=None)
+        return self.index(_identity).get(field_name)
+
+
+def _index_by_name(indexes, elements, key):
+    index = indexes.get(key)
+
+    if index is None:
+        index = {}
+        for element in elements:
+            index.setdefault(key(element.name), element)
+        indexes[key] = index
+
+    return index
+
+
+def _identity(value):
+    return value
 
 
-class ObjectQuery(object):
+class ObjectQuery(_StructuralQuery):
     @staticmethod
     def create(type, *, field_queries, create_object=None):
         if create_object is None:
@@ -480,27 +607,48 @@ class ObjectQuery(object):
         self.field_queries = tuple(field_queries)
         self.create_object = create_object
 
+    def _structural_key(self):
+        return (self.type, self.field_queries, self.create_object)
+
+    def _fingerprint_parts(self):
+        return (self.type.name, _qualified_name(self.create_object)) + tuple(
+            field_query.fingerprint()
+            for field_query in self.field_queries
+        )
+
     # TODO: handling merging of other query types
     def __add__(self, other):
         if isinstance(other, ObjectQuery):
-            assert self.type == other.type
-
-            field_queries = list(map(
-                _merge_field_queries,
-                iterables.to_multidict(
-                    ((field.field, field.key), field)
-                    for field in (self.field_queries + other.field_queries)
-                ).values(),
-            ))
-
-            return ObjectQuery(
-                type=self.type,
-                field_queries=field_queries,
-                create_object=self.create_object,
-            )
+            return ObjectQuery.merge_all((self, other))
         else:
             return NotImplemented
 
+    @staticmethod
+    def merge_all(queries):
+        queries = _to_queries(queries, ObjectQuery)
+        first, rest = queries[0], queries[1:]
+
+        if not rest:
+            return first
+
+        for query in rest:
+            assert first.type == query.type
+
+        field_queries = list(map(
+            FieldQuery.merge_all,
+            iterables.to_multidict(
+                ((field_query.field, field_query.key), field_query)
+                for query in queries
+                for field_query in query.field_queries
+            ).values(),
+        ))
+
+        return ObjectQuery(
+            type=first.type,
+            field_queries=field_queries,
+            create_object=first.create_object,
+        )
+
     def for_type(self, target_type):
         if self.type == target_type:
             return self
@@ -568,32 +716,110 @@ def _field_queries_for_type(field_queries, target_type):
         return tuple(filter(None, map(field_query_for_type, field_queries)))
 
 
-def _merge_field_queries(fields):
-    return reduce(
-        lambda left, right: left + right,
-        fields,
-    )
+def merge_queries(queries):
+    queries = tuple(queries)
+    return type(queries[0]).merge_all(queries)
+
+
+def intern_query(query):
+    return _intern_query(query, {})
+
+
+def _intern_query(query, interned):
+    # Queries may share subqueries, so each is only interned once per call.
+    result = interned.get(id(query))
+    if result is not None:
+        return result
+
+    if isinstance(query, ObjectQuery):
+        field_queries = tuple(
+            _intern_query(field_query, interned)
+            for field_query in query.field_queries
+        )
+        if any(map(operator.is_not, field_queries, query.field_queries)):
+            result = ObjectQuery(query.type, field_queries=field_queries, create_object=query.create_object)
+        else:
+            result = query
+
+    elif isinstance(query, FieldQuery):
+        type_query = _intern_query(query.type_query, interned)
+        if type_query is query.type_query:
+            result = query
+        else:
+            result = FieldQuery(key=query.key, field=query.field, type_query=type_query, args=query.args)
+
+    elif isinstance(query, (ListQuery, NullableQuery)):
+        element_query = _intern_query(query.element_query, interned)
+        if element_query is query.element_query:
+            result = query
+        else:
+            result = type(query)(type=query.type, element_query=element_query)
+
+    else:
+        result = query
+
+    if isinstance(result, _StructuralQuery):
+        result = _interned_queries.setdefault((type(result), result._structural_key()), result)
+
+    interned[id(query)] = result
+    return result
+
+
+_interned_queries = weakref.WeakValueDictionary()
+
+
+def _to_queries(queries, query_type):
+    # Queries are immutable, so the same query appearing more than once
+    # (such as a fragment spread in several places) only needs merging once.
+    unique_queries = {}
+
+    for query in queries:
+        if not isinstance(query, query_type):
+            raise TypeError("cannot merge {} with {}".format(query_type.__name__, type(query).__name__))
+
+        unique_queries.setdefault(id(query), query)
+
+    return tuple(unique_queries.values())
 
 
 class Args(object):
     pass
 
 
-def field(name, type, params=None):
+def field(name, type, params=None, *, cost_multiplier=None, cache_max_age=None, cache_scope=None):
     if params is None:
         params = ()
-    return Field(owner_type=None, name=name, type=type, params=params)
+    return Field(
+        owner_type=None,
+        name=name,
+        type=type,
+        params=params,
+        cost_multiplier=cost_multiplier,
+        cache_max_age=cache_max_age,
+        cache_scope=cache_scope,
+    )
 
 
 class Field(object):
-    def __init__(self, owner_type, name, type, params):
+    def __init__(self, owner_type, name, type, params, cost_multiplier=None, cache_max_age=None, cache_scope=None):
         self.owner_type = owner_type
         self.name = name
         self.type = type
         self.params = Params(name, params)
+        self.cost_multiplier = cost_multiplier
+        self.cache_max_age = cache_max_age
+        self.cache_scope = cache_scope
 
     def with_owner_type(self, owner_type):
-        return Field(owner_type=owner_type, name=self.name, type=self.type, params=self.params)
+        return Field(
+            owner_type=owner_type,
+            name=self.name,
+            type=self.type,
+            params=self.params,
+            cost_multiplier=self.cost_multiplier,
+            cache_max_age=self.cache_max_age,
+            cache_scope=self.cache_scope,
+        )
 
     def __call__(self, *args):
         field_queries, field_args = _partition_by_type(args, (FieldQuery, Argument))
@@ -658,10 +884,14 @@ class Params(object):
     def __init__(self, field_name, params):
         self._field_name = field_name
         self._params = params
+        self._indexes = {}
 
     def __iter__(self):
         return iter(self._params)
 
+    def index(self, key):
+        return _index_by_name(self._indexes, self._params, key)
+
     def __getattr__(self, param_name):
         param = self._find_param(param_name)
 
@@ -674,30 +904,58 @@ class Params(object):
             return param
 
     def _find_param(self, param_name):
-        return iterables.find(lambda param: param.name == param_name, self._params, default=None)
+        return self.index(_identity).get(param_name)
 
 
-class FieldQuery(object):
+class FieldQuery(_StructuralQuery):
     def __init__(self, key, field, type_query, args):
         self.key = key
         self.field = field
         self.type_query = type_query
         self.args = args
 
+    def _structural_key(self):
+        return (self.key, self.field, self.type_query, self.args)
+
+    def _fingerprint_parts(self):
+        owner_type_name = "" if self.field.owner_type is None else self.field.owner_type.name
+        return (
+            self.key,
+            owner_type_name,
+            self.field.name,
+            self.type_query.fingerprint(),
+            canonical_repr(self.args._values),
+        )
+
     def __add__(self, other):
         if isinstance(other, FieldQuery):
-            assert self.key == other.key
-            assert self.field == other.field
-            assert self.args == other.args
-            return FieldQuery(
-                key=self.key,
-                field=self.field,
-                type_query=self.type_query + other.type_query,
-                args=self.args,
-            )
+            return FieldQuery.merge_all((self, other))
         else:
             return NotImplemented
 
+    @staticmethod
+    def merge_all(field_queries):
+        field_queries = _to_queries(field_queries, FieldQuery)
+        first, rest = field_queries[0], field_queries[1:]
+
+        if not rest:
+            return first
+
+        for field_query in rest:
+            assert first.key == field_query.key
+            assert first.field == field_query.field
+            assert first.args == field_query.args
+
+        return FieldQuery(
+            key=first.key,
+            field=first.field,
+            type_query=merge_queries(
+                field_query.type_query
+                for field_query in field_queries
+            ),
+            args=first.args,
+        )
+
     def for_field(self, field):
         # TODO: deal with nullability changes?
         return FieldQuery(
@@ -740,13 +998,80 @@ class Parameter(object):
         self.name = name
         self.type = type
         self.default = default
+        self._coerce = memoize(lambda: _compile_coerce(self.type))
 
     @property
     def has_default(self):
         return self.default is not _undefined
 
     def __call__(self, value):
-        return Argument(parameter=self, value=self.type.coerce(value))
+        return Argument(parameter=self, value=self._coerce()(value))
+
+
+def _compile_coerce(graph_type):
+    if isinstance(graph_type, ScalarType):
+        return graph_type._coerce
+
+    elif isinstance(graph_type, EnumType):
+        enum = graph_type.enum
+
+        def coerce_enum(value):
+            if isinstance(value, enum):
+                return value
+            else:
+                raise _coercion_error(value, graph_type)
+
+        return coerce_enum
+
+    elif isinstance(graph_type, InputObjectType):
+        instance_type = graph_type.instance_type()
+
+        def coerce_input_object(value):
+            if isinstance(value, instance_type):
+                return value
+            else:
+                raise _coercion_error(value, graph_type.name)
+
+        return coerce_input_object
+
+    elif isinstance(graph_type, ListType):
+        coerce_element = _compile_coerce(graph_type.element_type)
+        bulk_element_types = _bulk_scalar_element_types.get(graph_type.element_type)
+
+        def coerce_list(value):
+            if bulk_element_types is not None and isinstance(value, list) and set(map(type, value)) <= bulk_element_types:
+                return list(value)
+            else:
+                return [
+                    coerce_element(element)
+                    for element in value
+                ]
+
+        return coerce_list
+
+    elif isinstance(graph_type, NullableType):
+        coerce_element = _compile_coerce(graph_type.element_type)
+
+        def coerce_nullable(value):
+            if value is None:
+                return None
+            else:
+                return coerce_element(value)
+
+        return coerce_nullable
+
+    else:
+        return graph_type.coerce
+
+
+# Element types that each scalar accepts unchanged, allowing lists of them to
+# be checked in bulk rather than coercing each element.
+_bulk_scalar_element_types = {
+    Boolean: frozenset((bool, )),
+    Float: frozenset((float, )),
+    Int: frozenset((int, bool)),
+    String: frozenset((str, )),
+}
 
 
 class Argument(object):
@@ -770,6 +1095,13 @@ def collect_types(types):
     return all_types
 
 
+def _qualified_name(value):
+    return "{}.{}".format(
+        getattr(value, "__module__", None),
+        getattr(value, "__qualname__", type(value).__qualname__),
+    )
+
+
 def _format_call_tree(receiver, args):
     return "{}({}\n)".format(receiver, "".join(
         _indent("\n{}={},".format(key, value))
@@ -1,9 +1,12 @@
 import collections.abc
+import hashlib
+import itertools
 
 import sqlalchemy.orm
+import sqlalchemy.sql.util
 
 import graphlayer as g
-from . import connections, iterables, schema
+from . import connections, iterables, resolver_cache, schema
 from .core import Injector
 from .memo import memoize
 
@@ -166,6 +169,7 @@ class _JoinField(object):
             if association.distinct:
                 association_query = association_query.distinct()
 
+            _record_statement_tables(association_query)
             associations = [
                 (
                     association.left_key.read(row[:len(association.left_key.expressions())]),
@@ -395,6 +399,31 @@ class _SqlQuery(object):
             group_by=self.group_by_,
         )
 
+    def fingerprint(self):
+        type_query_fingerprint = getattr(self.type_query, "fingerprint", None)
+        if type_query_fingerprint is None:
+            return None
+
+        try:
+            clauses = tuple(
+                tuple(map(_literal_sql, clauses))
+                for clauses in (
+                    self.where_clauses,
+                    self.order or (),
+                    self.group_by_ or (),
+                    () if self.index_key is None else self.index_key.expressions(),
+                )
+            )
+        except (sqlalchemy.exc.SQLAlchemyError, NotImplementedError, TypeError):
+            return None
+
+        return hashlib.sha256("\0".join((
+            str(self.type[1]),
+            type_query_fingerprint(),
+            repr(self.limit_),
+            repr(clauses),
+        )).encode("utf-8")).hexdigest()
+
     def where(self, where):
         return _SqlQuery(
             type=self.type,
@@ -408,6 +437,49 @@ class _SqlQuery(object):
         )
 
 
+def _literal_sql(clause):
+    return str(clause.compile(compile_kwargs={"literal_binds": True}))
+
+
+def _record_statement_tables(query):
+    if resolver_cache.is_recording_tables():
+        resolver_cache.record_tables(
+            table.name
+            for table in sqlalchemy.sql.util.find_tables(query.statement, include_joins=True, include_aliases=True)
+            if isinstance(table, sqlalchemy.Table)
+        )
+
+
+def invalidate_resolver_cache(session_target, cache):
+    @sqlalchemy.event.listens_for(session_target, "after_flush")
+    def record_flushed_tables(session, flush_context):
+        tables = session.info.setdefault(_flushed_tables_key, set())
+        for instance in itertools.chain(session.new, session.dirty, session.deleted):
+            tables.update(
+                table.name
+                for table in sqlalchemy.inspect(instance).mapper.tables
+            )
+
+    @sqlalchemy.event.listens_for(session_target, "after_bulk_update")
+    @sqlalchemy.event.listens_for(session_target, "after_bulk_delete")
+    def record_bulk_tables(context):
+        tables = context.session.info.setdefault(_flushed_tables_key, set())
+        tables.update(table.name for table in context.mapper.tables)
+
+    @sqlalchemy.event.listens_for(session_target, "after_commit")
+    def invalidate_flushed_tables(session):
+        tables = session.info.pop(_flushed_tables_key, None)
+        if tables:
+            cache.invalidate(tables)
+
+    @sqlalchemy.event.listens_for(session_target, "after_rollback")
+    def discard_flushed_tables(session):
+        session.info.pop(_flushed_tables_key, None)
+
+
+_flushed_tables_key = (__name__, "flushed_tables")
+
+
 def sql_table_resolver(type, model, fields):
     fields = memoize(fields)
 
@@ -515,6 +587,7 @@ def sql_table_resolver(type, model, fields):
             query_expressions.append(sqlalchemy.literal(None))
 
         row_query = base_query.add_columns(*query_expressions).add_columns(*extra_expressions)
+        _record_statement_tables(row_query)
         rows = row_query.with_session(session)
 
         return [
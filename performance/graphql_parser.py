@@ -0,0 +1,55 @@
+import glob
+import sys
+import time
+
+from graphql.language import parser as graphql_parser
+
+from graphlayer.graphql import fastparse
+
+
+def generated_corpus():
+    fields = " ".join("field{}".format(index) for index in range(0, 20))
+    return [
+        """
+            query Dashboard($id: Int!, $first: Int = 10, $include: Boolean!) {
+                node(id: $id) {
+                    ...NodeFields
+                    children(first: $first, filter: {kinds: [A, B], name: "child"}) @include(if: $include) {
+                        ...NodeFields
+                        ... on Leaf { value }
+                    }
+                }
+            }
+
+            fragment NodeFields on Node {
+                id
+                %s
+            }
+        """ % fields,
+        "{ %s }" % " ".join("alias{0}: field(id: {0}) {{ {1} }}".format(index, fields) for index in range(0, 50)),
+    ]
+
+
+def read_corpus(paths):
+    documents = []
+    for path in paths:
+        for filename in glob.glob(path):
+            with open(filename, encoding="utf-8") as fileobj:
+                documents.append(fileobj.read())
+    return documents
+
+
+corpus = read_corpus(sys.argv[1:]) if len(sys.argv) > 1 else generated_corpus()
+repeats = 200
+
+for name, parse in (
+    ("graphql-core", graphql_parser.parse),
+    ("graphql-core (no_location)", lambda document_text: graphql_parser.parse(document_text, no_location=True)),
+    ("graphlayer", fastparse.parse),
+):
+    start_time = time.time()
+    for _ in range(0, repeats):
+        for document_text in corpus:
+            parse(document_text)
+    time_taken = time.time() - start_time
+    print(name, time_taken)
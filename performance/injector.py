@@ -0,0 +1,40 @@
+import sys
+import time
+
+import graphlayer as g
+from graphlayer import iterables
+from graphlayer.core import Injector
+
+
+class _UncompiledInjector(Injector):
+    def call_with_dependencies(self, func, *args, **kwargs):
+        dependencies = getattr(func, "dependencies", dict())
+        dependency_kwargs = iterables.to_dict(
+            (arg_name, self.get(dependency_key))
+            for arg_name, dependency_key in dependencies.items()
+        )
+        return func(*args, **kwargs, **dependency_kwargs)
+
+
+def resolve_without_dependencies(graph, query):
+    return query
+
+
+@g.dependencies(session="session", injector=Injector)
+def resolve_with_dependencies(graph, query, *, session, injector):
+    return query
+
+
+calls = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+dependencies = {"session": object()}
+
+for name, injector in (
+    ("uncompiled", _UncompiledInjector(dependencies)),
+    ("compiled", Injector(dependencies)),
+):
+    for func in (resolve_without_dependencies, resolve_with_dependencies):
+        start_time = time.time()
+        for _ in range(0, calls):
+            injector.call_with_dependencies(func, None, None)
+        time_taken = time.time() - start_time
+        print(name, func.__name__, "{:.0f}ns/call".format(time_taken / calls * 1e9))
@@ -0,0 +1,48 @@
+from graphql import GraphQLError
+from graphql.language import parser as graphql_parser
+from precisely import assert_that, equal_to, has_attrs
+import pytest
+
+from graphlayer.graphql import fastparse
+
+
+@pytest.mark.parametrize("document_text", [
+    "{ a }",
+    "# comment\n{ a, b }",
+    "query { a b: c(x: 1, y: 2.5e3, z: \"s\\n\\u00e9\", e: ENUM, n: null, t: true, l: [1, [2]], o: {a: $v}) { d } }",
+    "query Q($a: Int = 3, $b: [String!]!, $c: Input = {a: [1]}) @include(if: $a) { ...F ... on X { y } ... @skip(if: true) { z } }",
+    "fragment F on T @d { a } mutation M { a(f: -0.5, i: -3, s: \"\") }",
+    "subscription { a }",
+    "\n  { a(l: [[1], []], o: {}) ... on X @a @b(c: 1) { b } } \n",
+])
+def test_documents_are_parsed_to_same_ast_and_locations_as_graphql_core(document_text):
+    document_ast = fastparse.parse(document_text)
+
+    assert_that(document_ast, equal_to(graphql_parser.parse(document_text)))
+
+
+def test_unsupported_documents_are_parsed_by_graphql_core():
+    document_text = '{ a(s: """block""") }'
+
+    document_ast = fastparse.parse(document_text)
+
+    assert_that(document_ast, equal_to(graphql_parser.parse(document_text)))
+
+
+def test_syntax_errors_are_reported_by_graphql_core():
+    error = pytest.raises(GraphQLError, lambda: fastparse.parse("{ a(x: 1a) }"))
+
+    assert_that(error.value, has_attrs(message="Syntax Error: Invalid number, expected digit but got: 'a'."))
+
+
+def test_when_document_exceeds_max_tokens_then_error_is_raised():
+    error = pytest.raises(GraphQLError, lambda: fastparse.parse("{ a b c }", max_tokens=4))
+
+    assert_that(error.value, has_attrs(message="Syntax Error: Document contains more than 4 tokens. Parsing aborted."))
+
+
+def test_validation_errors_have_locations():
+    document_ast = fastparse.parse("{ f\n nope }")
+    error = GraphQLError("error", nodes=[document_ast.definitions[0].selection_set.selections[1]])
+
+    assert_that(error.formatted["locations"], equal_to([{"line": 2, "column": 2}]))
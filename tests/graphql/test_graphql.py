@@ -1,7 +1,13 @@
-from precisely import all_of, assert_that, contains_exactly, equal_to, has_attrs, has_feature, is_instance
+import asyncio
+import threading
+
+from precisely import all_elements, all_of, assert_that, contains_exactly, equal_to, has_attrs, has_feature, is_instance, starts_with
+import pytest
 
 import graphlayer as g
-from graphlayer import graphql
+from graphlayer import costs, graphql
+from graphlayer.graphql import persisted, validation
+from graphlayer.graphql.schema import read_schema_snapshot, write_schema_snapshot
 from graphql import GraphQLError
 
 
@@ -30,6 +36,27 @@ def test_execute():
     assert_that(result, is_success(data=equal_to({"value": "resolved"})))
 
 
+def test_execute_reuses_executor_for_same_types(monkeypatch):
+    created_schemas = []
+
+    def create_graphql_schema(**kwargs):
+        graphql_schema = original_create_graphql_schema(**kwargs)
+        created_schemas.append(graphql_schema)
+        return graphql_schema
+
+    original_create_graphql_schema = graphql.create_graphql_schema
+    monkeypatch.setattr(graphql, "create_graphql_schema", create_graphql_schema)
+
+    Root, graph = _create_value_graph()
+
+    first_result = graphql.execute(graph=graph, document_text="{ value }", query_type=Root)
+    second_result = graphql.execute(graph=graph, document_text="{ value }", query_type=Root)
+
+    assert_that(first_result, is_success(data=equal_to({"value": "resolved"})))
+    assert_that(second_result, is_success(data=equal_to({"value": "resolved"})))
+    assert_that(len(created_schemas), equal_to(1))
+
+
 def test_executor():
     Root = g.ObjectType("Root", fields=(
         g.field("value", g.String),
@@ -56,6 +83,531 @@ def test_executor():
     assert_that(result, is_success(data=equal_to({"value": "resolved"})))
 
 
+def test_execute_async():
+    Root = g.ObjectType("Root", fields=(
+        g.field("value", g.String),
+    ))
+
+    root_resolver = g.root_object_resolver(Root)
+
+    @root_resolver.field(Root.fields.value)
+    async def root_resolve_value(graph, query, args):
+        return "resolved"
+
+    graph_definition = g.define_graph(resolvers=(root_resolver, ))
+    graph = graph_definition.create_graph({})
+
+    query = """
+        query {
+            value
+        }
+    """
+
+    result = asyncio.run(graphql.execute_async(graph=graph, document_text=query, query_type=Root))
+
+    assert_that(result, is_success(data=equal_to({"value": "resolved"})))
+
+
+def test_when_resolver_is_asynchronous_then_synchronous_execution_is_an_error():
+    Root = g.ObjectType("Root", fields=(
+        g.field("value", g.String),
+    ))
+
+    root_resolver = g.root_object_resolver(Root)
+
+    @root_resolver.field(Root.fields.value)
+    async def root_resolve_value(graph, query, args):
+        return "resolved"
+
+    graph_definition = g.define_graph(resolvers=(root_resolver, ))
+    graph = graph_definition.create_graph({})
+
+    result = graphql.execute(graph=graph, document_text="{ value }", query_type=Root)
+
+    assert_that(result, is_invalid(errors=contains_exactly(
+        has_attrs(message="resolver returned an awaitable: use asynchronous execution to resolve asynchronous resolvers"),
+    )))
+
+
+def test_executor_caches_parsed_documents():
+    Root = g.ObjectType("Root", fields=(
+        g.field("value", g.String),
+    ))
+
+    root_resolver = g.root_object_resolver(Root)
+
+    @root_resolver.field(Root.fields.value)
+    def root_resolve_value(graph, query, args):
+        return "resolved"
+
+    graph_definition = g.define_graph(resolvers=(root_resolver, ))
+    graph = graph_definition.create_graph({})
+
+    query = """
+        query {
+            value
+        }
+    """
+
+    execute = graphql.executor(query_type=Root)
+    first_result = execute(graph=graph, document_text=query)
+    second_result = execute(graph=graph, document_text=query)
+
+    assert_that(first_result, is_success(data=equal_to({"value": "resolved"})))
+    assert_that(second_result, is_success(data=equal_to({"value": "resolved"})))
+    assert_that(execute.document_cache.stats(), has_attrs(hits=1, misses=1, size=1))
+
+
+def test_executor_document_cache_evicts_documents_when_full():
+    Root = g.ObjectType("Root", fields=(
+        g.field("value", g.String),
+    ))
+
+    root_resolver = g.root_object_resolver(Root)
+
+    @root_resolver.field(Root.fields.value)
+    def root_resolve_value(graph, query, args):
+        return "resolved"
+
+    graph_definition = g.define_graph(resolvers=(root_resolver, ))
+    graph = graph_definition.create_graph({})
+
+    execute = graphql.executor(query_type=Root, document_cache_size=1, document_cache_eviction="fifo")
+    execute(graph=graph, document_text="{ value }")
+    execute(graph=graph, document_text="{ alias: value }")
+    result = execute(graph=graph, document_text="{ value }")
+
+    assert_that(result, is_success(data=equal_to({"value": "resolved"})))
+    assert_that(execute.document_cache.stats(), has_attrs(hits=0, misses=3, evictions=2, size=1))
+
+
+def test_batch_of_operations_is_executed_in_order():
+    Root = g.ObjectType("Root", fields=(
+        g.field("value", g.Int, params=(
+            g.param("n", g.Int),
+        )),
+    ))
+
+    root_resolver = g.root_object_resolver(Root)
+
+    @root_resolver.field(Root.fields.value)
+    def root_resolve_value(graph, query, args):
+        return args.n
+
+    graph_definition = g.define_graph(resolvers=(root_resolver, ))
+    graph = graph_definition.create_graph({})
+
+    query = """
+        query ($n: Int!) {
+            value(n: $n)
+        }
+    """
+
+    execute = graphql.executor(query_type=Root)
+    results = execute.execute_batch([
+        (query, {"n": 1}),
+        ("{ bad }", None),
+        (query, {"n": 2}),
+    ], graph=graph)
+
+    assert_that(results, contains_exactly(
+        is_success(data=equal_to({"value": 1})),
+        is_invalid(errors=contains_exactly(has_attrs(message="Cannot query field 'bad' on type 'Root'."))),
+        is_success(data=equal_to({"value": 2})),
+    ))
+    assert_that(execute.document_cache.stats(), has_attrs(size=1))
+
+
+def test_batch_of_queries_can_be_executed_on_thread_pool():
+    Root = g.ObjectType("Root", fields=(
+        g.field("value", g.Int, params=(
+            g.param("n", g.Int),
+        )),
+    ))
+
+    root_resolver = g.root_object_resolver(Root)
+
+    @root_resolver.field(Root.fields.value)
+    def root_resolve_value(graph, query, args):
+        return args.n
+
+    graph_definition = g.define_graph(resolvers=(root_resolver, ))
+
+    query = """
+        query ($n: Int!) {
+            value(n: $n)
+        }
+    """
+
+    execute = graphql.executor(query_type=Root)
+    results = execute.execute_batch([
+        (query, {"n": n})
+        for n in range(0, 10)
+    ], create_graph=lambda: graph_definition.create_graph({}), max_workers=4)
+
+    assert_that(results, contains_exactly(*[
+        is_success(data=equal_to({"value": n}))
+        for n in range(0, 10)
+    ]))
+
+
+def test_when_batch_is_executed_on_thread_pool_then_each_worker_has_its_own_dependencies():
+    Root = g.ObjectType("Root", fields=(
+        g.field("value", g.Int),
+    ))
+
+    class Session(object):
+        def __init__(self):
+            self.threads = set()
+            self.closed = False
+
+        def close(self):
+            self.closed = True
+
+    sessions = []
+    sessions_lock = threading.Lock()
+
+    def create_session():
+        session = Session()
+        with sessions_lock:
+            sessions.append(session)
+        return session
+
+    root_resolver = g.root_object_resolver(Root)
+
+    @root_resolver.field(Root.fields.value)
+    @g.dependencies(session="session")
+    def root_resolve_value(graph, query, args, *, session):
+        session.threads.add(threading.current_thread())
+        return len(session.threads)
+
+    graph_definition = g.define_graph(resolvers=(root_resolver, ))
+
+    execute = graphql.executor(query_type=Root)
+    results = execute.execute_batch(
+        [("{ value }", None)] * 20,
+        create_graph=lambda: graph_definition.create_graph({"session": g.provider(create_session, close=Session.close)}),
+        max_workers=4,
+    )
+
+    assert_that(results, contains_exactly(*[is_success(data=equal_to({"value": 1}))] * 20))
+    assert_that(sessions, all_elements(has_attrs(closed=True)))
+
+
+def test_when_batch_is_executed_on_thread_pool_with_shared_graph_then_error_is_raised():
+    Root, graph = _create_value_graph()
+
+    execute = graphql.executor(query_type=Root)
+    error = pytest.raises(ValueError, lambda: execute.execute_batch([("{ value }", None)], graph=graph, max_workers=4))
+
+    assert_that(str(error.value), equal_to("max_workers requires create_graph so that each worker has its own graph"))
+
+
+def test_when_batch_contains_mutation_then_operations_are_executed_sequentially_on_calling_thread():
+    Query = g.ObjectType("Query", fields=(
+        g.field("thread", g.String),
+    ))
+    Mutation = g.ObjectType("Mutation", fields=(
+        g.field("thread", g.String),
+    ))
+
+    query_resolver = g.root_object_resolver(Query)
+    mutation_resolver = g.root_object_resolver(Mutation)
+
+    @query_resolver.field(Query.fields.thread)
+    def query_resolve_thread(graph, query, args):
+        return threading.current_thread().name
+
+    @mutation_resolver.field(Mutation.fields.thread)
+    def mutation_resolve_thread(graph, query, args):
+        return threading.current_thread().name
+
+    graph_definition = g.define_graph(resolvers=(query_resolver, mutation_resolver))
+
+    execute = graphql.executor(query_type=Query, mutation_type=Mutation)
+    results = execute.execute_batch([
+        ("query { thread }", None),
+        ("mutation { thread }", None),
+    ], create_graph=lambda: graph_definition.create_graph({}), max_workers=4)
+
+    current_thread_name = threading.current_thread().name
+    assert_that(results, contains_exactly(
+        is_success(data=equal_to({"thread": current_thread_name})),
+        is_success(data=equal_to({"thread": current_thread_name})),
+    ))
+
+
+def test_when_query_exceeds_cost_limits_then_result_is_invalid_and_resolvers_are_not_called():
+    resolved = []
+
+    Root = g.ObjectType("Root", fields=lambda: (
+        g.field("root", type=Root),
+        g.field("value", g.String),
+    ))
+
+    root_resolver = g.root_object_resolver(Root)
+
+    @root_resolver.field(Root.fields.value)
+    def root_resolve_value(graph, query, args):
+        resolved.append(True)
+        return "resolved"
+
+    graph_definition = g.define_graph(resolvers=(root_resolver, ))
+    graph = graph_definition.create_graph({})
+
+    execute = graphql.executor(query_type=Root, cost_limits=costs.CostLimits(max_depth=2))
+    result = execute(graph=graph, document_text="{ value root { root { value } } }")
+
+    assert_that(result, is_invalid(errors=contains_exactly(
+        has_attrs(message="query depth of 3 exceeds limit of 2"),
+    )))
+    assert_that(resolved, equal_to([]))
+
+
+def test_cost_limits_are_checked_without_expanding_shared_fragments():
+    Root = g.ObjectType("Root", fields=lambda: (
+        g.field("root", type=Root, params=(
+            g.param("id", type=g.Int),
+        )),
+        g.field("value", g.String),
+    ))
+
+    root_resolver = g.root_object_resolver(Root)
+
+    graph_definition = g.define_graph(resolvers=(root_resolver, ))
+    graph = graph_definition.create_graph({})
+
+    fragments = "fragment F0 on Root { value } " + " ".join(
+        "fragment F{0} on Root {{ a: root(id: $id) {{ ...F{1} }} b: root(id: $id) {{ ...F{1} }} }}".format(index, index - 1)
+        for index in range(1, 40)
+    )
+    document_text = "query ($id: Int!) { ...F39 } " + fragments
+
+    execute = graphql.executor(query_type=Root, cost_limits=costs.CostLimits(max_depth=5))
+    result = execute(graph=graph, document_text=document_text, variables={"id": 1})
+
+    assert_that(result, is_invalid(errors=contains_exactly(
+        has_attrs(message="query depth of 40 exceeds limit of 5"),
+    )))
+
+
+def test_when_document_exceeds_token_limit_then_result_is_invalid():
+    Root, graph = _create_value_graph()
+
+    execute = graphql.executor(query_type=Root, max_tokens=4)
+    result = execute(graph=graph, document_text="{ value alias: value }")
+
+    assert_that(result, is_invalid(errors=contains_exactly(
+        has_attrs(message="Syntax Error: Document contains more than 4 tokens. Parsing aborted."),
+    )))
+
+
+def test_documents_are_validated_using_all_specified_rules_by_default():
+    Root, graph = _create_value_graph()
+
+    execute = graphql.executor(query_type=Root)
+    result = execute(graph=graph, document_text="{ value } fragment Unused on Root { value }")
+
+    assert_that(result, is_invalid(errors=contains_exactly(
+        has_attrs(message="Fragment 'Unused' is never used."),
+    )))
+
+
+def test_validation_policy_can_narrow_rules_to_essential_rules():
+    Root, graph = _create_value_graph()
+
+    execute = graphql.executor(
+        query_type=Root,
+        validation_policy=validation.ValidationPolicy(rules=validation.essential_rules),
+    )
+    valid_result = execute(graph=graph, document_text="{ value } fragment Unused on Root { value }")
+    invalid_result = execute(graph=graph, document_text="{ unknown }")
+
+    assert_that(valid_result, is_success(data=equal_to({"value": "resolved"})))
+    assert_that(invalid_result, is_invalid(errors=contains_exactly(
+        has_attrs(message="Cannot query field 'unknown' on type 'Root'."),
+    )))
+
+
+def test_essential_rules_reject_conflicting_fields_with_same_response_key():
+    Root = g.ObjectType("Root", fields=(
+        g.field("first", g.String),
+        g.field("second", g.String),
+    ))
+    root_resolver = g.root_object_resolver(Root)
+
+    @root_resolver.field(Root.fields.first)
+    def root_resolve_first(graph, query, args):
+        return "first"
+
+    @root_resolver.field(Root.fields.second)
+    def root_resolve_second(graph, query, args):
+        return "second"
+
+    graph = g.define_graph(resolvers=(root_resolver, )).create_graph({})
+
+    execute = graphql.executor(
+        query_type=Root,
+        validation_policy=validation.ValidationPolicy(rules=validation.essential_rules),
+    )
+    result = execute(graph=graph, document_text="{ value: first value: second }")
+
+    assert_that(result, is_invalid(errors=contains_exactly(
+        has_attrs(message=starts_with("Fields 'value' conflict")),
+    )))
+
+
+def test_trusted_documents_are_validated_using_trusted_rules():
+    Root, graph = _create_value_graph()
+    document_text = "{ value } fragment Unused on Root { value }"
+    store = persisted.InMemoryDocumentStore({persisted.document_hash(document_text): document_text}, trusted=True)
+
+    execute = graphql.executor(
+        query_type=Root,
+        document_store=store,
+        validation_policy=validation.ValidationPolicy(trusted_rules=()),
+    )
+    trusted_result = execute(graph=graph, document_hash=persisted.document_hash(document_text))
+    untrusted_result = execute(graph=graph, document_text=document_text)
+
+    assert_that(trusted_result, is_success(data=equal_to({"value": "resolved"})))
+    assert_that(untrusted_result, is_invalid(errors=contains_exactly(
+        has_attrs(message="Fragment 'Unused' is never used."),
+    )))
+
+
+def test_documents_registered_at_runtime_are_untrusted_by_default():
+    Root, graph = _create_value_graph()
+
+    execute = graphql.executor(
+        query_type=Root,
+        document_store=persisted.InMemoryDocumentStore(),
+        validation_policy=validation.ValidationPolicy(trusted_rules=()),
+    )
+    document_text = "{ value } fragment Unused on Root { value }"
+    result = execute(document_text, graph=graph, document_hash=persisted.document_hash(document_text))
+
+    assert_that(result, is_invalid(errors=contains_exactly(
+        has_attrs(message="Fragment 'Unused' is never used."),
+    )))
+
+
+def test_validation_results_are_cached_when_documents_are_evicted_from_document_cache():
+    Root, graph = _create_value_graph()
+
+    execute = graphql.executor(query_type=Root, document_cache_size=0)
+    first_result = execute(graph=graph, document_text="{ value }")
+    second_result = execute(graph=graph, document_text="{ value }")
+
+    assert_that(first_result, is_success(data=equal_to({"value": "resolved"})))
+    assert_that(second_result, is_success(data=equal_to({"value": "resolved"})))
+    assert_that(execute.validation_cache.stats(), has_attrs(hits=1, misses=1, size=1))
+
+
+def test_persisted_document_can_be_executed_by_hash():
+    Root, graph = _create_value_graph()
+
+    execute = graphql.executor(query_type=Root, document_store=persisted.InMemoryDocumentStore())
+    document_hash = execute.register_document("{ value }")
+    result = execute(graph=graph, document_hash=document_hash)
+
+    assert_that(result, is_success(data=equal_to({"value": "resolved"})))
+
+
+def test_when_persisted_document_is_not_found_then_result_is_invalid():
+    Root, graph = _create_value_graph()
+
+    execute = graphql.executor(query_type=Root, document_store=persisted.InMemoryDocumentStore())
+    result = execute(graph=graph, document_hash=persisted.document_hash("{ value }"))
+
+    assert_that(result, is_invalid(errors=contains_exactly(
+        has_attrs(message="PersistedQueryNotFound"),
+    )))
+
+
+def test_when_document_hash_is_sent_with_document_text_then_document_is_registered():
+    Root, graph = _create_value_graph()
+    store = persisted.InMemoryDocumentStore()
+    document_hash = persisted.document_hash("{ value }")
+
+    execute = graphql.executor(query_type=Root, document_store=store)
+    first_result = execute("{ value }", graph=graph, document_hash=document_hash)
+    second_result = execute(graph=graph, document_hash=document_hash)
+
+    assert_that(first_result, is_success(data=equal_to({"value": "resolved"})))
+    assert_that(second_result, is_success(data=equal_to({"value": "resolved"})))
+    assert_that(store.get(document_hash), equal_to("{ value }"))
+
+
+def test_when_document_hash_does_not_match_document_text_then_result_is_invalid():
+    Root, graph = _create_value_graph()
+
+    execute = graphql.executor(query_type=Root, document_store=persisted.InMemoryDocumentStore())
+    result = execute("{ value }", graph=graph, document_hash=persisted.document_hash("{ alias: value }"))
+
+    assert_that(result, is_invalid(errors=contains_exactly(
+        has_attrs(message="provided sha does not match query"),
+    )))
+
+
+def test_documents_in_document_store_are_available_when_executor_is_created():
+    Root, graph = _create_value_graph()
+    document_hash = persisted.document_hash("{ value }")
+    store = persisted.InMemoryDocumentStore({document_hash: "{ value }"})
+
+    execute = graphql.executor(query_type=Root, document_store=store)
+    result = execute(graph=graph, document_hash=document_hash)
+
+    assert_that(result, is_success(data=equal_to({"value": "resolved"})))
+
+
+def test_documents_registered_by_clients_are_untrusted_when_executor_is_recreated():
+    Root, graph = _create_value_graph()
+    store = persisted.InMemoryDocumentStore()
+    document_text = "{ value } fragment Unused on Root { value }"
+    document_hash = persisted.document_hash(document_text)
+    store.set(document_hash, document_text)
+
+    execute = graphql.executor(
+        query_type=Root,
+        document_store=store,
+        validation_policy=validation.ValidationPolicy(trusted_rules=()),
+    )
+    result = execute(graph=graph, document_hash=document_hash)
+
+    assert_that(result, is_invalid(errors=contains_exactly(
+        has_attrs(message="Fragment 'Unused' is never used."),
+    )))
+
+
+def test_documents_registered_by_clients_are_evicted_from_persisted_document_cache():
+    Root, graph = _create_value_graph()
+
+    execute = graphql.executor(
+        query_type=Root,
+        document_store=persisted.InMemoryDocumentStore(),
+        persisted_document_cache_size=1,
+    )
+    execute.register_document("{ value }", trusted=True)
+    for document_text in ("{ a: value }", "{ b: value }"):
+        execute(document_text, graph=graph, document_hash=persisted.document_hash(document_text))
+    result = execute(graph=graph, document_hash=persisted.document_hash("{ a: value }"))
+
+    assert_that(result, is_success(data=equal_to({"a": "resolved"})))
+    assert_that(execute.persisted_document_cache.stats(), has_attrs(size=1, evictions=2))
+
+
+def test_when_executor_has_no_document_store_then_executing_by_hash_is_invalid():
+    Root, graph = _create_value_graph()
+
+    execute = graphql.executor(query_type=Root)
+    result = execute(graph=graph, document_hash=persisted.document_hash("{ value }"))
+
+    assert_that(result, is_invalid(errors=contains_exactly(
+        has_attrs(message="PersistedQueryNotSupported"),
+    )))
+
+
 def test_can_query_schema():
     Root = g.ObjectType("Root", fields=(
         g.field("value", g.String),
@@ -83,6 +635,36 @@ def test_can_query_schema():
     })))
 
 
+def test_result_of_schema_query_without_variables_is_reused():
+    Root = g.ObjectType("Root", fields=(
+        g.field("value", g.String),
+    ))
+
+    graph_definition = g.define_graph(resolvers=())
+    graph = graph_definition.create_graph({})
+
+    query = """
+        query {
+            __schema {
+                queryType { name }
+            }
+        }
+    """
+
+    execute = graphql.executor(query_type=Root)
+    first_result = execute(graph=graph, document_text=query)
+    second_result = execute(graph=graph, document_text=query)
+
+    assert_that(second_result, is_success(data=equal_to({
+        "__schema": {
+            "queryType": {
+                "name": "Root",
+            },
+        },
+    })))
+    assert_that(first_result.data["__schema"] is second_result.data["__schema"], equal_to(True))
+
+
 def test_can_query_schema_with_other_data():
     Root = g.ObjectType("Root", fields=(
         g.field("value", g.String),
@@ -227,6 +809,57 @@ def test_when_resolution_raises_graph_error_then_result_is_invalid():
     )))
 
 
+def test_executor_can_load_schema_from_snapshot_file(tmp_path):
+    Root, graph = _create_value_graph()
+    path = str(tmp_path / "schema.json")
+    write_schema_snapshot(graphql.create_graphql_schema(query_type=Root, mutation_type=None), path)
+
+    execute = graphql.executor(query_type=Root, schema_snapshot=read_schema_snapshot(path))
+    result = execute(graph=graph, document_text="{ value __schema { queryType { name } } }")
+
+    assert_that(result, is_success(data=equal_to({
+        "value": "resolved",
+        "__schema": {"queryType": {"name": "Root"}},
+    })))
+
+
+def test_executor_can_use_fast_parser():
+    Root, graph = _create_value_graph()
+
+    execute = graphql.executor(query_type=Root, fast_parser=True)
+    result = execute(graph=graph, document_text="query ($skip: Boolean!) { value alias: value @skip(if: $skip) }", variables={"skip": False})
+
+    assert_that(result, is_success(data=equal_to({"value": "resolved", "alias": "resolved"})))
+
+
+def test_when_using_fast_parser_then_validation_errors_have_locations():
+    Root, graph = _create_value_graph()
+
+    execute = graphql.executor(query_type=Root, fast_parser=True)
+    result = execute(graph=graph, document_text="{ value\n nope }")
+
+    assert_that(result, is_invalid(errors=contains_exactly(
+        has_attrs(locations=contains_exactly(has_attrs(line=2, column=2))),
+    )))
+
+
+def _create_value_graph():
+    Root = g.ObjectType("Root", fields=(
+        g.field("value", g.String),
+    ))
+
+    root_resolver = g.root_object_resolver(Root)
+
+    @root_resolver.field(Root.fields.value)
+    def root_resolve_value(graph, query, args):
+        return "resolved"
+
+    graph_definition = g.define_graph(resolvers=(root_resolver, ))
+    graph = graph_definition.create_graph({})
+
+    return Root, graph
+
+
 def is_invalid(*, errors):
     return has_attrs(errors=errors, data=None)
 
@@ -0,0 +1,213 @@
+from precisely import assert_that, contains_exactly, equal_to
+
+import graphlayer as g
+from graphlayer import graphql
+
+
+def test_deferred_fragments_are_resolved_after_initial_payload():
+    Root, graph, resolved = _create_books_graph()
+    execute = graphql.executor(query_type=Root)
+
+    payloads = execute.execute_incremental(
+        '{ book { title ... @defer(label: "details") { summary } } }',
+        graph=graph,
+    )
+    initial_payload = next(payloads)
+    resolved_before_subsequent_payloads = list(resolved)
+    subsequent_payloads = list(payloads)
+
+    assert_that(initial_payload, equal_to({
+        "data": {"book": {"title": "Leave it to Psmith"}},
+        "hasNext": True,
+    }))
+    assert_that(resolved_before_subsequent_payloads, contains_exactly(("title", )))
+    assert_that(subsequent_payloads, contains_exactly(
+        {
+            "incremental": [{"data": {"summary": "Psmith takes a job."}, "path": ["book"], "label": "details"}],
+            "hasNext": False,
+        },
+    ))
+
+
+def test_deferred_named_fragments_are_resolved_after_initial_payload():
+    Root, graph, resolved = _create_books_graph()
+    execute = graphql.executor(query_type=Root)
+
+    payloads = execute.execute_incremental(
+        "{ count ...BookSummary @defer } fragment BookSummary on Root { book { summary } }",
+        graph=graph,
+    )
+
+    assert_that(list(payloads), contains_exactly(
+        {"data": {"count": 2}, "hasNext": True},
+        {
+            "incremental": [{"data": {"book": {"summary": "Psmith takes a job."}}, "path": []}],
+            "hasNext": False,
+        },
+    ))
+
+
+def test_nested_deferred_fragments_are_delivered_after_enclosing_fragment():
+    Root, graph, resolved = _create_books_graph()
+    execute = graphql.executor(query_type=Root)
+
+    payloads = execute.execute_incremental(
+        "{ book { ... @defer { title ... @defer { summary } } } }",
+        graph=graph,
+    )
+
+    assert_that(list(payloads), contains_exactly(
+        {"data": {"book": {}}, "hasNext": True},
+        {"incremental": [{"data": {"title": "Leave it to Psmith"}, "path": ["book"]}], "hasNext": True},
+        {"incremental": [{"data": {"summary": "Psmith takes a job."}, "path": ["book"]}], "hasNext": False},
+    ))
+
+
+def test_when_defer_is_disabled_then_fragment_is_included_in_initial_payload():
+    Root, graph, resolved = _create_books_graph()
+    execute = graphql.executor(query_type=Root)
+
+    payloads = execute.execute_incremental(
+        "query ($defer: Boolean!) { book { title ... @defer(if: $defer) { summary } } }",
+        graph=graph,
+        variables={"defer": False},
+    )
+
+    assert_that(list(payloads), contains_exactly(
+        {"data": {"book": {"title": "Leave it to Psmith", "summary": "Psmith takes a job."}}},
+    ))
+
+
+def test_streamed_list_items_are_delivered_after_initial_payload():
+    Root, graph, resolved = _create_books_graph()
+    execute = graphql.executor(query_type=Root)
+
+    payloads = execute.execute_incremental("{ count books @stream { title } }", graph=graph)
+
+    assert_that(list(payloads), contains_exactly(
+        {"data": {"count": 2, "books": []}, "hasNext": True},
+        {
+            "incremental": [{"items": [{"title": "Leave it to Psmith"}, {"title": "Pigs Have Wings"}], "path": ["books", 0]}],
+            "hasNext": False,
+        },
+    ))
+
+
+def test_streamed_list_includes_initial_count_items_in_initial_payload():
+    Root, graph, resolved = _create_books_graph()
+    execute = graphql.executor(query_type=Root)
+
+    payloads = execute.execute_incremental("{ books @stream(initialCount: 1) { title } }", graph=graph)
+
+    assert_that(list(payloads), contains_exactly(
+        {"data": {"books": [{"title": "Leave it to Psmith"}]}, "hasNext": True},
+        {"incremental": [{"items": [{"title": "Pigs Have Wings"}], "path": ["books", 1]}], "hasNext": False},
+    ))
+
+
+def test_deferred_fragments_within_lists_are_included_in_initial_payload():
+    Root, graph, resolved = _create_books_graph()
+    execute = graphql.executor(query_type=Root)
+
+    payloads = execute.execute_incremental("{ books { title ... @defer { summary } } }", graph=graph)
+
+    assert_that(list(payloads), contains_exactly(
+        {
+            "data": {"books": [
+                {"title": "Leave it to Psmith", "summary": "Psmith takes a job."},
+                {"title": "Pigs Have Wings", "summary": "The Empress is in danger."},
+            ]},
+        },
+    ))
+
+
+def test_when_executing_without_incremental_delivery_then_defer_and_stream_are_ignored():
+    Root, graph, resolved = _create_books_graph()
+    execute = graphql.executor(query_type=Root)
+
+    result = execute("{ book { ... @defer { summary } } books @stream { title } }", graph=graph)
+
+    assert_that(result.errors, equal_to(None))
+    assert_that(result.data, equal_to({
+        "book": {"summary": "Psmith takes a job."},
+        "books": [{"title": "Leave it to Psmith"}, {"title": "Pigs Have Wings"}],
+    }))
+
+
+def test_mutations_are_resolved_in_a_single_payload():
+    Root, graph, resolved = _create_books_graph()
+    Book = Root.fields.book.type
+    Mutation = g.ObjectType("Mutation", fields=(
+        g.field("rename_book", type=Book),
+    ))
+
+    mutation_resolver = g.root_object_resolver(Mutation)
+    renames = []
+
+    @mutation_resolver.field(Mutation.fields.rename_book)
+    def resolve_rename_book(graph, query, args):
+        renames.append(tuple(field_query.key for field_query in query.field_queries))
+        return query.create_object(dict(
+            (field_query.key, "Renamed")
+            for field_query in query.field_queries
+        ))
+
+    graph = g.define_graph(resolvers=(mutation_resolver, )).create_graph({})
+    execute = graphql.executor(query_type=Root, mutation_type=Mutation)
+
+    payloads = list(execute.execute_incremental(
+        "mutation { renameBook { title ... @defer { summary } } }",
+        graph=graph,
+    ))
+
+    assert_that(payloads, contains_exactly(
+        {"data": {"renameBook": {"title": "Renamed", "summary": "Renamed"}}},
+    ))
+    assert_that(renames, contains_exactly(("title", "summary")))
+
+
+def _create_books_graph():
+    resolved = []
+
+    books = [
+        {"title": "Leave it to Psmith", "summary": "Psmith takes a job."},
+        {"title": "Pigs Have Wings", "summary": "The Empress is in danger."},
+    ]
+
+    Book = g.ObjectType("Book", fields=(
+        g.field("title", type=g.String),
+        g.field("summary", type=g.String),
+    ))
+    Root = g.ObjectType("Root", fields=(
+        g.field("book", type=Book),
+        g.field("books", type=g.ListType(Book)),
+        g.field("count", type=g.Int),
+    ))
+
+    root_resolver = g.root_object_resolver(Root)
+
+    def resolve_book(book, query):
+        return query.create_object(dict(
+            (field_query.key, book[field_query.field.name])
+            for field_query in query.field_queries
+        ))
+
+    @root_resolver.field(Root.fields.book)
+    def root_resolve_book(graph, query, args):
+        resolved.append(tuple(field_query.key for field_query in query.field_queries))
+        return resolve_book(books[0], query)
+
+    @root_resolver.field(Root.fields.books)
+    def root_resolve_books(graph, query, args):
+        return [
+            resolve_book(book, query.element_query)
+            for book in books
+        ]
+
+    @root_resolver.field(Root.fields.count)
+    def root_resolve_count(graph, query, args):
+        return len(books)
+
+    graph = g.define_graph(resolvers=(root_resolver, )).create_graph({})
+
+    return Root, graph, resolved
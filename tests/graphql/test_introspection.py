@@ -0,0 +1,93 @@
+import enum
+
+import graphql
+from precisely import assert_that, equal_to
+import pytest
+
+import graphlayer as g
+from graphlayer.graphql import introspection
+from graphlayer.graphql.schema import create_graphql_schema
+
+
+class Season(enum.Enum):
+    winter = "WINTER"
+    summer = "SUMMER"
+
+
+SeasonType = g.EnumType(Season)
+
+Node = g.InterfaceType("Node", fields=(
+    g.field("id", type=g.Int),
+))
+
+Filter = g.InputObjectType("Filter", fields=(
+    g.input_field("season", type=SeasonType),
+    g.input_field("name", type=g.NullableType(g.String), default=None),
+))
+
+Book = g.ObjectType("Book", interfaces=(Node, ), fields=lambda: (
+    g.field("id", type=g.Int),
+    g.field("title", type=g.String),
+    g.field("season", type=g.NullableType(SeasonType)),
+))
+
+Root = g.ObjectType("Root", fields=(
+    g.field("books", type=g.ListType(Book), params=(
+        g.param("filter", type=g.NullableType(Filter), default=None),
+    )),
+))
+
+
+@pytest.mark.parametrize("document_text", [
+    graphql.get_introspection_query(),
+    "{ __schema { queryType { name } } }",
+    "{ first: __schema { types { name } } second: __schema { types { kind } } }",
+    "{ __schema { types { name fields { name type { kind ofType { kind name } } } } } }",
+    "{ __schema { ...Types } } fragment Types on __Schema { types { name } types { kind } }",
+    "{ __schema { directives { name locations } } }",
+    "{ __schema { queryType { fields { name } } } }",
+    "{ __schema { __typename } }",
+])
+def test_projected_introspection_result_matches_executed_introspection_result(document_text):
+    schema = create_graphql_schema(query_type=Root, mutation_type=None)
+    document = graphql.parse(document_text)
+
+    result = introspection.execute_schema_document(document, graphql_schema=schema, variables={})
+
+    assert_that(result, equal_to(graphql.execute(schema.graphql_schema, document).data))
+
+
+def test_standard_introspection_query_is_served_without_executing_schema_document(monkeypatch):
+    schema = create_graphql_schema(query_type=Root, mutation_type=None)
+    expected = graphql.execute(schema.graphql_schema, graphql.parse(graphql.get_introspection_query())).data
+    monkeypatch.setattr(introspection, "_execute_schema_document", None)
+
+    result = introspection.execute_schema_document(
+        graphql.parse(graphql.get_introspection_query()),
+        graphql_schema=schema,
+        variables={},
+    )
+
+    assert_that(result, equal_to(expected))
+
+
+def test_include_directives_are_evaluated_when_projecting_introspection_result():
+    schema = create_graphql_schema(query_type=Root, mutation_type=None)
+    document = graphql.parse("""
+        query ($t: Boolean!) {
+            __schema {
+                queryType @include(if: $t) { name }
+                mutationType @skip(if: $t) { name }
+            }
+        }
+    """)
+
+    result = introspection.execute_schema_document(document, graphql_schema=schema, variables={"t": True})
+
+    assert_that(result, equal_to({"__schema": {"queryType": {"name": "Root"}}}))
+
+
+def test_introspection_result_is_computed_once_per_schema():
+    schema = create_graphql_schema(query_type=Root, mutation_type=None)
+
+    assert_that(schema.introspection() is schema.introspection(), equal_to(True))
@@ -1,12 +1,12 @@
 import enum
 
-from precisely import assert_that, equal_to, has_attrs, is_sequence
+from precisely import all_of, assert_that, equal_to, has_attrs, is_instance, is_sequence, starts_with
 import pytest
 
 from graphql import GraphQLError
 import graphlayer as g
 from graphlayer import schema
-from graphlayer.graphql.parser import document_text_to_query
+from graphlayer.graphql.parser import document_text_to_query, read_document
 from graphlayer.graphql.schema import create_graphql_schema
 from ..matchers import is_query
 
@@ -244,6 +244,33 @@ def test_inline_fragments_are_expanded():
     ))
 
 
+def test_inline_fragments_without_type_condition_are_expanded():
+    Root = g.ObjectType(
+        "Root",
+        (
+            g.field("value", type=g.Int),
+        ),
+    )
+
+    graphql_query = """
+        query {
+            one: value
+            ... {
+                two: value
+            }
+        }
+    """
+
+    object_query = _document_text_to_graph_query(graphql_query, query_type=Root)
+
+    assert_that(object_query, is_query(
+        Root(
+            g.key("one", Root.fields.value()),
+            g.key("two", Root.fields.value()),
+        ),
+    ))
+
+
 def test_named_fragments_are_expanded():
     Root = g.ObjectType(
         "Root",
@@ -512,6 +539,46 @@ def test_fragments_are_recursively_merged():
     ))
 
 
+def test_when_fragment_is_spread_in_several_places_then_fragment_query_is_shared():
+    Book = g.ObjectType("Book", fields=lambda: (
+        g.field("title", type=g.String),
+    ))
+
+    Root = g.ObjectType(
+        "Root",
+        fields=lambda: (
+            g.field("first_book", type=Book),
+            g.field("second_book", type=Book),
+        ),
+    )
+
+    graphql_query = """
+        query {
+            firstBook { ...BookFields }
+            secondBook { ...BookFields }
+        }
+
+        fragment BookFields on Book {
+            title
+        }
+    """
+
+    object_query = _document_text_to_graph_query(graphql_query, query_type=Root)
+
+    assert_that(object_query, is_query(
+        Root(
+            g.key("firstBook", Root.fields.first_book(
+                g.key("title", Book.fields.title()),
+            )),
+            g.key("secondBook", Root.fields.second_book(
+                g.key("title", Book.fields.title()),
+            )),
+        ),
+    ))
+    first_book_query, second_book_query = object_query.field_queries
+    assert_that(first_book_query.type_query is second_book_query.type_query, equal_to(True))
+
+
 def test_fragment_can_be_spread_into_list_type():
     User = g.ObjectType("User", fields=lambda: (
         g.field("name", type=g.String),
@@ -869,6 +936,84 @@ def test_when_non_null_variable_is_missing_then_error_is_raised():
     assert_that(error.value.message, equal_to("Variable '$var' of required type 'Int!' was not provided."))
 
 
+def test_list_of_scalar_variables_are_coerced():
+    Root = g.ObjectType(
+        "Root",
+        fields=(
+            g.field("one", type=g.Int, params=[
+                g.param("ids", type=g.ListType(g.Int)),
+                g.param("weights", type=g.ListType(g.Float)),
+                g.param("names", type=g.NullableType(g.ListType(g.String))),
+            ]),
+        ),
+    )
+
+    graphql_query = """
+        query ($ids: [Int!]!, $weights: [Float!]!, $names: [String!]) {
+            one(ids: $ids, weights: $weights, names: $names)
+        }
+    """
+
+    variables = {"ids": [1, 2, 3], "weights": [1, 2.5], "names": None}
+    object_query = _document_text_to_graph_query(graphql_query, query_type=Root, variables=variables)
+    assert_that(object_query.field_queries[0].args, has_attrs(
+        ids=[1, 2, 3],
+        weights=is_sequence(is_float(1.0), is_float(2.5)),
+        names=None,
+    ))
+
+
+def test_when_list_of_int_variable_has_invalid_element_then_error_is_raised():
+    Root = g.ObjectType(
+        "Root",
+        fields=(
+            g.field("one", type=g.Int, params=[
+                g.param("ids", type=g.ListType(g.Int)),
+            ]),
+        ),
+    )
+
+    graphql_query = """
+        query ($ids: [Int!]!) {
+            one(ids: $ids)
+        }
+    """
+
+    variables = {"ids": [1, 2 ** 31]}
+    error = pytest.raises(
+        GraphQLError,
+        lambda: _document_text_to_graph_query(graphql_query, query_type=Root, variables=variables),
+    )
+    assert_that(error.value.message, equal_to(
+        "Variable '$ids' got invalid value 2147483648 at 'ids[1]'; "
+        "Int cannot represent non 32-bit signed integer value: 2147483648",
+    ))
+
+
+def test_when_list_of_float_variable_has_element_too_large_for_float_then_error_is_raised():
+    Root = g.ObjectType(
+        "Root",
+        fields=(
+            g.field("one", type=g.Int, params=[
+                g.param("weights", type=g.ListType(g.Float)),
+            ]),
+        ),
+    )
+
+    graphql_query = """
+        query ($weights: [Float!]!) {
+            one(weights: $weights)
+        }
+    """
+
+    variables = {"weights": [1, 10 ** 400]}
+    error = pytest.raises(
+        GraphQLError,
+        lambda: _document_text_to_graph_query(graphql_query, query_type=Root, variables=variables),
+    )
+    assert_that(error.value.message, starts_with("Variable '$weights' got invalid value"))
+
+
 def test_when_input_object_variable_is_missing_field_then_error_is_raised():
     Input = g.InputObjectType(
         "Input",
@@ -900,6 +1045,37 @@ def test_when_input_object_variable_is_missing_field_then_error_is_raised():
     assert_that(error.value.message, equal_to("Variable '$var' got invalid value {}; Field 'field' of required type 'Int!' was not provided."))
 
 
+def test_input_objects_can_refer_to_their_own_type():
+    Filter = g.InputObjectType(
+        "Filter",
+        fields=lambda: (
+            g.input_field("value", type=g.Int),
+            g.input_field("any_of", type=g.ListType(Filter), default=[]),
+        ),
+    )
+
+    Root = g.ObjectType(
+        "Root",
+        fields=(
+            g.field("one", type=g.Int, params=[
+                g.param("filter", type=Filter),
+            ]),
+        ),
+    )
+
+    graphql_query = """
+        query {
+            one(filter: {value: 1, anyOf: [{value: 2}, {value: 3, anyOf: []}]})
+        }
+    """
+
+    object_query = _document_text_to_graph_query(graphql_query, query_type=Root)
+    assert_that(object_query.field_queries[0].args.filter, equal_to(Filter(
+        value=1,
+        any_of=[Filter(value=2), Filter(value=3, any_of=[])],
+    )))
+
+
 def test_when_arg_is_not_set_then_default_is_used():
     Root = g.ObjectType(
         "Root",
@@ -1111,6 +1287,120 @@ def test_when_field_has_camel_case_name_then_field_can_be_referenced_in_query():
     ))
 
 
+class TestDocumentPlans(object):
+    def test_argument_variables_are_bound_each_time_document_is_converted_to_query(self):
+        Root = g.ObjectType(
+            "Root",
+            (
+                g.field("one", type=g.Int, params=[
+                    g.param("arg", type=g.Int),
+                ]),
+            ),
+        )
+
+        graphql_query = """
+            query ($value: Int!) {
+                one(arg: $value)
+            }
+        """
+
+        document = _read_document(graphql_query, query_type=Root)
+        first_query = document.to_query({"value": 1}).graph_query
+        second_query = document.to_query({"value": 2}).graph_query
+
+        assert_that(first_query, is_query(
+            Root(
+                g.key("one", Root.fields.one(Root.fields.one.params.arg(1))),
+            ),
+        ))
+        assert_that(second_query, is_query(
+            Root(
+                g.key("one", Root.fields.one(Root.fields.one.params.arg(2))),
+            ),
+        ))
+
+    def test_field_queries_without_variables_are_shared_between_queries(self):
+        Root = g.ObjectType(
+            "Root",
+            (
+                g.field("one", type=g.Int, params=[
+                    g.param("arg", type=g.Int),
+                ]),
+                g.field("two", type=g.Int),
+            ),
+        )
+
+        graphql_query = """
+            query ($value: Int!) {
+                one(arg: $value)
+                two
+            }
+        """
+
+        document = _read_document(graphql_query, query_type=Root)
+        first_query = document.to_query({"value": 1}).graph_query
+        second_query = document.to_query({"value": 2}).graph_query
+
+        assert_that(first_query.field_queries[1] is second_query.field_queries[1], equal_to(True))
+
+    def test_when_directive_variables_change_then_selections_are_included_accordingly(self):
+        Root = g.ObjectType(
+            "Root",
+            (
+                g.field("one", type=g.Int),
+                g.field("two", type=g.Int),
+            ),
+        )
+
+        graphql_query = """
+            query ($includeTwo: Boolean!) {
+                one
+                two @include(if: $includeTwo)
+            }
+        """
+
+        document = _read_document(graphql_query, query_type=Root)
+
+        assert_that(document.to_query({"includeTwo": True}).graph_query, is_query(
+            Root(
+                g.key("one", Root.fields.one()),
+                g.key("two", Root.fields.two()),
+            ),
+        ))
+        assert_that(document.to_query({"includeTwo": False}).graph_query, is_query(
+            Root(
+                g.key("one", Root.fields.one()),
+            ),
+        ))
+        assert_that(document.to_query({"includeTwo": True}).graph_query, is_query(
+            Root(
+                g.key("one", Root.fields.one()),
+                g.key("two", Root.fields.two()),
+            ),
+        ))
+
+    def test_variables_in_nested_input_values_are_bound(self):
+        Root = g.ObjectType(
+            "Root",
+            (
+                g.field("one", type=g.Int, params=[
+                    g.param("arg", type=g.ListType(g.Int)),
+                ]),
+            ),
+        )
+
+        graphql_query = """
+            query ($value: Int!) {
+                one(arg: [1, $value])
+            }
+        """
+
+        document = _read_document(graphql_query, query_type=Root)
+
+        assert_that(document.to_query({"value": 2}).graph_query.field_queries[0].args.arg, equal_to([1, 2]))
+        assert_that(document.to_query({"value": 3}).graph_query.field_queries[0].args.arg, equal_to([1, 3]))
+
+
 class TestDirectives(object):
     def test_when_include_directive_is_true_then_selection_is_included(self):
         Root = g.ObjectType(
@@ -1260,6 +1550,15 @@ class TestDirectives(object):
         pytest.raises(GraphQLError, lambda: _document_text_to_graph_query(graphql_query, query_type=Root))
 
 
+def _read_document(document_text, *, query_type, mutation_type=None, types=None):
+    schema = create_graphql_schema(query_type=query_type, mutation_type=mutation_type, types=types)
+    return read_document(document_text, graphql_schema=schema)
+
+
 def _document_text_to_graph_query(document_text, *, query_type, mutation_type=None, types=None, variables=None):
     schema = create_graphql_schema(query_type=query_type, mutation_type=mutation_type, types=types)
     return document_text_to_query(document_text, graphql_schema=schema, variables=variables).graph_query
+
+
+def is_float(value):
+    return all_of(is_instance(float), equal_to(value))
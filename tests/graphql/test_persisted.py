@@ -0,0 +1,94 @@
+import os
+
+from precisely import assert_that, contains_exactly, equal_to
+import pytest
+
+from graphlayer.graphql import persisted
+
+
+def test_document_hash_is_sha256_hex_digest_of_document_text():
+    assert_that(
+        persisted.document_hash("{ value }"),
+        equal_to("854174ebed716fe24fd6659c30290aecd9bc1d17dc4f47939a1848a1b8ed3c6b"),
+    )
+
+
+def test_in_memory_document_store_returns_documents_that_have_been_set():
+    store = persisted.InMemoryDocumentStore()
+
+    store.set("abc", "{ value }")
+
+    assert_that(store.get("abc"), equal_to("{ value }"))
+    assert_that(store.get("def"), equal_to(None))
+
+
+def test_in_memory_document_store_can_be_created_with_documents():
+    store = persisted.InMemoryDocumentStore({"abc": "{ value }"})
+
+    assert_that(store.items(), contains_exactly(("abc", "{ value }")))
+
+
+def test_in_memory_document_store_only_trusts_documents_explicitly_trusted():
+    store = persisted.InMemoryDocumentStore({"abc": "{ a }"}, trusted=True)
+
+    store.set("def", "{ b }")
+    store.set("ghi", "{ c }", trusted=True)
+    store.set("abc", "{ a }")
+
+    assert_that(store.trusted_items(), contains_exactly(("abc", "{ a }"), ("ghi", "{ c }")))
+
+
+def test_file_document_store_is_empty_when_directory_does_not_exist(tmp_path):
+    store = persisted.FileDocumentStore(str(tmp_path / "documents"))
+
+    assert_that(store.items(), contains_exactly())
+
+
+def test_file_document_store_persists_documents_across_instances(tmp_path):
+    path = str(tmp_path / "documents")
+    persisted.FileDocumentStore(path).set(_hash_a, "{ a }")
+    persisted.FileDocumentStore(path).set(_hash_b, "{ b }", trusted=True)
+
+    store = persisted.FileDocumentStore(path)
+
+    assert_that(store.get(_hash_a), equal_to("{ a }"))
+    assert_that(store.items(), contains_exactly((_hash_a, "{ a }"), (_hash_b, "{ b }")))
+    assert_that(store.trusted_items(), contains_exactly((_hash_b, "{ b }")))
+
+
+def test_file_document_store_keeps_documents_registered_by_other_instances(tmp_path):
+    path = str(tmp_path / "documents")
+    first_store = persisted.FileDocumentStore(path)
+    second_store = persisted.FileDocumentStore(path)
+
+    first_store.set(_hash_a, "{ a }")
+    second_store.set(_hash_b, "{ b }")
+
+    assert_that(persisted.FileDocumentStore(path).items(), contains_exactly(
+        (_hash_a, "{ a }"),
+        (_hash_b, "{ b }"),
+    ))
+
+
+def test_file_document_store_evicts_oldest_untrusted_documents(tmp_path):
+    path = str(tmp_path / "documents")
+    store = persisted.FileDocumentStore(path, max_untrusted_documents=1)
+
+    store.set(_hash_a, "{ a }", trusted=True)
+    store.set(_hash_b, "{ b }")
+    os.utime(os.path.join(path, _hash_b + ".json"), (0, 0))
+    store.set(_hash_c, "{ c }")
+
+    assert_that(store.items(), contains_exactly((_hash_a, "{ a }"), (_hash_c, "{ c }")))
+
+
+def test_file_document_store_ignores_invalid_hashes(tmp_path):
+    store = persisted.FileDocumentStore(str(tmp_path / "documents"))
+
+    assert_that(store.get("../documents"), equal_to(None))
+    pytest.raises(ValueError, lambda: store.set("../documents", "{ a }"))
+
+
+_hash_a = persisted.document_hash("{ a }")
+_hash_b = persisted.document_hash("{ b }")
+_hash_c = persisted.document_hash("{ c }")
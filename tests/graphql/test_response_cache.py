@@ -0,0 +1,186 @@
+import json
+
+from precisely import assert_that, contains_exactly, equal_to, has_attrs
+
+import graphlayer as g
+from graphlayer import cache_control, graphql
+from graphlayer.graphql.response_cache import FileResponseCache, InMemoryResponseCache
+
+
+def test_in_memory_response_cache_entries_expire_after_max_age():
+    clock = _FakeClock()
+    response_cache = InMemoryResponseCache(clock=clock)
+
+    response_cache.set("key", "value", max_age=10)
+    before_expiry = response_cache.get("key")
+    clock.now = 10
+    after_expiry = response_cache.get("key")
+
+    assert_that(before_expiry, equal_to("value"))
+    assert_that(after_expiry, equal_to(None))
+
+
+def test_file_response_cache_entries_are_shared_between_instances(tmp_path):
+    clock = _FakeClock()
+
+    FileResponseCache(str(tmp_path), clock=clock).set(["key"], {"value": 1}, max_age=10)
+    response_cache = FileResponseCache(str(tmp_path), clock=clock)
+    before_expiry = response_cache.get(["key"])
+    clock.now = 10
+    after_expiry = response_cache.get(["key"])
+
+    assert_that(before_expiry, equal_to({"value": 1}))
+    assert_that(after_expiry, equal_to(None))
+    assert_that(response_cache.get(["other"]), equal_to(None))
+
+
+def test_in_memory_response_cache_returns_copies_of_values():
+    response_cache = InMemoryResponseCache()
+    value = {"value": [1]}
+
+    response_cache.set("key", value, max_age=10)
+    value["value"].append(2)
+    response_cache.get("key")["value"].append(3)
+
+    assert_that(response_cache.get("key"), equal_to({"value": [1]}))
+
+
+def test_file_response_cache_stores_entries_as_json(tmp_path):
+    response_cache = FileResponseCache(str(tmp_path))
+
+    response_cache.set(["key"], {"value": 1}, max_age=10)
+
+    entry_path, = tmp_path.iterdir()
+    assert_that(json.loads(entry_path.read_text())["value"], equal_to({"value": 1}))
+
+
+def test_file_response_cache_keys_do_not_need_to_be_json(tmp_path):
+    response_cache = FileResponseCache(str(tmp_path))
+    key = ("document", "{}", _Scope("user-1"))
+
+    response_cache.set(key, {"value": 1}, max_age=10)
+
+    assert_that(response_cache.get(key), equal_to({"value": 1}))
+    assert_that(response_cache.get(("document", "{}", _Scope("user-2"))), equal_to(None))
+
+
+def test_file_response_cache_evicts_expired_entries(tmp_path):
+    clock = _FakeClock()
+    response_cache = FileResponseCache(str(tmp_path), clock=clock)
+
+    response_cache.set(["first"], 1, max_age=10)
+    clock.now = 10
+    response_cache.set(["second"], 2, max_age=10)
+
+    assert_that(len(list(tmp_path.iterdir())), equal_to(1))
+    assert_that(response_cache.get(["second"]), equal_to(2))
+
+
+def test_file_response_cache_evicts_entries_expiring_soonest_when_full(tmp_path):
+    response_cache = FileResponseCache(str(tmp_path), max_size=2, clock=_FakeClock())
+
+    response_cache.set(["first"], 1, max_age=30)
+    response_cache.set(["second"], 2, max_age=10)
+    response_cache.set(["third"], 3, max_age=20)
+
+    assert_that(response_cache.get(["first"]), equal_to(1))
+    assert_that(response_cache.get(["second"]), equal_to(None))
+    assert_that(response_cache.get(["third"]), equal_to(3))
+
+
+def test_private_responses_can_be_cached_in_files_with_any_cache_scope(tmp_path):
+    Root, graph, resolved = _create_graph()
+    execute = graphql.executor(query_type=Root, response_cache=FileResponseCache(str(tmp_path)))
+
+    first_result = execute("{ private }", graph=graph, cache_scope=_Scope("user-1"))
+    second_result = execute("{ private }", graph=graph, cache_scope=_Scope("user-1"))
+
+    assert_that(resolved, contains_exactly("private"))
+    assert_that(first_result.data, equal_to({"private": "private"}))
+    assert_that(second_result.data, equal_to({"private": "private"}))
+
+
+def test_cacheable_responses_are_served_without_resolving():
+    Root, graph, resolved = _create_graph()
+    execute = graphql.executor(query_type=Root, response_cache=InMemoryResponseCache())
+
+    first_result = execute("{ public }", graph=graph)
+    second_result = execute("{\n  public\n}", graph=graph)
+
+    assert_that(resolved, contains_exactly("public"))
+    assert_that(first_result.data, equal_to({"public": "public"}))
+    assert_that(second_result.data, equal_to({"public": "public"}))
+
+
+def test_responses_with_zero_max_age_are_not_cached():
+    Root, graph, resolved = _create_graph()
+    execute = graphql.executor(query_type=Root, response_cache=InMemoryResponseCache())
+
+    execute("{ public uncached }", graph=graph)
+    execute("{ public uncached }", graph=graph)
+
+    assert_that(resolved, contains_exactly("public", "uncached", "public", "uncached"))
+
+
+def test_private_responses_are_cached_per_cache_scope():
+    Root, graph, resolved = _create_graph()
+    execute = graphql.executor(query_type=Root, response_cache=InMemoryResponseCache())
+
+    execute("{ private }", graph=graph, cache_scope="user-1")
+    execute("{ private }", graph=graph, cache_scope="user-1")
+    execute("{ private }", graph=graph, cache_scope="user-2")
+    execute("{ private }", graph=graph)
+
+    assert_that(resolved, contains_exactly("private", "private", "private"))
+
+
+def test_cache_policy_can_be_exposed_in_extensions():
+    Root, graph, resolved = _create_graph()
+    execute = graphql.executor(query_type=Root, expose_cache_control=True)
+
+    result = execute("{ public private }", graph=graph)
+
+    assert_that(result, has_attrs(extensions=equal_to({
+        "cacheControl": {"maxAge": 60, "scope": "PRIVATE"},
+    })))
+
+
+class _Scope(object):
+    def __init__(self, user_id):
+        self.user_id = user_id
+
+    def __repr__(self):
+        return "_Scope({!r})".format(self.user_id)
+
+
+class _FakeClock(object):
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+def _create_graph():
+    resolved = []
+
+    Root = g.ObjectType("Root", fields=(
+        g.field("public", type=g.String, cache_max_age=300),
+        g.field("private", type=g.String, cache_max_age=60, cache_scope=cache_control.PRIVATE),
+        g.field("uncached", type=g.String),
+    ))
+
+    root_resolver = g.root_object_resolver(Root)
+
+    def create_field_resolver(field):
+        @root_resolver.field(field)
+        def resolve(graph, query, args):
+            resolved.append(field.name)
+            return field.name
+
+    for field in Root.fields:
+        create_field_resolver(field)
+
+    graph = g.define_graph(resolvers=(root_resolver, )).create_graph({})
+
+    return Root, graph, resolved
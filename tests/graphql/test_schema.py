@@ -2,6 +2,7 @@ import enum
 
 import graphql
 from precisely import all_of, anything, assert_that, contains_exactly, equal_to, has_attrs, is_instance, is_mapping
+import pytest
 
 import graphlayer as g
 from graphlayer.graphql.schema import create_graphql_schema
@@ -364,3 +365,79 @@ def is_graphql_argument(type=None):
         has_attrs(type=type),
     )
 
+
+def test_types_are_indexed_by_name_once_per_schema():
+    Item = g.InterfaceType("Item", fields=())
+    Book = g.ObjectType("Book", interfaces=(Item, ), fields=(
+        g.field("title", type=g.String),
+    ))
+    Root = g.ObjectType("Root", fields=(
+        g.field("items", type=g.ListType(Item)),
+    ))
+
+    graphql_schema = create_graphql_schema(query_type=Root, mutation_type=None, types=(Book, ))
+
+    assert_that(graphql_schema.all_types_by_name(), is_mapping({
+        "Book": Book,
+        "Item": Item,
+        "Root": Root,
+        "String": g.String,
+    }))
+    assert_that(graphql_schema.all_types_by_name() is graphql_schema.all_types_by_name(), equal_to(True))
+
+
+def test_graphql_schema_is_built_when_first_used():
+    graphql_schema = create_graphql_schema(query_type=object(), mutation_type=None)
+
+    pytest.raises(ValueError, lambda: graphql_schema.graphql_schema)
+
+
+def test_graphql_schema_can_be_loaded_from_snapshot():
+    class Season(enum.Enum):
+        winter = "WINTER"
+        summer = "SUMMER"
+
+    SeasonGraphType = g.EnumType(Season)
+    Root = g.ObjectType("Root", fields=(
+        g.field("season", type=SeasonGraphType, params=(
+            g.param("season", type=SeasonGraphType),
+        )),
+    ))
+    snapshot = create_graphql_schema(query_type=Root, mutation_type=None).to_snapshot()
+
+    graphql_schema = create_graphql_schema(query_type=Root, mutation_type=None, snapshot=snapshot)
+
+    assert_that(graphql_schema.introspection() is snapshot["introspection"], equal_to(True))
+    assert_that(graphql_schema.graphql_schema.query_type, is_graphql_object_type(
+        name="Root",
+        fields=is_mapping({
+            "season": is_graphql_field(
+                type=is_graphql_non_null(is_instance(graphql.GraphQLEnumType)),
+                args=is_mapping({
+                    "season": is_graphql_argument(type=is_graphql_non_null(is_instance(graphql.GraphQLEnumType))),
+                }),
+            ),
+        }),
+    ))
+
+
+def test_graphql_schema_snapshot_is_ignored_when_schema_has_changed():
+    OldRoot = g.ObjectType("Root", fields=(
+        g.field("value", type=g.String),
+    ))
+    Root = g.ObjectType("Root", fields=(
+        g.field("value", type=g.String),
+        g.field("count", type=g.Int),
+    ))
+    snapshot = create_graphql_schema(query_type=OldRoot, mutation_type=None).to_snapshot()
+
+    graphql_schema = create_graphql_schema(query_type=Root, mutation_type=None, snapshot=snapshot)
+
+    assert_that(graphql_schema.introspection() is snapshot["introspection"], equal_to(False))
+    assert_that(graphql_schema.graphql_schema.query_type, is_graphql_object_type(
+        name="Root",
+        fields=is_mapping({
+            "value": is_graphql_field(type=is_graphql_non_null(graphql.GraphQLString)),
+            "count": is_graphql_field(type=is_graphql_non_null(graphql.GraphQLInt)),
+        }),
+    ))
@@ -0,0 +1,148 @@
+import threading
+import time
+
+from precisely import assert_that, contains_exactly, equal_to, has_attrs
+
+import graphlayer as g
+from graphlayer import graphql
+from graphlayer.graphql.singleflight import single_flight
+
+
+def test_concurrent_identical_requests_share_one_execution():
+    Root, graph, resolved, release = _create_blocking_graph()
+    execute = single_flight(graphql.executor(query_type=Root))
+
+    results = _execute_concurrently(execute, graph=graph, release=release, requests=[
+        dict(document_text="query ($id: Int!) { value(id: $id) }", variables={"id": 1}, scope="tenant-1"),
+        dict(document_text="query ($id: Int!) {\n  value(id: $id)\n}", variables={"id": 1}, scope="tenant-1"),
+    ])
+
+    assert_that(resolved, contains_exactly(1))
+    assert_that(results, contains_exactly(
+        has_attrs(data=equal_to({"value": 1})),
+        has_attrs(data=equal_to({"value": 1})),
+    ))
+    assert_that(execute.stats(), has_attrs(executions=1, shared=1))
+
+
+def test_requests_with_different_scopes_are_executed_separately():
+    Root, graph, resolved, release = _create_blocking_graph()
+    execute = single_flight(graphql.executor(query_type=Root))
+    release.set()
+
+    execute("{ value(id: 1) }", graph=graph, scope="tenant-1")
+    execute("{ value(id: 1) }", graph=graph, scope="tenant-2")
+
+    assert_that(resolved, contains_exactly(1, 1))
+    assert_that(execute.stats(), has_attrs(executions=2, shared=0))
+
+
+def test_requests_with_different_variables_are_executed_separately():
+    Root, graph, resolved, release = _create_blocking_graph()
+    execute = single_flight(graphql.executor(query_type=Root))
+    release.set()
+
+    first_result = execute("query ($id: Int!) { value(id: $id) }", graph=graph, variables={"id": 1}, scope=None)
+    second_result = execute("query ($id: Int!) { value(id: $id) }", graph=graph, variables={"id": 2}, scope=None)
+
+    assert_that(first_result.data, equal_to({"value": 1}))
+    assert_that(second_result.data, equal_to({"value": 2}))
+
+
+def test_invalid_documents_are_executed_without_deduplication():
+    Root, graph, resolved, release = _create_blocking_graph()
+    execute = single_flight(graphql.executor(query_type=Root))
+
+    result = execute("{", graph=graph, scope=None)
+
+    assert_that(result, has_attrs(data=None, errors=contains_exactly(
+        has_attrs(message="Syntax Error: Expected Name, found <EOF>."),
+    )))
+    assert_that(execute.stats(), has_attrs(executions=0, shared=0))
+
+
+def test_concurrent_identical_mutations_are_each_executed():
+    Root, graph, resolved, release = _create_blocking_graph()
+    execute = single_flight(graphql.executor(query_type=Root, mutation_type=Root))
+
+    threads = [
+        threading.Thread(target=lambda: execute("mutation { value(id: 1) }", graph=graph, scope=None))
+        for _ in range(2)
+    ]
+    for thread in threads:
+        thread.start()
+    try:
+        _wait_until(lambda: release.waiting == 2)
+    finally:
+        release.set()
+        for thread in threads:
+            thread.join()
+
+    assert_that(resolved, contains_exactly(1, 1))
+    assert_that(execute.stats(), has_attrs(executions=0, shared=0))
+
+
+def _execute_concurrently(execute, *, graph, release, requests):
+    results = [None] * len(requests)
+
+    def start(index):
+        def run():
+            results[index] = execute(graph=graph, **requests[index])
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        return thread
+
+    threads = [start(0)]
+    _wait_until(lambda: execute.stats().executions == 1)
+
+    threads += [start(index) for index in range(1, len(requests))]
+    _wait_until(lambda: execute.stats().shared == len(requests) - 1)
+
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    return results
+
+
+def _wait_until(condition):
+    deadline = time.monotonic() + 5
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+class _Release(threading.Event):
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+        self.waiting = 0
+
+    def wait(self, timeout=None):
+        with self._lock:
+            self.waiting += 1
+        return super().wait(timeout)
+
+
+def _create_blocking_graph():
+    resolved = []
+    release = _Release()
+
+    Root = g.ObjectType("Root", fields=(
+        g.field("value", type=g.Int, params=(
+            g.param("id", type=g.Int),
+        )),
+    ))
+
+    root_resolver = g.root_object_resolver(Root)
+
+    @root_resolver.field(Root.fields.value)
+    def root_resolve_value(graph, query, args):
+        release.wait()
+        resolved.append(args.id)
+        return args.id
+
+    graph = g.define_graph(resolvers=(root_resolver, )).create_graph({})
+
+    return Root, graph, resolved, release
@@ -0,0 +1,179 @@
+import enum
+import io
+import json
+
+from precisely import assert_that, equal_to
+
+import graphlayer as g
+from graphlayer import graphql
+
+
+def test_streamed_response_contains_data_ordered_by_query():
+    Root, graph = _create_books_graph()
+    execute = graphql.executor(query_type=Root)
+
+    chunks = execute.stream("{ books { title id } count }", graph=graph)
+
+    assert_that(b"".join(chunks).decode("utf-8"), equal_to(
+        '{"data":{"books":[{"title":"Leave it to Psmith","id":1},{"title":"Pigs Have Wings","id":2}],"count":2}}',
+    ))
+
+
+def test_streamed_response_can_be_written_to_file():
+    Root, graph = _create_books_graph()
+    execute = graphql.executor(query_type=Root)
+    output = io.BytesIO()
+
+    execute.stream_to(output, "{ count }", graph=graph)
+
+    assert_that(json.loads(output.getvalue().decode("utf-8")), equal_to({"data": {"count": 2}}))
+
+
+def test_list_elements_are_streamed_as_they_are_produced():
+    produced = []
+
+    Book = g.ObjectType("Book", fields=(
+        g.field("id", type=g.Int),
+    ))
+    Root = g.ObjectType("Root", fields=(
+        g.field("books", type=g.ListType(Book)),
+    ))
+
+    root_resolver = g.root_object_resolver(Root)
+
+    @root_resolver.field(Root.fields.books)
+    def root_resolve_books(graph, query, args):
+        def generate_books():
+            for book_id in range(0, 100):
+                produced.append(book_id)
+                yield {"id": book_id}
+
+        return generate_books()
+
+    graph = g.define_graph(resolvers=(root_resolver, )).create_graph({})
+    execute = graphql.executor(query_type=Root)
+
+    chunks = execute.stream("{ books { id } }", graph=graph, chunk_size=64)
+    first_chunk = next(chunks)
+    produced_before_first_chunk = len(produced)
+    remaining_chunks = list(chunks)
+
+    assert_that(produced_before_first_chunk < 100, equal_to(True))
+    assert_that(json.loads(b"".join([first_chunk] + remaining_chunks).decode("utf-8")), equal_to({
+        "data": {"books": [{"id": book_id} for book_id in range(0, 100)]},
+    }))
+
+
+def test_when_lazy_list_raises_error_then_streamed_response_is_truncated_and_includes_error():
+    Book = g.ObjectType("Book", fields=(
+        g.field("id", type=g.Int),
+        g.field("tags", type=g.ListType(g.String)),
+    ))
+    Root = g.ObjectType("Root", fields=(
+        g.field("books", type=g.ListType(Book)),
+        g.field("count", type=g.Int),
+    ))
+
+    root_resolver = g.root_object_resolver(Root)
+
+    @root_resolver.field(Root.fields.books)
+    def root_resolve_books(graph, query, args):
+        def generate_tags():
+            yield "comedy"
+            raise g.GraphError("tags are unavailable")
+
+        return [{"id": 1, "tags": ["romance"]}, {"id": 2, "tags": generate_tags()}]
+
+    @root_resolver.field(Root.fields.count)
+    def root_resolve_count(graph, query, args):
+        return 2
+
+    graph = g.define_graph(resolvers=(root_resolver, )).create_graph({})
+    execute = graphql.executor(query_type=Root)
+
+    chunks = execute.stream("{ books { id tags } count }", graph=graph, chunk_size=1)
+
+    assert_that(json.loads(b"".join(chunks).decode("utf-8")), equal_to({
+        "data": {"books": [{"id": 1, "tags": ["romance"]}, {"id": 2, "tags": ["comedy"]}]},
+        "errors": [{"message": "tags are unavailable"}],
+    }))
+
+
+def test_enum_values_are_streamed_as_enum_values():
+    class Season(enum.Enum):
+        winter = "WINTER"
+        summer = "SUMMER"
+
+    Root = g.ObjectType("Root", fields=(
+        g.field("season", type=g.NullableType(g.EnumType(Season))),
+    ))
+
+    root_resolver = g.root_object_resolver(Root)
+
+    @root_resolver.field(Root.fields.season)
+    def root_resolve_season(graph, query, args):
+        return Season.winter
+
+    graph = g.define_graph(resolvers=(root_resolver, )).create_graph({})
+    execute = graphql.executor(query_type=Root)
+
+    chunks = execute.stream("{ season }", graph=graph)
+
+    assert_that(b"".join(chunks).decode("utf-8"), equal_to('{"data":{"season":"WINTER"}}'))
+
+
+def test_schema_query_is_included_in_streamed_response():
+    Root, graph = _create_books_graph()
+    execute = graphql.executor(query_type=Root)
+
+    chunks = execute.stream("{ count __schema { queryType { name } } }", graph=graph)
+
+    assert_that(json.loads(b"".join(chunks).decode("utf-8")), equal_to({
+        "data": {"count": 2, "__schema": {"queryType": {"name": "Root"}}},
+    }))
+
+
+def test_errors_are_streamed_when_query_is_invalid():
+    Root, graph = _create_books_graph()
+    execute = graphql.executor(query_type=Root)
+
+    chunks = execute.stream("{ bad }", graph=graph)
+
+    assert_that(json.loads(b"".join(chunks).decode("utf-8")), equal_to({
+        "errors": [
+            {"message": "Cannot query field 'bad' on type 'Root'.", "locations": [{"line": 1, "column": 3}]},
+        ],
+    }))
+
+
+def _create_books_graph():
+    Book = g.ObjectType("Book", fields=(
+        g.field("id", type=g.Int),
+        g.field("title", type=g.String),
+    ))
+    Root = g.ObjectType("Root", fields=(
+        g.field("books", type=g.ListType(Book)),
+        g.field("count", type=g.Int),
+    ))
+
+    books = [
+        {"id": 1, "title": "Leave it to Psmith"},
+        {"id": 2, "title": "Pigs Have Wings"},
+    ]
+
+    root_resolver = g.root_object_resolver(Root)
+
+    @root_resolver.field(Root.fields.books)
+    def root_resolve_books(graph, query, args):
+        return [
+            dict(reversed(list(book.items())))
+            for book in books
+        ]
+
+    @root_resolver.field(Root.fields.count)
+    def root_resolve_count(graph, query, args):
+        return len(books)
+
+    graph = g.define_graph(resolvers=(root_resolver, )).create_graph({})
+
+    return Root, graph
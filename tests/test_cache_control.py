@@ -0,0 +1,71 @@
+from precisely import assert_that, has_attrs
+
+import graphlayer as g
+from graphlayer import cache_control
+
+
+Author = g.ObjectType("Author", fields=lambda: (
+    g.field("name", type=g.String),
+    g.field("email", type=g.String, cache_scope=cache_control.PRIVATE),
+    g.field("books", type=g.ListType(Book)),
+))
+
+Book = g.ObjectType("Book", fields=lambda: (
+    g.field("title", type=g.String),
+    g.field("sales", type=g.Int, cache_max_age=30),
+))
+
+Root = g.ObjectType("Root", fields=lambda: (
+    g.field("author", type=Author, cache_max_age=300),
+    g.field("books", type=g.ListType(Book), cache_max_age=600),
+    g.field("count", type=g.Int),
+))
+
+
+def test_max_age_is_minimum_of_field_max_ages():
+    query = Root(
+        g.key("author", Root.fields.author(
+            g.key("name", Author.fields.name()),
+        )),
+        g.key("books", Root.fields.books(
+            g.key("sales", Book.fields.sales()),
+        )),
+    )
+
+    assert_that(cache_control.compute_policy(query), has_attrs(max_age=30, scope=cache_control.PUBLIC))
+
+
+def test_leaf_fields_without_hints_inherit_max_age_of_parent():
+    query = Root(
+        g.key("books", Root.fields.books(
+            g.key("title", Book.fields.title()),
+        )),
+    )
+
+    assert_that(cache_control.compute_policy(query), has_attrs(max_age=600))
+
+
+def test_root_and_composite_fields_without_hints_use_default_max_age():
+    root_query = Root(
+        g.key("count", Root.fields.count()),
+    )
+    nested_query = Root(
+        g.key("author", Root.fields.author(
+            g.key("books", Author.fields.books(
+                g.key("title", Book.fields.title()),
+            )),
+        )),
+    )
+
+    assert_that(cache_control.compute_policy(root_query, default_max_age=5), has_attrs(max_age=5))
+    assert_that(cache_control.compute_policy(nested_query, default_max_age=5), has_attrs(max_age=5))
+
+
+def test_scope_is_private_when_any_field_is_private():
+    query = Root(
+        g.key("author", Root.fields.author(
+            g.key("email", Author.fields.email()),
+        )),
+    )
+
+    assert_that(cache_control.compute_policy(query), has_attrs(max_age=300, scope=cache_control.PRIVATE))
@@ -0,0 +1,77 @@
+from precisely import assert_that, equal_to, has_attrs, is_instance
+import pytest
+
+from graphlayer import caches
+
+
+def test_when_key_is_missing_then_default_is_returned():
+    cache = caches.LruCache(max_size=2)
+
+    assert_that(cache.get("a"), equal_to(None))
+    assert_that(cache.get("a", 42), equal_to(42))
+
+
+def test_values_can_be_read_after_being_set():
+    cache = caches.LruCache(max_size=2)
+
+    cache.set("a", 1)
+
+    assert_that(cache.get("a"), equal_to(1))
+
+
+def test_hits_and_misses_are_counted():
+    cache = caches.LruCache(max_size=2)
+
+    cache.get("a")
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("a")
+
+    assert_that(cache.stats(), has_attrs(hits=2, misses=1, evictions=0, size=1, max_size=2))
+
+
+def test_lru_cache_evicts_least_recently_used_entry():
+    cache = caches.LruCache(max_size=2)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert_that(cache.get("a"), equal_to(1))
+    assert_that(cache.get("b"), equal_to(None))
+    assert_that(cache.get("c"), equal_to(3))
+    assert_that(cache.stats(), has_attrs(evictions=1, size=2))
+
+
+def test_fifo_cache_evicts_oldest_entry_regardless_of_reads():
+    cache = caches.FifoCache(max_size=2)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert_that(cache.get("a"), equal_to(None))
+    assert_that(cache.get("b"), equal_to(2))
+    assert_that(cache.get("c"), equal_to(3))
+
+
+def test_cache_with_max_size_of_zero_stores_nothing():
+    cache = caches.LruCache(max_size=0)
+
+    cache.set("a", 1)
+
+    assert_that(cache.get("a"), equal_to(None))
+    assert_that(cache.stats(), has_attrs(evictions=0, size=0))
+
+
+def test_create_cache_uses_eviction_policy():
+    assert_that(caches.create_cache(max_size=1, eviction="fifo"), is_instance(caches.FifoCache))
+    assert_that(caches.create_cache(max_size=1, eviction="lru"), is_instance(caches.LruCache))
+
+
+def test_when_eviction_policy_is_unknown_then_error_is_raised():
+    error = pytest.raises(ValueError, lambda: caches.create_cache(max_size=1, eviction="random"))
+
+    assert_that(str(error.value), equal_to("unknown eviction policy: 'random'"))
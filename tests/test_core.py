@@ -1,3 +1,5 @@
+import asyncio
+
 from precisely import assert_that, equal_to
 import pytest
 
@@ -51,3 +53,277 @@ def test_when_resolve_cannot_be_found_then_error_is_raised():
     error = pytest.raises(g.GraphError, lambda: graph.resolve(Query))
 
     assert_that(str(error.value), equal_to("could not find resolver for query of type: one"))
+
+
+def test_resolve_async_awaits_coroutine_resolvers():
+    @g.resolver("root")
+    async def resolve_root(graph, query):
+        return await graph.resolve_async(Query("leaf"))
+
+    @g.resolver("leaf")
+    async def resolve_leaf(graph, query):
+        return 42
+
+    class Query(object):
+        def __init__(self, type):
+            self.type = type
+
+    resolvers = [resolve_root, resolve_leaf]
+
+    result = asyncio.run(g.create_graph(resolvers).resolve_async(Query("root")))
+
+    assert_that(result, equal_to(42))
+
+
+def test_resolve_async_returns_result_of_synchronous_resolvers():
+    @g.resolver("one")
+    def resolve_one(graph, query):
+        return 1
+
+    class Query(object):
+        type = "one"
+
+    result = asyncio.run(g.create_graph([resolve_one]).resolve_async(Query))
+
+    assert_that(result, equal_to(1))
+
+
+def test_resolve_sync_raises_error_when_resolver_is_asynchronous():
+    @g.resolver("one")
+    async def resolve_one(graph, query):
+        return 1
+
+    class Query(object):
+        type = "one"
+
+    error = pytest.raises(g.GraphError, lambda: g.create_graph([resolve_one]).resolve_sync(Query))
+
+    assert_that(str(error.value), equal_to(
+        "resolver returned an awaitable: use asynchronous execution to resolve asynchronous resolvers",
+    ))
+
+
+def test_resolvers_are_passed_dependencies():
+    @g.resolver("one")
+    @g.dependencies(value="value", injector=g.Injector)
+    def resolve_one(graph, query, *, value, injector):
+        return value, isinstance(injector, g.Injector)
+
+    class Query(object):
+        type = "one"
+
+    result = g.define_graph([resolve_one]).create_graph({"value": 42}).resolve(Query)
+
+    assert_that(result, equal_to((42, True)))
+
+
+def test_functions_with_dependencies_attribute_are_passed_dependencies():
+    def func(*, value):
+        return value
+
+    func.dependencies = {"value": "value"}
+
+    result = g.Injector({"value": 42}).call_with_dependencies(func)
+
+    assert_that(result, equal_to(42))
+
+
+def test_providers_are_called_on_first_use_and_cached_for_lifetime_of_graph():
+    created = []
+
+    def create_value():
+        created.append(len(created))
+        return 42
+
+    @g.resolver("one")
+    @g.dependencies(value="value")
+    def resolve_one(graph, query, *, value):
+        return value
+
+    class Query(object):
+        type = "one"
+
+    graph = g.define_graph([resolve_one]).create_graph({"value": g.provider(create_value)})
+    created_before_resolve = list(created)
+    results = [graph.resolve(Query), graph.resolve(Query)]
+
+    assert_that(created_before_resolve, equal_to([]))
+    assert_that(results, equal_to([42, 42]))
+    assert_that(created, equal_to([0]))
+
+
+def test_providers_are_passed_dependencies():
+    @g.dependencies(base="base")
+    def create_value(*, base):
+        return base + 1
+
+    injector = g.Injector({"base": 41, "value": g.provider(create_value)})
+
+    assert_that(injector.get("value"), equal_to(42))
+
+
+def test_when_graph_is_closed_then_provided_values_are_closed_in_reverse_order():
+    closed = []
+
+    @g.dependencies(first="first")
+    def create_second(*, first):
+        return "second"
+
+    @g.resolver("one")
+    @g.dependencies(second="second")
+    def resolve_one(graph, query, *, second):
+        return second
+
+    class Query(object):
+        type = "one"
+
+    graph_definition = g.define_graph([resolve_one])
+    with graph_definition.create_graph({
+        "first": g.provider(lambda: "first", close=closed.append),
+        "second": g.provider(create_second, close=closed.append),
+        "unused": g.provider(lambda: "unused", close=closed.append),
+    }) as graph:
+        graph.resolve(Query)
+
+    assert_that(closed, equal_to(["second", "first"]))
+
+
+def test_when_graph_is_closed_then_providers_cannot_be_used():
+    @g.resolver("one")
+    @g.dependencies(value="value")
+    def resolve_one(graph, query, *, value):
+        return value
+
+    class Query(object):
+        type = "one"
+
+    graph = g.define_graph([resolve_one]).create_graph({"value": g.provider(lambda: 42)})
+    graph.close()
+
+    error = pytest.raises(g.GraphError, lambda: graph.resolve(Query))
+
+    assert_that(str(error.value), equal_to("cannot provide dependency 'value': injector is closed"))
+
+
+def test_dependencies_of_graph_definition_are_shared_between_graphs():
+    created = []
+
+    def create_shared():
+        created.append("shared")
+        return "shared"
+
+    @g.resolver("one")
+    @g.dependencies(shared="shared", request="request")
+    def resolve_one(graph, query, *, shared, request):
+        return shared, request
+
+    class Query(object):
+        type = "one"
+
+    graph_definition = g.define_graph([resolve_one], dependencies={"shared": g.provider(create_shared)})
+    results = [
+        graph_definition.create_graph({"request": 1}).resolve(Query),
+        graph_definition.create_graph({"request": 2}).resolve(Query),
+    ]
+
+    assert_that(results, equal_to([("shared", 1), ("shared", 2)]))
+    assert_that(created, equal_to(["shared"]))
+
+
+def test_dependencies_of_graph_shadow_dependencies_of_graph_definition():
+    @g.resolver("one")
+    @g.dependencies(value="value")
+    def resolve_one(graph, query, *, value):
+        return value
+
+    class Query(object):
+        type = "one"
+
+    graph_definition = g.define_graph([resolve_one], dependencies={"value": 1})
+    result = graph_definition.create_graph({"value": 2}).resolve(Query)
+
+    assert_that(result, equal_to(2))
+
+
+def test_when_graph_is_memoized_then_structurally_equal_queries_are_resolved_once():
+    resolved = []
+
+    @g.resolver("one")
+    def resolve_one(graph, query):
+        resolved.append(query.value)
+        return query.value
+
+    class Query(object):
+        type = "one"
+
+        def __init__(self, value):
+            self.value = value
+
+        def __eq__(self, other):
+            return self.value == other.value
+
+        def __hash__(self):
+            return hash(self.value)
+
+    graph = g.define_graph([resolve_one], memoize=True).create_graph({})
+    results = [graph.resolve(Query(1)), graph.resolve(Query(1)), graph.resolve(Query(2))]
+
+    assert_that(results, equal_to([1, 1, 2]))
+    assert_that(resolved, equal_to([1, 2]))
+    assert_that(graph.resolutions_saved, equal_to(1))
+
+
+def test_resolvers_can_opt_out_of_memoization():
+    resolved = []
+
+    @g.resolver("one", memoize=False)
+    def resolve_one(graph, query):
+        resolved.append(query)
+        return 1
+
+    class Query(object):
+        type = "one"
+
+    graph = g.define_graph([resolve_one], memoize=True).create_graph({})
+    graph.resolve(Query)
+    graph.resolve(Query)
+
+    assert_that(len(resolved), equal_to(2))
+    assert_that(graph.resolutions_saved, equal_to(0))
+
+
+def test_resolvers_can_opt_in_to_memoization():
+    resolved = []
+
+    @g.resolver("one", memoize=True)
+    def resolve_one(graph, query):
+        resolved.append(query)
+        return 1
+
+    class Query(object):
+        type = "one"
+
+    graph = g.define_graph([resolve_one]).create_graph({})
+    graph.resolve(Query)
+    graph.resolve(Query)
+
+    assert_that(len(resolved), equal_to(1))
+    assert_that(graph.resolutions_saved, equal_to(1))
+
+
+def test_memoized_resolutions_are_scoped_to_graph():
+    resolved = []
+
+    @g.resolver("one", memoize=True)
+    def resolve_one(graph, query):
+        resolved.append(query)
+        return 1
+
+    class Query(object):
+        type = "one"
+
+    graph_definition = g.define_graph([resolve_one])
+    graph_definition.create_graph({}).resolve(Query)
+    graph_definition.create_graph({}).resolve(Query)
+
+    assert_that(len(resolved), equal_to(2))
@@ -0,0 +1,99 @@
+from precisely import assert_that, equal_to, has_attrs
+import pytest
+
+import graphlayer as g
+from graphlayer import costs
+
+
+Author = g.ObjectType("Author", fields=lambda: (
+    g.field("name", type=g.String),
+    g.field("books", type=g.ListType(Book), cost_multiplier=10),
+))
+
+Book = g.ObjectType("Book", fields=lambda: (
+    g.field("title", type=g.String),
+    g.field("author", type=Author),
+    g.field("reviews", type=g.ListType(g.String)),
+    g.field("similar", type=g.ListType(Book), params=(
+        g.param("first", type=g.Int),
+    ), cost_multiplier=lambda args: args.first),
+))
+
+
+def test_cost_of_scalar_fields_is_number_of_fields():
+    query = Author(
+        g.key("name", Author.fields.name()),
+    )
+
+    assert_that(costs.analyze(query), has_attrs(depth=1, alias_count=0, cost=1))
+
+
+def test_cost_of_nested_fields_is_multiplied_by_field_multiplier():
+    query = Author(
+        g.key("books", Author.fields.books(
+            g.key("title", Book.fields.title()),
+            g.key("author", Book.fields.author(
+                g.key("name", Author.fields.name()),
+            )),
+        )),
+    )
+
+    assert_that(costs.analyze(query), has_attrs(depth=3, cost=1 + 10 * (1 + 1 + 1)))
+
+
+def test_cost_multiplier_can_be_computed_from_args():
+    query = Book(
+        g.key("similar", Book.fields.similar(
+            Book.fields.similar.params.first(5),
+            g.key("title", Book.fields.title()),
+        )),
+    )
+
+    assert_that(costs.analyze(query), has_attrs(cost=1 + 5 * 1))
+
+
+def test_default_list_multiplier_is_used_for_list_fields_without_multiplier():
+    query = Book(
+        g.key("reviews", Book.fields.reviews()),
+        g.key("author", Book.fields.author(
+            g.key("name", Author.fields.name()),
+        )),
+    )
+
+    assert_that(costs.analyze(query, default_list_multiplier=100), has_attrs(cost=1 + 1 + 1))
+
+
+def test_repeated_selections_of_same_field_are_counted_as_aliases():
+    query = Author(
+        g.key("name", Author.fields.name()),
+        g.key("name2", Author.fields.name()),
+        g.key("books", Author.fields.books(
+            g.key("a", Book.fields.title()),
+            g.key("b", Book.fields.title()),
+            g.key("c", Book.fields.title()),
+        )),
+    )
+
+    assert_that(costs.analyze(query), has_attrs(alias_count=3))
+
+
+def test_when_query_exceeds_limit_then_error_is_raised():
+    query = Author(
+        g.key("books", Author.fields.books(
+            g.key("title", Book.fields.title()),
+        )),
+    )
+    limits = costs.CostLimits(max_cost=10)
+
+    error = pytest.raises(g.GraphError, lambda: limits.check(query))
+
+    assert_that(str(error.value), equal_to("query cost of 11 exceeds limit of 10"))
+
+
+def test_when_query_is_within_limits_then_cost_is_returned():
+    query = Author(
+        g.key("name", Author.fields.name()),
+    )
+    limits = costs.CostLimits(max_depth=1, max_alias_count=0, max_cost=1)
+
+    assert_that(limits.check(query), has_attrs(depth=1, alias_count=0, cost=1))
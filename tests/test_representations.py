@@ -5,3 +5,11 @@ from precisely import assert_that, equal_to
 def test_empty_object_has_repr_with_values():
     obj = Object({"a": 1})
     assert_that(repr(obj), equal_to("Object({'a': 1})"))
+
+
+def test_objects_with_equal_nested_values_have_equal_hashes():
+    first = Object({"a": [1, {"b": 2, "c": 3}]})
+    second = Object({"a": [1, {"c": 3, "b": 2}]})
+
+    assert_that(first, equal_to(second))
+    assert_that(hash(first), equal_to(hash(second)))
@@ -0,0 +1,124 @@
+from precisely import assert_that, contains_exactly, equal_to, has_attrs
+
+import graphlayer as g
+from graphlayer import resolver_cache
+
+
+def test_results_are_cached_across_graphs():
+    Root, resolve_root, resolved = _create_root_resolver()
+    cache = resolver_cache.InMemoryResolverCache()
+    graph_definition = g.define_graph([resolver_cache.cached(cache, max_age=10)(resolve_root)])
+
+    results = [
+        graph_definition.create_graph({}).resolve(Root(g.key("value", Root.fields.value()))),
+        graph_definition.create_graph({}).resolve(Root(g.key("value", Root.fields.value()))),
+    ]
+
+    assert_that(results, contains_exactly(has_attrs(value=1), has_attrs(value=1)))
+    assert_that(resolved, equal_to([1]))
+    assert_that(cache.stats(), has_attrs(hits=1, misses=1))
+
+
+def test_results_are_cached_separately_for_each_scope():
+    Root, resolve_root, resolved = _create_root_resolver()
+    cache = resolver_cache.InMemoryResolverCache()
+
+    @g.dependencies(tenant="tenant")
+    def scope(*, tenant):
+        return tenant
+
+    graph_definition = g.define_graph([resolver_cache.cached(cache, max_age=10, scope=scope)(resolve_root)])
+    for tenant in ("a", "b", "a"):
+        graph_definition.create_graph({"tenant": tenant}).resolve(Root(g.key("value", Root.fields.value())))
+
+    assert_that(resolved, equal_to([1, 1]))
+
+
+def test_cached_results_expire_after_max_age():
+    Root, resolve_root, resolved = _create_root_resolver()
+    now = [0]
+    cache = resolver_cache.InMemoryResolverCache(clock=lambda: now[0])
+    graph = g.define_graph([resolver_cache.cached(cache, max_age=10)(resolve_root)]).create_graph({})
+
+    graph.resolve(Root(g.key("value", Root.fields.value())))
+    now[0] = 9
+    graph.resolve(Root(g.key("value", Root.fields.value())))
+    now[0] = 10
+    graph.resolve(Root(g.key("value", Root.fields.value())))
+
+    assert_that(resolved, equal_to([1, 1]))
+
+
+def test_in_memory_cache_evicts_least_recently_used_results():
+    Root, resolve_root, resolved = _create_root_resolver()
+    cache = resolver_cache.InMemoryResolverCache(max_size=1)
+    graph = g.define_graph([resolver_cache.cached(cache, max_age=10)(resolve_root)]).create_graph({})
+
+    for key in ("a", "b", "a"):
+        graph.resolve(Root(g.key(key, Root.fields.value())))
+
+    assert_that(resolved, equal_to([1, 1, 1]))
+    assert_that(cache.stats(), has_attrs(evictions=2, size=1))
+
+
+def test_when_table_is_invalidated_then_results_reading_table_are_resolved_again():
+    Root, resolve_root, resolved = _create_root_resolver(tables=("book", ))
+    cache = resolver_cache.InMemoryResolverCache()
+    graph = g.define_graph([resolver_cache.cached(cache, max_age=10)(resolve_root)]).create_graph({})
+
+    graph.resolve(Root(g.key("value", Root.fields.value())))
+    cache.invalidate(["author"])
+    graph.resolve(Root(g.key("value", Root.fields.value())))
+    cache.invalidate(["book"])
+    graph.resolve(Root(g.key("value", Root.fields.value())))
+
+    assert_that(resolved, equal_to([1, 1]))
+
+
+def test_sqlite_cache_is_shared_between_instances(tmp_path):
+    Root, resolve_root, resolved = _create_root_resolver(tables=("book", ))
+    path = str(tmp_path / "cache.sqlite")
+
+    def resolve(cache):
+        graph = g.define_graph([resolver_cache.cached(cache, max_age=10)(resolve_root)]).create_graph({})
+        return graph.resolve(Root(g.key("value", Root.fields.value())))
+
+    first_result = resolve(resolver_cache.SqliteResolverCache(path))
+    second_result = resolve(resolver_cache.SqliteResolverCache(path))
+    resolver_cache.SqliteResolverCache(path).invalidate(["book"])
+    third_result = resolve(resolver_cache.SqliteResolverCache(path))
+
+    assert_that([first_result, second_result, third_result], equal_to([g.Object({"value": 1})] * 3))
+    assert_that(resolved, equal_to([1, 1]))
+
+
+def test_sqlite_cache_evicts_least_recently_used_results(tmp_path):
+    now = [0]
+    cache = resolver_cache.SqliteResolverCache(str(tmp_path / "cache.sqlite"), max_size=2, clock=lambda: now[0])
+
+    for key in ("a", "b", "c"):
+        now[0] += 1
+        cache.set(key, [1, (2, 3), {4: "5"}], tables=frozenset(), max_age=10, epoch=cache.epoch())
+
+    assert_that(cache.get("a"), equal_to(None))
+    assert_that(cache.get("c"), equal_to((frozenset(), [1, (2, 3), {4: "5"}])))
+    assert_that(cache.stats(), has_attrs(evictions=1, size=2))
+
+
+def _create_root_resolver(tables=()):
+    resolved = []
+
+    Root = g.ObjectType("Root", fields=(
+        g.field("value", type=g.Int),
+    ))
+
+    @g.resolver(Root)
+    def resolve_root(graph, query):
+        resolved.append(1)
+        resolver_cache.record_tables(tables)
+        return query.create_object(dict(
+            (field_query.key, 1)
+            for field_query in query.field_queries
+        ))
+
+    return Root, resolve_root, resolved
@@ -1,3 +1,4 @@
+import asyncio
 import types
 
 from precisely import assert_that, equal_to, has_attrs
@@ -143,6 +144,57 @@ class TestObjectBuilder(object):
         assert_that(str(error.value), equal_to("Resolver missing for field type_name"))
 
 
+    def test_asynchronous_field_resolvers_are_resolved_concurrently(self):
+        User = g.ObjectType("User", fields=(
+            g.field("name", type=g.String),
+            g.field("email_address", type=g.String),
+        ))
+
+        object_builder = g.create_object_builder(User(
+            g.key("name", User.fields.name()),
+            g.key("email_address", User.fields.email_address()),
+        ))
+
+        async def build_user():
+            name_ready = asyncio.Event()
+
+            @object_builder.field(User.fields.name)
+            async def resolve_name(field_query):
+                name_ready.set()
+                return lambda user: user["name"]
+
+            @object_builder.field(User.fields.email_address)
+            async def resolve_email_address(field_query):
+                await name_ready.wait()
+                return lambda user: user["emailAddress"]
+
+            await asyncio.wait_for(object_builder.resolve_fields_async(), timeout=1)
+            return object_builder({"name": "Bob", "emailAddress": "bob@example.com"})
+
+        result = asyncio.run(build_user())
+        assert_that(result, has_attrs(
+            name="Bob",
+            email_address="bob@example.com",
+        ))
+
+    def test_when_asynchronous_field_resolvers_have_not_been_awaited_then_error_is_raised(self):
+        User = g.ObjectType("User", fields=(
+            g.field("name", type=g.String),
+        ))
+
+        object_builder = g.create_object_builder(User(
+            g.key("name", User.fields.name()),
+        ))
+
+        @object_builder.field(User.fields.name)
+        async def resolve_name(field_query):
+            return lambda user: user["name"]
+
+        error = pytest.raises(g.GraphError, lambda: object_builder({"name": "Bob"}))
+        assert_that(str(error.value), equal_to("asynchronous field resolvers must be awaited using resolve_fields_async"))
+        asyncio.run(object_builder.resolve_fields_async())
+
+
 class TestRootResolver(object):
     def test_root_object_resolver_can_resolve_fields_with_dependencies(self):
         Root = g.ObjectType("Root", fields=(
@@ -187,3 +239,44 @@ class TestRootResolver(object):
             g.key("value", Root.fields.value(Root.fields.value.params.answer(42))),
         )
         assert_that(graph.resolve(query), has_attrs(value=42))
+
+    def test_root_object_resolver_resolves_asynchronous_fields_concurrently(self):
+        Root = g.ObjectType("Root", fields=(
+            g.field("one", type=g.Int),
+            g.field("two", type=g.Int),
+            g.field("three", type=g.Int),
+        ))
+
+        resolve_root = g.root_object_resolver(Root)
+        one_ready = None
+
+        @resolve_root.field(Root.fields.one)
+        async def root_resolve_one(graph, query, args):
+            one_ready.set()
+            return 1
+
+        @resolve_root.field(Root.fields.two)
+        async def root_resolve_two(graph, query, args):
+            await one_ready.wait()
+            return 2
+
+        @resolve_root.field(Root.fields.three)
+        def root_resolve_three(graph, query, args):
+            return 3
+
+        graph_definition = g.define_graph(resolvers=(resolve_root, ))
+        graph = graph_definition.create_graph({})
+
+        query = Root(
+            g.key("one", Root.fields.one()),
+            g.key("two", Root.fields.two()),
+            g.key("three", Root.fields.three()),
+        )
+
+        async def resolve():
+            nonlocal one_ready
+            one_ready = asyncio.Event()
+            return await asyncio.wait_for(graph.resolve_async(query), timeout=1)
+
+        result = asyncio.run(resolve())
+        assert_that(result, has_attrs(one=1, two=2, three=3))
@@ -30,6 +30,36 @@ def test_fields_are_accessible_with_trailing_underscore():
     assert_that(fields.class_, equal_to(getattr(fields, "class")))
 
 
+def test_fields_can_be_indexed_by_transformed_name():
+    fields = schema.Fields("Book", (
+        schema.field("title", type=schema.String),
+        schema.field("author_name", type=schema.String),
+    ))
+
+    index = fields.index(str.upper)
+
+    assert_that(index, equal_to({
+        "TITLE": fields.title,
+        "AUTHOR_NAME": fields.author_name,
+    }))
+
+
+def test_field_index_is_built_once_per_key():
+    fields = schema.Fields("Book", (
+        schema.field("title", type=schema.String),
+    ))
+
+    assert_that(fields.index(str.upper) is fields.index(str.upper), equal_to(True))
+
+
+def test_params_can_be_indexed_by_transformed_name():
+    params = schema.Params("book", (
+        schema.param("title", type=schema.String),
+    ))
+
+    assert_that(params.index(str.upper), equal_to({"TITLE": params.title}))
+
+
 def test_when_field_does_not_exist_on_object_type_then_error_is_raised():
     book = schema.ObjectType("Book", fields=(
         schema.field("title", schema.String),
@@ -80,6 +110,31 @@ def test_when_passing_unknown_field_values_into_input_object_then_error_is_raise
     assert_that(str(error.value), equal_to("Input has no field field1"))
 
 
+def test_input_object_instances_have_slots_for_fields():
+    Input = schema.InputObjectType(
+        "Input",
+        fields=(
+            schema.input_field("field0", type=schema.Int),
+        ),
+    )
+
+    value = Input(field0=0)
+
+    assert_that(hasattr(value, "__dict__"), equal_to(False))
+    assert_that(value.field0, equal_to(0))
+
+
+def test_param_coerces_nested_values():
+    Season = enum.Enum("Season", [("WINTER", "WINTER"), ("SUMMER", "SUMMER")])
+    param = schema.param("seasons", type=schema.ListType(schema.NullableType(schema.EnumType(Season))))
+
+    argument = param([Season.WINTER, None])
+
+    assert_that(argument.value, equal_to([Season.WINTER, None]))
+    error = pytest.raises(GraphError, lambda: param(["WINTER"]))
+    assert_that(str(error.value), equal_to("cannot coerce 'WINTER' to Season"))
+
+
 def test_given_field_arg_has_default_when_field_arg_is_not_set_then_default_is_used():
     Root = schema.ObjectType(
         "Root",
@@ -408,6 +463,81 @@ class TestAdd(object):
         error = pytest.raises(TypeError, lambda: schema.NullableType(schema.Boolean)() + schema.NullableType(schema.Int)())
         assert_that(str(error.value), equal_to("cannot add queries for nullables with different element types: Boolean and Int"))
 
+
+class TestMergeAll(object):
+    def test_object_queries_are_merged_into_single_object_query(self):
+        Song = schema.ObjectType("Song", fields=(
+            schema.field("title", type=schema.String),
+            schema.field("length", type=schema.Int),
+        ))
+
+        query = schema.ObjectQuery.merge_all(
+            Song(schema.key(key, field()))
+            for key, field in (
+                ("title", Song.fields.title),
+                ("length", Song.fields.length),
+                ("title", Song.fields.title),
+                ("duration", Song.fields.length),
+            )
+        )
+
+        assert_that(query, is_query(Song(
+            schema.key("title", Song.fields.title()),
+            schema.key("length", Song.fields.length()),
+            schema.key("duration", Song.fields.length()),
+        )))
+
+    def test_fields_are_recursively_merged(self):
+        User = schema.ObjectType(
+            "User",
+            fields=lambda: (
+                schema.field("addresses", type=schema.ListType(Address)),
+            ),
+        )
+
+        Address = schema.ObjectType(
+            "Address",
+            fields=lambda: (
+                schema.field("first_line", type=schema.String),
+                schema.field("city", type=schema.String),
+                schema.field("postcode", type=schema.String),
+            ),
+        )
+
+        query = schema.merge_queries([
+            User(schema.key("addresses", User.fields.addresses(schema.key("first_line", Address.fields.first_line())))),
+            User(schema.key("addresses", User.fields.addresses(schema.key("city", Address.fields.city())))),
+            User(schema.key("addresses", User.fields.addresses(schema.key("postcode", Address.fields.postcode())))),
+        ])
+
+        assert_that(query, is_query(
+            User(
+                schema.key("addresses", User.fields.addresses(
+                    schema.key("first_line", Address.fields.first_line()),
+                    schema.key("city", Address.fields.city()),
+                    schema.key("postcode", Address.fields.postcode()),
+                )),
+            ),
+        ))
+
+    def test_merging_single_query_returns_query(self):
+        query = schema.ListType(schema.Int)()
+
+        assert_that(schema.merge_queries([query]) is query, equal_to(True))
+
+    def test_merging_query_with_itself_returns_query(self):
+        Song = schema.ObjectType("Song", fields=(
+            schema.field("title", type=schema.String),
+        ))
+        query = Song(schema.key("title", Song.fields.title()))
+
+        assert_that(schema.merge_queries([query, query]) is query, equal_to(True))
+
+    def test_merging_queries_of_different_kinds_raises_type_error(self):
+        error = pytest.raises(TypeError, lambda: schema.merge_queries([schema.Boolean(), schema.ListType(schema.Boolean)()]))
+        assert_that(str(error.value), equal_to("cannot merge ScalarQuery with ListQuery"))
+
+
 class TestForType(object):
     def test_scalar_query_for_type_is_scalar_query(self):
         query = schema.Boolean().for_type(schema.Boolean)
@@ -633,6 +763,87 @@ class TestFieldQuery(object):
         ))
 
 
+class TestStructuralEquality(object):
+    def test_queries_with_same_structure_are_equal(self):
+        Book = schema.ObjectType("Book", fields=(
+            schema.field("title", type=schema.String, params=(
+                schema.param("tags", type=schema.ListType(schema.String)),
+            )),
+        ))
+        Root = schema.ObjectType("Root", fields=(
+            schema.field("books", type=schema.ListType(Book)),
+        ))
+
+        def create_query():
+            return Root(
+                Root.fields.books(
+                    Book.fields.title(Book.fields.title.params.tags(["comedy"])),
+                ),
+            )
+
+        assert_that(create_query(), equal_to(create_query()))
+        assert_that(hash(create_query()), equal_to(hash(create_query())))
+        assert_that(create_query().fingerprint(), equal_to(create_query().fingerprint()))
+
+    def test_queries_with_different_args_are_not_equal(self):
+        Root = schema.ObjectType("Root", fields=(
+            schema.field("value", type=schema.Int, params=(
+                schema.param("id", type=schema.Int),
+            )),
+        ))
+
+        first = Root(Root.fields.value(Root.fields.value.params.id(1)))
+        second = Root(Root.fields.value(Root.fields.value.params.id(2)))
+
+        assert_that(first == second, equal_to(False))
+        assert_that(first.fingerprint() == second.fingerprint(), equal_to(False))
+
+    def test_queries_with_different_keys_are_not_equal(self):
+        Root = schema.ObjectType("Root", fields=(
+            schema.field("value", type=schema.Int),
+        ))
+
+        first = Root(schema.key("a", Root.fields.value()))
+        second = Root(schema.key("b", Root.fields.value()))
+
+        assert_that(first == second, equal_to(False))
+        assert_that(first.fingerprint() == second.fingerprint(), equal_to(False))
+
+    def test_input_object_args_are_hashable(self):
+        Filter = schema.InputObjectType("Filter", fields=(
+            schema.input_field("ids", type=schema.ListType(schema.Int)),
+        ))
+        Root = schema.ObjectType("Root", fields=(
+            schema.field("value", type=schema.Int, params=(
+                schema.param("filter", type=Filter),
+            )),
+        ))
+
+        def create_query(ids):
+            return Root(Root.fields.value(Root.fields.value.params.filter(Filter(ids=ids))))
+
+        assert_that(hash(create_query([1, 2])), equal_to(hash(create_query([1, 2]))))
+        assert_that(create_query([1, 2]), equal_to(create_query([1, 2])))
+        assert_that(create_query([1, 2]) == create_query([1, 3]), equal_to(False))
+
+    def test_interning_queries_shares_identical_subtrees(self):
+        Book = schema.ObjectType("Book", fields=(
+            schema.field("title", type=schema.String),
+        ))
+        Root = schema.ObjectType("Root", fields=(
+            schema.field("book", type=Book),
+        ))
+
+        def create_query(key):
+            return Root(schema.key(key, Root.fields.book(Book.fields.title())))
+
+        first = schema.intern_query(create_query("first"))
+        second = schema.intern_query(create_query("second"))
+
+        assert first.field_queries[0].type_query is second.field_queries[0].type_query
+        assert schema.intern_query(create_query("first")) is first
+
+
 class TestQueryString(object):
     def test_scalar_query_string_includes_type(self):
         query = schema.Int()
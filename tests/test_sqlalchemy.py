@@ -8,6 +8,7 @@ import pytest
 import graphlayer as g
 from graphlayer import schema, sqlalchemy as gsql
 import graphlayer.connections
+import graphlayer.resolver_cache
 from graphlayer.resolvers import root_object_resolver
 
 
@@ -2351,3 +2352,93 @@ def test_sql_query_type_str():
     ))
 
     assert_that(str(query.type), equal_to("(graphlayer.sqlalchemy.select, ObjectType(name='Book'))"))
+
+
+def test_cached_sql_resolvers_are_invalidated_when_tables_they_read_are_committed():
+    Base = sqlalchemy.ext.declarative.declarative_base()
+
+    class AuthorRow(Base):
+        __tablename__ = "author"
+
+        c_id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+        c_name = sqlalchemy.Column(sqlalchemy.Unicode, nullable=False)
+
+    class BookRow(Base):
+        __tablename__ = "book"
+
+        c_id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+        c_title = sqlalchemy.Column(sqlalchemy.Unicode, nullable=False)
+        c_author_id = sqlalchemy.Column(sqlalchemy.Integer, sqlalchemy.ForeignKey(AuthorRow.c_id))
+
+    class PublisherRow(Base):
+        __tablename__ = "publisher"
+
+        c_id = sqlalchemy.Column(sqlalchemy.Integer, primary_key=True)
+
+    engine = sqlalchemy.create_engine("sqlite:///:memory:")
+
+    Base.metadata.create_all(engine)
+
+    session = sqlalchemy.orm.Session(engine)
+    session.add(AuthorRow(c_id=1, c_name="PG Wodehouse"))
+    session.add(BookRow(c_title="Leave it to Psmith", c_author_id=1))
+    session.commit()
+
+    Author = g.ObjectType("Author", fields=lambda: [
+        g.field("name", type=g.String),
+    ])
+
+    Book = g.ObjectType("Book", fields=lambda: [
+        g.field("title", type=g.String),
+        g.field("author", type=Author),
+    ])
+
+    cache = graphlayer.resolver_cache.InMemoryResolverCache()
+    gsql.invalidate_resolver_cache(session, cache)
+
+    author_resolver = gsql.sql_table_resolver(
+        Author,
+        AuthorRow,
+        fields={
+            Author.fields.name: gsql.expression(AuthorRow.c_name),
+        },
+    )
+
+    book_resolver = gsql.sql_table_resolver(
+        Book,
+        BookRow,
+        fields={
+            Book.fields.title: gsql.expression(BookRow.c_title),
+            Book.fields.author: lambda graph, field_query: gsql.join(
+                key=BookRow.c_author_id,
+                resolve=lambda author_ids: graph.resolve(
+                    gsql.select(field_query.type_query).by(AuthorRow.c_id, author_ids),
+                ),
+            ),
+        },
+    )
+
+    graph_definition = g.define_graph([
+        graphlayer.resolver_cache.cached(cache, max_age=60)(book_resolver),
+        author_resolver,
+    ])
+
+    def resolve_books():
+        return graph_definition.create_graph({sqlalchemy.orm.Session: session}).resolve(gsql.select(g.ListType(Book)(
+            g.key("title", Book.fields.title()),
+            g.key("author", Book.fields.author(
+                g.key("name", Author.fields.name()),
+            )),
+        )))
+
+    resolve_books()
+    session.add(PublisherRow(c_id=1))
+    session.commit()
+    unchanged_result = resolve_books()
+    session.query(AuthorRow).one().c_name = "P. G. Wodehouse"
+    session.commit()
+    changed_result = resolve_books()
+
+    assert_that(unchanged_result, contains_exactly(has_attrs(author=has_attrs(name="PG Wodehouse"))))
+    assert_that(changed_result, contains_exactly(has_attrs(author=has_attrs(name="P. G. Wodehouse"))))
+    assert_that(cache.stats(), has_attrs(hits=1))